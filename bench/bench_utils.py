@@ -0,0 +1,64 @@
+"""Shared helpers of the *Ontic* benchmark scripts.
+
+The benchmark scripts are run from the project root directory, for example::
+
+    <project_root>$ python bench/pickle_bench.py
+
+"""
+import os
+import sys
+import timeit
+
+# Benchmark the working tree, rather than an installed ontic package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def best_time(func, number=1, repeat=5):
+    """The best time of repeated executions of a function.
+
+    :param func: The function to be timed, called without arguments.
+    :type func: callable
+    :param number: The number of calls per timing.
+    :type number: int
+    :param repeat: The number of timings.
+    :type repeat: int
+    :return: The best time of a single call in seconds.
+    :rtype: float
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def print_table(title, header, rows):
+    """Print the results of a benchmark as a table.
+
+    :param title: The title of the benchmark.
+    :type title: str
+    :param header: The column names.
+    :type header: list<str>
+    :param rows: The result rows, with a value per column.
+    :type rows: list<list>
+    """
+    cells = [list(header)] + [
+        [_format(value) for value in row] for row in rows]
+    widths = [max(len(row[column]) for row in cells)
+              for column in xrange(len(header))]
+    print(title)
+    print('=' * len(title))
+    for index, row in enumerate(cells):
+        print('  '.join(cell.rjust(width) if position else cell.ljust(width)
+                        for position, (cell, width)
+                        in enumerate(zip(row, widths))))
+        if not index:
+            print('  '.join('-' * width for width in widths))
+    print('')
+
+
+def _format(value):
+    if isinstance(value, float):
+        if value < 1e-3:
+            return '%.2f us' % (value * 1e6)
+        if value < 1:
+            return '%.2f ms' % (value * 1e3)
+        return '%.2f s' % value
+    return str(value)
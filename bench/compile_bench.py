@@ -0,0 +1,84 @@
+"""Benchmark loading types from a schema file, compiled or not.
+
+The types of a JSON schema file are made by
+:func:`ontic.ontic_type.create_ontic_type` from the loaded definitions, or
+imported from the module compiled by :mod:`ontic.compile`, with its byte
+code in place. Each load starts from an empty module cache.
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import bench_utils
+from ontic import compile as compile_module
+from ontic.ontic_type import create_ontic_type
+
+TYPE_COUNT = 1000
+PROPERTY_COUNT = 20
+MODULE_NAME = 'compile_bench_types'
+
+DEFINITIONS = (
+    {'type': 'str', 'required': True},
+    {'type': 'str'},
+    {'type': 'int', 'min': 0},
+    {'type': 'float'},
+    {'type': 'bool', 'default': False},
+    {'type': 'date'},
+    {'type': 'list', 'member_type': 'str'},
+    {'type': 'str', 'enum': ['open', 'closed']},
+)
+
+
+def make_definitions():
+    return dict(('Type%04d' % row, dict(
+        ('prop_%02d' % index,
+         DEFINITIONS[(row + index) % len(DEFINITIONS)])
+        for index in xrange(PROPERTY_COUNT)))
+        for row in xrange(TYPE_COUNT))
+
+
+def create_types(source_path):
+    definitions = compile_module.load_schema_file(source_path)
+    return [create_ontic_type(name, definition)
+            for name, definition in definitions.iteritems()]
+
+
+def import_types(source_path, output_dir):
+    sys.modules.pop(MODULE_NAME, None)
+    return compile_module.load_compiled_module(source_path, output_dir)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        source_path = os.path.join(directory, MODULE_NAME + '.json')
+        with open(source_path, 'w') as source_file:
+            json.dump(make_definitions(), source_file)
+        compile_time = bench_utils.best_time(
+            lambda: compile_module.compile_schema_file(
+                source_path, directory, force=True), repeat=1)
+        # The first import writes the byte code of the module.
+        import_types(source_path, directory)
+
+        results = [
+            ['create_ontic_type', bench_utils.best_time(
+                lambda: create_types(source_path), repeat=3)],
+            ['compiled import', bench_utils.best_time(
+                lambda: import_types(source_path, directory), repeat=3)],
+            ['compile (build step)', compile_time],
+        ]
+        for row in results:
+            row.append(row[1] / TYPE_COUNT)
+        bench_utils.print_table(
+            '%d types of %d properties from one schema file' % (
+                TYPE_COUNT, PROPERTY_COUNT),
+            ['load', 'time', 'per type'], results)
+    finally:
+        sys.modules.pop(MODULE_NAME, None)
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the copies of *Ontic* objects.
+
+The schema driven deep copy of :mod:`ontic.ontic_type` shares the immutable
+values of an object and copies its collections shallowly where their members
+are immutable. The generic deep copy of the object dict, made by earlier
+releases, and the clone of an object that shares its collections, are the
+baselines.
+"""
+from copy import copy, deepcopy
+from datetime import date
+
+import bench_utils
+from ontic.ontic_type import create_ontic_type
+
+OBJECT_COUNT = 1000
+
+
+def make_objects():
+    schema = {'tags': {'type': 'list', 'member_type': 'str'},
+              'counts': {'type': 'dict'},
+              'created': {'type': 'date'},
+              'history': {'type': 'list'}}
+    schema.update(('str_%d' % index, {'type': 'str'}) for index in xrange(10))
+    schema.update(('int_%d' % index, {'type': 'int'}) for index in xrange(5))
+    ontic_type = create_ontic_type('CopyBench', schema)
+
+    objects = []
+    for row in xrange(OBJECT_COUNT):
+        an_object = ontic_type(
+            tags=['tag_%d' % index for index in xrange(50)],
+            counts=dict(('key_%d' % index, index) for index in xrange(20)),
+            created=date(2020, 1, 1),
+            history=[['event', row], ['event', row + 1]])
+        an_object.update(('str_%d' % index, 'value_%d' % row)
+                         for index in xrange(10))
+        an_object.update(('int_%d' % index, row) for index in xrange(5))
+        objects.append(an_object)
+    return objects
+
+
+def main():
+    objects = make_objects()
+    modes = (
+        ('dict copy', lambda obj: type(obj)(copy(dict(obj)))),
+        ('copy', copy),
+        ('dict deepcopy', lambda obj: type(obj)(deepcopy(dict(obj)))),
+        ('deepcopy', deepcopy),
+        ('clone shallow', lambda obj: obj.clone(
+            shallow_fields=('tags', 'counts', 'history'))),
+    )
+    results = []
+    for label, copy_function in modes:
+        elapsed = bench_utils.best_time(
+            lambda: [copy_function(obj) for obj in objects])
+        results.append([label, elapsed, elapsed / OBJECT_COUNT])
+    bench_utils.print_table(
+        '%d objects of 19 properties' % OBJECT_COUNT,
+        ['copy', 'time', 'per object'], results)
+
+
+if __name__ == '__main__':
+    main()
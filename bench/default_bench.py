@@ -0,0 +1,77 @@
+"""Benchmark the allocations made by the collection defaults of objects.
+
+A batch of objects is perfected with a large list and dict default, that
+are deep copied per object, made by a default factory per object, or shared
+as a single frozen copy. The allocations are the container objects created
+by perfecting the batch, and their bytes, as tracked by the cyclic garbage
+collector. The bytes of the values of the containers are not counted.
+"""
+import gc
+import sys
+
+import bench_utils
+from ontic.ontic_type import create_ontic_type
+
+OBJECT_COUNT = 10000
+DEFAULT_SIZE = 500
+
+DEFAULT_LIST = ['tag_%d' % index for index in xrange(DEFAULT_SIZE)]
+DEFAULT_DICT = dict(('key_%d' % index, index)
+                    for index in xrange(DEFAULT_SIZE))
+
+
+def make_type(label, settings):
+    return create_ontic_type('DefaultBench%s' % label, {
+        'tags': dict({'type': 'list'}, **settings('list')),
+        'lookup': dict({'type': 'dict'}, **settings('dict')),
+    })
+
+
+SETTINGS = (
+    ('deep copy', lambda kind: {
+        'default': DEFAULT_LIST if kind == 'list' else DEFAULT_DICT}),
+    ('factory', lambda kind: {
+        'default_factory':
+            (lambda: list(DEFAULT_LIST)) if kind == 'list' else
+            (lambda: dict(DEFAULT_DICT))}),
+    ('shared', lambda kind: {
+        'default': DEFAULT_LIST if kind == 'list' else DEFAULT_DICT,
+        'shared_default': True}),
+)
+
+
+def perfect_batch(ontic_type):
+    objects = [ontic_type() for _ in xrange(OBJECT_COUNT)]
+    for an_object in objects:
+        an_object.perfect()
+    return objects
+
+
+def allocations(ontic_type):
+    gc.collect()
+    before = set(id(an_object) for an_object in gc.get_objects())
+    objects = perfect_batch(ontic_type)
+    created = [an_object for an_object in gc.get_objects()
+               if id(an_object) not in before and
+               an_object is not objects and
+               type(an_object) is not ontic_type]
+    return len(created), sum(sys.getsizeof(an_object)
+                             for an_object in created)
+
+
+def main():
+    results = []
+    for label, settings in SETTINGS:
+        ontic_type = make_type(label.replace(' ', ''), settings)
+        count, size = allocations(ontic_type)
+        results.append([
+            label, count, size,
+            bench_utils.best_time(lambda: perfect_batch(ontic_type),
+                                  repeat=3)])
+    bench_utils.print_table(
+        '%d objects, defaults of %d members' % (OBJECT_COUNT, DEFAULT_SIZE),
+        ['default', 'containers', 'bytes', 'perfect'], results)
+
+
+if __name__ == '__main__':
+    main()
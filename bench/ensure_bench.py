@@ -0,0 +1,96 @@
+"""Benchmark perfecting and validating a batch of records.
+
+Each record is made into an object, that is perfected and then validated
+with :meth:`ontic.ontic_type.OnticType.perfect` and
+:meth:`ontic.ontic_type.OnticType.validate`, perfected and validated in a
+single pass with :meth:`ontic.ontic_type.OnticType.ensure`, or the batch is
+perfected and validated at once with
+:meth:`ontic.ontic_type.OnticType.ensure_batch`. Half of the records leave
+properties with a default unset, and one in ten is invalid. The objects
+are made in each timing, and the time of making them alone is listed.
+"""
+import bench_utils
+from ontic.ontic_type import create_ontic_type, validate_many
+
+OBJECT_COUNT = 10000
+
+SCHEMA = {
+    'name': {'type': 'str', 'required': True, 'min': 1},
+    'age': {'type': 'int', 'min': 1, 'default': 1},
+    'score': {'type': 'float', 'max': 100.0},
+    'active': {'type': 'bool', 'default': True},
+    'kind': {'type': 'str', 'enum': {'staff', 'guest'}, 'default': 'guest'},
+    'tags': {'type': 'list', 'member_type': 'str', 'default': []},
+    'notes': {'type': 'dict', 'default_factory': dict},
+    'email': {'type': 'str', 'regex': '^[^@]+@[^@]+$'},
+}
+
+
+def make_records():
+    records = []
+    for index in xrange(OBJECT_COUNT):
+        record = {'name': 'name_%d' % index, 'score': index % 100 * 1.0,
+                  'email': 'user%d@example.com' % index}
+        if index % 2:
+            record.update(age=index % 90 + 1, active=False, kind='staff',
+                          tags=['a', 'b'], notes={'a': 1})
+        if index % 10 == 0:
+            record['age'] = 0
+        records.append(record)
+    return records
+
+
+def construct(ontic_type, records):
+    [ontic_type(record) for record in records]
+    return 0
+
+
+def in_sequence(ontic_type, records):
+    objects = [ontic_type(record) for record in records]
+    errors = 0
+    for an_object in objects:
+        an_object.perfect()
+        errors += bool(an_object.validate(raise_validation_exception=False))
+    return errors
+
+
+def in_sequence_batch(ontic_type, records):
+    objects = [ontic_type(record) for record in records]
+    for an_object in objects:
+        an_object.perfect()
+    return len(validate_many(ontic_type, objects))
+
+
+def fused(ontic_type, records):
+    objects = [ontic_type(record) for record in records]
+    errors = 0
+    for an_object in objects:
+        errors += bool(an_object.ensure(raise_validation_exception=False))
+    return errors
+
+
+def fused_batch(ontic_type, records):
+    objects = [ontic_type(record) for record in records]
+    return len(ontic_type.ensure_batch(objects))
+
+
+def main():
+    ontic_type = create_ontic_type('EnsureBench', SCHEMA)
+    records = make_records()
+    results = []
+    for label, function in (
+            ('construct only', construct),
+            ('perfect, validate', in_sequence),
+            ('perfect, validate_many', in_sequence_batch),
+            ('ensure', fused),
+            ('ensure_batch', fused_batch)):
+        results.append([
+            label, function(ontic_type, records), bench_utils.best_time(
+                lambda: function(ontic_type, records), repeat=3)])
+    bench_utils.print_table(
+        '%d objects of %d properties' % (OBJECT_COUNT, len(SCHEMA)),
+        ['method', 'invalid', 'time'], results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark the start up time of the *ontic* package.
+
+Each import statement is timed in a new interpreter, where an import hook
+records the self and cumulative time of each module loaded, much like
+``python -X importtime`` of Python 3.7 and later. The modules of the
+slowest statement are listed in the style of *importtime*.
+
+A catalog of schemas is then defined as types, and one of the types is
+used, with the property schemas made as the types are defined, or lazily
+on first use, see :class:`ontic.schema_type.LazySchemaType`.
+"""
+import imp
+import json
+import subprocess
+import sys
+import timeit
+
+import bench_utils
+
+STATEMENTS = (
+    'import ontic',
+    'from ontic.schema_type import SchemaType',
+    'from ontic.ontic_type import OnticType',
+    'from ontic.ontic_table import OnticTable',
+    'from ontic.compile import load_compiled_module',
+)
+
+TYPE_COUNT = 500
+PROPERTY_COUNT = 20
+
+DEFINITIONS = (
+    {'type': 'str', 'required': True},
+    {'type': 'int', 'min': 0},
+    {'type': 'float'},
+    {'type': 'bool', 'default': False},
+    {'type': 'date'},
+    {'type': 'list', 'member_type': 'str'},
+)
+
+
+class _TimingFinder(object):
+    """An import hook that times the loading of each module."""
+
+    def __init__(self):
+        self.records = []
+        self._child_times = []
+
+    def find_module(self, fullname, path=None):
+        try:
+            found = imp.find_module(fullname.rpartition('.')[2], path)
+        except ImportError:
+            return None
+        return _TimingLoader(self, found)
+
+
+class _TimingLoader(object):
+
+    def __init__(self, finder, found):
+        self.finder = finder
+        self.found = found
+
+    def load_module(self, fullname):
+        child_times = self.finder._child_times
+        child_times.append(0.0)
+        start = timeit.default_timer()
+        try:
+            return imp.load_module(fullname, *self.found)
+        finally:
+            elapsed = timeit.default_timer() - start
+            if self.found[0] is not None:
+                self.found[0].close()
+            children = child_times.pop()
+            if child_times:
+                child_times[-1] += elapsed
+            self.finder.records.append(
+                (fullname, elapsed - children, elapsed))
+
+
+def import_times(statement):
+    """Import in this interpreter, and print the times of the modules."""
+    finder = _TimingFinder()
+    sys.meta_path.insert(0, finder)
+    start = timeit.default_timer()
+    exec statement in {}
+    total = timeit.default_timer() - start
+    sys.meta_path.remove(finder)
+    print(json.dumps({'total': total, 'modules': finder.records}))
+
+
+def measure(statement, repeat=5):
+    results = []
+    for _ in xrange(repeat):
+        output = subprocess.check_output(
+            [sys.executable, __file__, '--child', statement])
+        results.append(json.loads(output))
+    return min(results, key=lambda result: result['total'])
+
+
+def define_catalog(lazy):
+    # Imported here, so that the interpreters of import_times start without
+    # any ontic module.
+    from ontic.ontic_type import create_ontic_type
+    types = [create_ontic_type('CatalogType', dict(
+        ('prop_%02d' % index, DEFINITIONS[(row + index) % len(DEFINITIONS)])
+        for index in xrange(PROPERTY_COUNT)), lazy=lazy)
+        for row in xrange(TYPE_COUNT)]
+    types[0](prop_00='a').validate(raise_validation_exception=False)
+
+
+def main():
+    results = [(statement, measure(statement)) for statement in STATEMENTS]
+    bench_utils.print_table(
+        'Import in a new interpreter, best of 5',
+        ['statement', 'time', 'ontic modules'],
+        [[statement, result['total'], len(
+            [name for name, _, _ in result['modules']
+             if name.startswith('ontic')])]
+         for statement, result in results])
+
+    statement, result = max(results, key=lambda item: item[1]['total'])
+    print('\nimport time: self [us] | cumulative | imported package')
+    print('(%s)' % statement)
+    for name, self_time, cumulative in result['modules']:
+        print('import time: %9d | %10d | %s' % (
+            self_time * 1e6, cumulative * 1e6, name))
+
+    print('')
+    bench_utils.print_table(
+        '%d types of %d properties defined, one type used' % (
+            TYPE_COUNT, PROPERTY_COUNT),
+        ['property schemas', 'time'],
+        [[label, bench_utils.best_time(
+            lambda: define_catalog(lazy), repeat=3)]
+         for label, lazy in (('eager', False), ('lazy', True))])
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        import_times(sys.argv[2])
+    else:
+        main()
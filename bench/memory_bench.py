@@ -0,0 +1,49 @@
+"""Benchmark the bytes per instance of *Ontic* objects.
+
+The instances of an :class:`ontic.ontic_type.OnticType` hold their
+properties in a dict, those of a compact type, made by
+:func:`ontic.ontic_type.create_ontic_type` with *compact* set to True, hold
+them in slots. The size of the instance itself is measured, with its dict
+table, but without the property values, which are shared by all of the
+representations. Plain dicts of the same content are the baseline.
+"""
+import sys
+
+import bench_utils
+from ontic.ontic_type import create_ontic_type
+
+PROPERTY_COUNTS = (1, 5, 10, 20, 50)
+INSTANCE_COUNT = 10000
+
+
+def make_schema(property_count):
+    return dict(('prop_%02d' % index, {'type': 'int'})
+                for index in xrange(property_count))
+
+
+def main():
+    results = []
+    for property_count in PROPERTY_COUNTS:
+        schema = make_schema(property_count)
+        values = [('prop_%02d' % index, index)
+                  for index in xrange(property_count)]
+        for label, factory in (
+                ('dict', dict),
+                ('OnticType', create_ontic_type('MemoryBench', schema)),
+                ('compact', create_ontic_type(
+                    'CompactMemoryBench', schema, compact=True))):
+            instance = factory(values)
+            construct = bench_utils.best_time(
+                lambda: [factory(values) for _ in xrange(INSTANCE_COUNT)],
+                repeat=3)
+            results.append([
+                label, property_count, sys.getsizeof(instance),
+                construct / INSTANCE_COUNT])
+    bench_utils.print_table(
+        'Bytes per instance',
+        ['representation', 'properties', 'bytes', 'construction'],
+        results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark perfecting a batch of objects.
+
+A batch of objects, each with about half of the properties set and an extra
+property, is perfected one object at a time with
+:meth:`ontic.ontic_type.OnticType.perfect`, or at once with
+:meth:`ontic.ontic_type.OnticType.perfect_many`. Validating the perfected
+batch with :func:`ontic.ontic_type.validate_many` is timed for comparison.
+The objects are made in each timing, and the time of making them alone is
+listed.
+"""
+import bench_utils
+from ontic.ontic_type import create_ontic_type, validate_many
+
+OBJECT_COUNT = 100000
+
+SCHEMA = {
+    'name': {'type': 'str', 'required': True},
+    'age': {'type': 'int', 'default': 1},
+    'score': {'type': 'float'},
+    'active': {'type': 'bool', 'default': True},
+    'kind': {'type': 'str', 'enum': {'staff', 'guest'}, 'default': 'guest'},
+    'tags': {'type': 'list', 'member_type': 'str', 'default': []},
+    'labels': {'type': 'set', 'default': {'new'}, 'shared_default': True},
+    'notes': {'type': 'dict', 'default_factory': dict},
+    'email': {'type': 'str'},
+    'city': {'type': 'str'},
+}
+
+
+def make_records():
+    records = []
+    for index in xrange(OBJECT_COUNT):
+        record = {'name': 'name_%d' % index, 'extra': index}
+        if index % 2:
+            record.update(age=index, active=False, tags=['a'],
+                          email='user%d@example.com' % index)
+        records.append(record)
+    return records
+
+
+def construct(ontic_type, records):
+    return [ontic_type(record) for record in records]
+
+
+def perfect_each(ontic_type, records):
+    objects = construct(ontic_type, records)
+    for an_object in objects:
+        an_object.perfect()
+    return objects
+
+
+def perfect_batch(ontic_type, records):
+    objects = construct(ontic_type, records)
+    ontic_type.perfect_many(objects)
+    return objects
+
+
+def main():
+    ontic_type = create_ontic_type('PerfectBench', SCHEMA)
+    records = make_records()
+    objects = perfect_batch(ontic_type, records)
+    results = []
+    for label, function in (
+            ('construct only', construct),
+            ('perfect', perfect_each),
+            ('perfect_many', perfect_batch)):
+        results.append([label, bench_utils.best_time(
+            lambda: function(ontic_type, records), repeat=3)])
+    results.append(['validate_many, no construct', bench_utils.best_time(
+        lambda: validate_many(ontic_type, objects), repeat=3)])
+    bench_utils.print_table(
+        '%d objects of %d properties' % (OBJECT_COUNT, len(SCHEMA)),
+        ['method', 'time'], results)
+
+
+if __name__ == '__main__':
+    main()
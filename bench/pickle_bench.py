@@ -0,0 +1,50 @@
+"""Benchmark the pickle size and round trip time of *Ontic* objects.
+
+Objects of a type made by :func:`ontic.ontic_type.create_ontic_type` are
+pickled as a type token, written once per pickle, and a tuple of property
+values. Plain dicts of the same content are the baseline.
+"""
+import cPickle
+import pickle
+
+import bench_utils
+from ontic.ontic_type import create_ontic_type
+
+PROPERTY_COUNT = 20
+BATCH_SIZES = (1, 100, 10000)
+
+
+def make_objects(count):
+    ontic_type = create_ontic_type('PickleBench', dict(
+        ('prop_%02d' % index, {'type': 'int'})
+        for index in xrange(PROPERTY_COUNT)))
+    return [ontic_type(('prop_%02d' % index, row * index)
+                       for index in xrange(PROPERTY_COUNT))
+            for row in xrange(count)]
+
+
+def main():
+    for pickler in (pickle, cPickle):
+        results = []
+        for count in BATCH_SIZES:
+            objects = make_objects(count)
+            dicts = [dict(an_object) for an_object in objects]
+            for label, batch in (('dict', dicts), ('OnticType', objects)):
+                data = pickler.dumps(batch, pickle.HIGHEST_PROTOCOL)
+                round_trip = bench_utils.best_time(
+                    lambda: pickler.loads(
+                        pickler.dumps(batch, pickle.HIGHEST_PROTOCOL)),
+                    repeat=3)
+                results.append([
+                    label, count, len(data), len(data) // count,
+                    round_trip, round_trip / count])
+        bench_utils.print_table(
+            '%s, %s properties per object' % (
+                pickler.__name__, PROPERTY_COUNT),
+            ['encoding', 'objects', 'bytes', 'bytes/object', 'round trip',
+             'per object'],
+            results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark types created per request from tenant schema definitions.
+
+Each request creates a type from one of a few tenant schema definitions with
+:func:`ontic.ontic_type.create_ontic_type`, and validates an object of it.
+The property schemas are made for each request, or interned.
+Without the *registered* option, each request makes a new class and
+compiles its validation plan. With it, the type of an earlier request is
+found in the :mod:`ontic.type_registry` with its compiled plan. The classes
+left alive after the requests are counted.
+"""
+import gc
+
+import bench_utils
+from ontic import type_registry
+from ontic.ontic_type import OnticType, create_ontic_type
+
+REQUEST_COUNT = 2000
+TENANT_COUNT = 20
+PROPERTY_COUNT = 20
+
+DEFINITIONS = (
+    {'type': 'str', 'required': True},
+    {'type': 'int', 'min': 0},
+    {'type': 'float'},
+    {'type': 'bool', 'default': False},
+    {'type': 'list', 'member_type': 'str'},
+)
+
+
+def make_schemas():
+    return [dict(('prop_%02d' % index,
+                  DEFINITIONS[(tenant + index) % len(DEFINITIONS)])
+                 for index in xrange(PROPERTY_COUNT))
+            for tenant in xrange(TENANT_COUNT)]
+
+
+def serve(schemas, types, **options):
+    for request in xrange(REQUEST_COUNT):
+        tenant_type = create_ontic_type(
+            'Tenant%d' % (request % TENANT_COUNT),
+            schemas[request % TENANT_COUNT], **options)
+        tenant_type(prop_00='a').is_valid()
+        types.append(tenant_type)
+
+
+def live_types():
+    gc.collect()
+    return sum(1 for an_object in gc.get_objects()
+               if isinstance(an_object, type) and
+               issubclass(an_object, OnticType))
+
+
+def main():
+    schemas = make_schemas()
+    results = []
+    for label, options in (
+            ('new type', {}),
+            ('registered', {'registered': True}),
+            ('new type, interned', {'interned': True}),
+            ('registered, interned', {'registered': True,
+                                      'interned': True})):
+        type_registry.clear_registry()
+        baseline = live_types()
+        # The services keep the types of their requests alive.
+        types = []
+        elapsed = bench_utils.best_time(
+            lambda: serve(schemas, types, **options), repeat=3)
+        results.append([label, elapsed, elapsed / REQUEST_COUNT,
+                        live_types() - baseline])
+        del types[:]
+    bench_utils.print_table(
+        '%d requests of %d tenant schemas of %d properties' % (
+            REQUEST_COUNT, TENANT_COUNT, PROPERTY_COUNT),
+        ['create_ontic_type', 'time', 'per request', 'types alive'],
+        results)
+
+
+if __name__ == '__main__':
+    main()
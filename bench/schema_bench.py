@@ -0,0 +1,57 @@
+"""Benchmark the creation of many types from repeated property definitions.
+
+Types are made by :func:`ontic.ontic_type.create_ontic_type` from schema
+definitions, whose properties repeat a few common property definitions.
+Each type is created and its validation plan compiled. The property
+schemas are validated against the meta-schema, trusted, or interned.
+"""
+import bench_utils
+from ontic.ontic_type import create_ontic_type
+from ontic.property_schema import clear_interned_property_schemas
+
+TYPE_COUNT = 1000
+PROPERTY_COUNT = 20
+
+DEFINITIONS = (
+    {'type': 'str', 'required': True},
+    {'type': 'str'},
+    {'type': 'int', 'min': 0},
+    {'type': 'float'},
+    {'type': 'bool', 'default': False},
+    {'type': 'date'},
+    {'type': 'list', 'member_type': 'str'},
+    {'type': 'str', 'enum': {'open', 'closed'}},
+)
+
+
+def make_schemas():
+    return [dict(('prop_%02d' % index,
+                  dict(DEFINITIONS[(row + index) % len(DEFINITIONS)]))
+                 for index in xrange(PROPERTY_COUNT))
+            for row in xrange(TYPE_COUNT)]
+
+
+def create_types(schemas, **options):
+    clear_interned_property_schemas()
+    for schema in schemas:
+        create_ontic_type('SchemaBench', schema,
+                          **options).get_validation_plan()
+
+
+def main():
+    schemas = make_schemas()
+    results = []
+    for label, options in (('validated', {}),
+                           ('trusted', {'trusted': True}),
+                           ('interned', {'interned': True})):
+        elapsed = bench_utils.best_time(
+            lambda: create_types(schemas, **options), repeat=3)
+        results.append([label, elapsed, elapsed / TYPE_COUNT])
+    bench_utils.print_table(
+        '%d types of %d properties, %d distinct definitions' % (
+            TYPE_COUNT, PROPERTY_COUNT, len(DEFINITIONS)),
+        ['property schemas', 'time', 'per type'], results)
+
+
+if __name__ == '__main__':
+    main()
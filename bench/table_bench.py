@@ -0,0 +1,57 @@
+"""Benchmark the storage size and validation time of an *OnticTable*.
+
+A batch of records is held as :class:`ontic.ontic_type.OnticType` objects,
+and as an :class:`ontic.ontic_table.OnticTable` with :mod:`array` columns
+and, when NumPy is installed, with NumPy columns. The bytes of the objects,
+or of the column storage, exclude the property values held by reference.
+"""
+import sys
+
+import bench_utils
+from ontic import ontic_table
+from ontic.ontic_table import OnticTable
+from ontic.ontic_type import create_ontic_type, validate_many
+
+RECORD_COUNT = 100000
+
+TABLE_SCHEMA = {
+    'count': {'type': 'int', 'min': 0},
+    'price': {'type': 'float', 'min': 0.0, 'max': 1000.0},
+    'active': {'type': 'bool', 'required': True},
+    'status': {'type': 'str', 'enum': {'new', 'open', 'closed'}},
+    'label': {'type': 'str', 'max': 20},
+}
+
+
+def make_objects(ontic_type):
+    statuses = ('new', 'open', 'closed')
+    return [ontic_type(count=index, price=index % 1000 + 0.5,
+                       active=bool(index & 1), status=statuses[index % 3],
+                       label='label')
+            for index in xrange(RECORD_COUNT)]
+
+
+def main():
+    ontic_type = create_ontic_type('TableBench', TABLE_SCHEMA)
+    objects = make_objects(ontic_type)
+    results = [[
+        'OnticType', sum(sys.getsizeof(an_object) for an_object in objects),
+        bench_utils.best_time(
+            lambda: validate_many(ontic_type, objects), repeat=3)]]
+
+    for use_numpy in (False, True):
+        if use_numpy and not ontic_table.NUMPY_AVAILABLE:
+            continue
+        table = OnticTable(ontic_type, objects, use_numpy=use_numpy)
+        results.append([
+            'OnticTable, %s' % ('numpy' if use_numpy else 'array'),
+            table.nbytes(),
+            bench_utils.best_time(table.validate, repeat=3)])
+
+    bench_utils.print_table(
+        '%s records' % RECORD_COUNT, ['storage', 'bytes', 'validate'],
+        results)
+
+
+if __name__ == '__main__':
+    main()
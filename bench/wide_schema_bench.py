@@ -0,0 +1,38 @@
+"""Benchmark the construction and validation of wide schemas.
+
+A :class:`ontic.schema_type.SchemaType` is built from the definitions of
+many properties, each of which is perfected and validated against the
+meta-schema of :class:`ontic.property_schema.PropertySchema`. The time per
+property should not grow with the number of properties.
+"""
+import bench_utils
+from ontic.schema_type import SchemaType, validate_schema
+
+PROPERTY_COUNTS = (100, 1000, 10000)
+
+
+def make_definition(count):
+    return dict(('prop_%05d' % index,
+                 {'type': 'str', 'required': True, 'min': 1, 'max': 40})
+                for index in xrange(count))
+
+
+def main():
+    results = []
+    for count in PROPERTY_COUNTS:
+        definition = make_definition(count)
+        build = bench_utils.best_time(lambda: SchemaType(definition),
+                                      repeat=3)
+        schema = SchemaType(definition)
+        validate = bench_utils.best_time(lambda: validate_schema(schema),
+                                         repeat=3)
+        results.append([count, build, build / count,
+                        validate, validate / count])
+    bench_utils.print_table(
+        'SchemaType construction and validate_schema',
+        ['properties', 'build', 'per property', 'validate', 'per property'],
+        results)
+
+
+if __name__ == '__main__':
+    main()
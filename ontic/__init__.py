@@ -1,12 +1,55 @@
-"""Package for creating objects and corresponding schema."""
-from ontic import (core_type, meta_type, ontic_type, property_schema,
-                   schema_type, validation_exception)
+"""Package for creating objects and corresponding schema.
+
+The submodules are imported on first access, so that importing the package
+only pays for the submodules that are used::
+
+    >>> import ontic
+    >>> ontic.schema_type.SchemaType
+    <class 'ontic.schema_type.SchemaType'>
+
+"""
+import sys
+from types import ModuleType
 
 __all__ = [
     'core_type',
+    'frozen',
+    'memo',
     'meta_type',
+    'ontic_table',
     'ontic_type',
+    'parallel',
     'property_schema',
     'schema_type',
-    'validation_exception'
+    'type_registry',
+    'validation_exception',
+    'validation_plan',
+    'vectorized'
 ]
+
+# : The submodules that are not exported by ``from ontic import *``, as
+# : *compile* would shadow the builtin of that name.
+_UNEXPORTED = ('compile', )
+
+
+class _LazyPackage(ModuleType):
+    """The *ontic* package, that imports its submodules on first access."""
+
+    def __getattr__(self, name):
+        # Only called when the submodule is not imported yet.
+        if name not in __all__ and name not in _UNEXPORTED:
+            raise AttributeError(
+                "'module' object has no attribute '%s'" % name)
+        __import__('%s.%s' % (self.__name__, name))
+        return ModuleType.__getattribute__(self, name)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__).union(__all__, _UNEXPORTED))
+
+
+_package = _LazyPackage(__name__, __doc__)
+_package.__dict__.update(sys.modules[__name__].__dict__)
+# The functions of this module keep its globals, that are cleared if the
+# replaced module is collected.
+_package._module = sys.modules[__name__]
+sys.modules[__name__] = _package
@@ -0,0 +1,408 @@
+"""Ahead-of-time compilation of schema files into Python modules.
+
+.. contents::
+
+======
+Usage
+======
+
+Making an :class:`ontic.ontic_type.OnticType` from a schema definition
+perfects and validates each of its property schemas. Where many types are
+loaded at process start, the *compile* module moves that work to a build
+step. A JSON schema file, that maps type names to schema definitions::
+
+    {
+        "Person": {
+            "name": {"type": "str", "required": true},
+            "age": {"type": "int", "min": 0}
+        }
+    }
+
+is compiled into a Python module of the same name, that defines the
+*OnticType* classes with their perfected property schema settings. The
+schema files of a directory are compiled with::
+
+    python -m ontic.compile schemas/ -o generated/
+
+In a JSON schema file, the *enum* settings are given as lists, and the
+types by name. Importing a compiled module makes the types and property
+schemas from their settings without any perfection or validation, with
+:func:`ontic.ontic_type.define_type`. It does not import this module, nor
+the JSON parser and byte code compiler that this module uses. The
+validation plans of the types are compiled on first use, as those of any
+other type, see :mod:`ontic.validation_plan`.
+
+Each compiled module carries the fingerprint of the schema file it was
+compiled from, and the schema fingerprint of each of its types, see
+:mod:`ontic.type_registry`. A compiled module whose schema file has changed
+since, or that was compiled by another version of this module, is stale.
+The *compile* command rebuilds stale modules only, and
+:func:`load_compiled_module` rebuilds a stale module before import, so that
+a stale module is never used::
+
+    >>> import os, shutil, tempfile
+    >>> directory = tempfile.mkdtemp()
+    >>> source_path = os.path.join(directory, 'people.json')
+    >>> with open(source_path, 'w') as source_file:
+    ...     source_file.write('{"Person": {"name": {"type": "str"}}}')
+    >>> people = load_compiled_module(source_path, directory)
+    >>> people.Person(name='Ann').validate()
+    []
+    >>> is_stale(source_path, directory)
+    False
+    >>> shutil.rmtree(directory)
+
+"""
+from ast import literal_eval
+from hashlib import sha1
+import imp
+import json
+from keyword import iskeyword
+from math import isinf, isnan
+import os
+import py_compile
+import re
+import sys
+
+from ontic.meta_type import TYPE_MAP
+from ontic.schema_type import SchemaType
+from ontic.type_registry import schema_fingerprint
+
+# : The version of the layout of compiled modules. Modules of another
+# : version are stale.
+FORMAT_VERSION = 2
+
+# : The file name extension of the schema files.
+SOURCE_EXTENSION = '.json'
+
+# : A valid name of a compiled module or type.
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# : The global names of a compiled module, that are not type names.
+_MODULE_NAMES = frozenset((
+    'FORMAT_VERSION', 'SCHEMA_FINGERPRINTS', 'SOURCE_FINGERPRINT',
+    'datetime', 'define_type'))
+
+# : The source of the type settings, by type.
+_TYPE_NAMES = dict((value, key) for key, value in TYPE_MAP.iteritems()
+                   if isinstance(key, str) and value is not None)
+_TYPE_NAMES.update({
+    TYPE_MAP['date']: 'datetime.date',
+    TYPE_MAP['datetime']: 'datetime.datetime',
+    TYPE_MAP['time']: 'datetime.time',
+})
+
+_MODULE_TEMPLATE = '''"""Ontic types compiled from %(source_name)s.
+
+Do not edit, the module is rebuilt by ontic.compile when it is stale.
+"""
+import datetime
+
+from ontic.ontic_type import define_type
+
+FORMAT_VERSION = %(format_version)r
+SOURCE_FINGERPRINT = %(source_fingerprint)r
+SCHEMA_FINGERPRINTS = %(schema_fingerprints)s
+'''
+
+_TYPE_TEMPLATE = '''
+%(name)s = define_type(__name__, %(name)r, {
+%(properties)s})
+'''
+
+
+def load_schema_file(source_path):
+    """Load the schema definitions of a JSON schema file.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :return: The schema definitions keyed by type name.
+    :rtype: dict<str, dict>
+    :raises ValueError: If the file is not a JSON object of schema
+        definitions, or a type name is not a valid identifier.
+    """
+    with open(source_path, 'rb') as source_file:
+        definitions = json.load(source_file, object_hook=_decode_object)
+    if not isinstance(definitions, dict):
+        raise ValueError('The schema file "%s" must hold a JSON object.' %
+                         source_path)
+    for name, definition in definitions.iteritems():
+        if not _is_identifier(name) or name in _MODULE_NAMES:
+            raise ValueError(
+                'The type name "%s" is not a valid identifier.' % name)
+        if not isinstance(definition, dict):
+            raise ValueError(
+                'The schema of "%s" must be a JSON object.' % name)
+        for property_schema in definition.itervalues():
+            if isinstance(property_schema, dict) and isinstance(
+                    property_schema.get('enum'), list):
+                property_schema['enum'] = set(property_schema['enum'])
+    return definitions
+
+
+def _is_identifier(name):
+    return bool(_IDENTIFIER.match(name)) and not iskeyword(name)
+
+
+def _decode_object(pairs):
+    return dict((_decode(key), _decode(value))
+                for key, value in pairs.iteritems())
+
+
+def _decode(value):
+    """Decode the JSON strings that are ASCII as str."""
+    if isinstance(value, unicode):
+        try:
+            return value.encode('ascii')
+        except UnicodeEncodeError:
+            return value
+    if isinstance(value, list):
+        return [_decode(member) for member in value]
+    return value
+
+
+def source_fingerprint(source_path):
+    """Compute the fingerprint of a schema file.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :return: The hex digest of the file content.
+    :rtype: str
+    """
+    with open(source_path, 'rb') as source_file:
+        return sha1(source_file.read()).hexdigest()
+
+
+def compiled_path(source_path, output_dir):
+    """The path of the module compiled from a schema file.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :param output_dir: The directory of the compiled modules.
+    :type output_dir: str
+    :return: The path of the compiled module.
+    :rtype: str
+    :raises ValueError: If the name of the schema file is not a valid
+        module name.
+    """
+    module_name = os.path.splitext(os.path.basename(source_path))[0]
+    if not _is_identifier(module_name):
+        raise ValueError(
+            'The schema file name "%s" is not a valid module name.' %
+            module_name)
+    return os.path.join(output_dir, module_name + '.py')
+
+
+def generate_module(source_path):
+    """Generate the source of the module compiled from a schema file.
+
+    Each schema definition is made into a :class:`SchemaType`, so that its
+    property schemas are perfected and validated, before their settings are
+    written.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :return: The source of the compiled module.
+    :rtype: str
+    :raises ValueError: If the schema file or a property schema declaration
+        is illegal, or a setting cannot be written as source.
+    :raises ValidationException: If a property schema does not meet the
+        meta-schema requirements.
+    """
+    definitions = load_schema_file(source_path)
+    schemas = [(name, SchemaType(definitions[name]))
+               for name in sorted(definitions)]
+    parts = [_MODULE_TEMPLATE % {
+        'source_name': os.path.basename(source_path),
+        'format_version': FORMAT_VERSION,
+        'source_fingerprint': source_fingerprint(source_path),
+        'schema_fingerprints': _source(dict(
+            (name, schema_fingerprint(schema)) for name, schema in schemas)),
+    }]
+    for name, schema in schemas:
+        parts.append(_TYPE_TEMPLATE % {
+            'name': name,
+            'properties': ''.join(
+                '    %r: %s,\n' % (property_name,
+                                   _source(dict(schema[property_name])))
+                for property_name in sorted(schema)),
+        })
+    return ''.join(parts)
+
+
+def _source(value):
+    """The Python source of a setting value."""
+    if isinstance(value, type):
+        if value not in _TYPE_NAMES:
+            raise ValueError('The type %s cannot be compiled.' % value)
+        return _TYPE_NAMES[value]
+    if isinstance(value, dict):
+        return '{%s}' % ', '.join(
+            '%s: %s' % (_source(key), _source(value[key]))
+            for key in sorted(value))
+    if isinstance(value, (set, frozenset)):
+        return '%s([%s])' % (type(value).__name__, ', '.join(
+            _source(member) for member in sorted(value)))
+    if isinstance(value, list):
+        return '[%s]' % ', '.join(_source(member) for member in value)
+    if isinstance(value, tuple):
+        return '(%s)' % ''.join(_source(member) + ', ' for member in value)
+    if isinstance(value, float) and (isinf(value) or isnan(value)):
+        # The repr of a non-finite float is not a Python expression.
+        return "float('%r')" % value
+    if isinstance(value, complex):
+        return 'complex(%s, %s)' % (_source(value.real), _source(value.imag))
+    if value is None or isinstance(value, (
+            bool, int, long, float, complex, basestring,
+            TYPE_MAP['date'], TYPE_MAP['time'])):
+        return repr(value)
+    raise ValueError('The value %r cannot be compiled.' % (value,))
+
+
+def is_stale(source_path, output_dir):
+    """Test whether the module compiled from a schema file is stale.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :param output_dir: The directory of the compiled modules.
+    :type output_dir: str
+    :return: True if the compiled module is missing, of another
+        :data:`FORMAT_VERSION`, or compiled from another version of the
+        schema file.
+    :rtype: bool
+    """
+    header = _read_header(compiled_path(source_path, output_dir))
+    return header != {
+        'FORMAT_VERSION': FORMAT_VERSION,
+        'SOURCE_FINGERPRINT': source_fingerprint(source_path),
+    }
+
+
+def _read_header(module_path):
+    """The format version and source fingerprint of a compiled module."""
+    header = {}
+    try:
+        with open(module_path, 'rb') as module_file:
+            for line in module_file:
+                name, _, value = line.partition(' = ')
+                if name in ('FORMAT_VERSION', 'SOURCE_FINGERPRINT'):
+                    header[name] = literal_eval(value.strip())
+                    if len(header) == 2:
+                        break
+    except (IOError, SyntaxError, ValueError):
+        return None
+    return header
+
+
+def compile_schema_file(source_path, output_dir, force=False):
+    """Compile a schema file into a module, if the module is stale.
+
+    The byte code of the module is written alongside it.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :param output_dir: The directory of the compiled modules. It is created
+        if missing.
+    :type output_dir: str
+    :param force: If True, the module is compiled even if it is not stale.
+    :type force: bool
+    :return: The path of the compiled module, and True if it was compiled.
+    :rtype: tuple<str, bool>
+    :raises ValueError: If the schema file cannot be compiled.
+    :raises ValidationException: If a property schema does not meet the
+        meta-schema requirements.
+    """
+    module_path = compiled_path(source_path, output_dir)
+    if not force and not is_stale(source_path, output_dir):
+        return module_path, False
+    module_source = generate_module(source_path)
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    # Written to a temporary file first, so that a failed write does not
+    # leave a module behind that is not stale.
+    temporary_path = module_path + '.tmp'
+    with open(temporary_path, 'wb') as module_file:
+        module_file.write(module_source)
+    os.rename(temporary_path, module_path)
+    # The byte code is written as part of the build, rather than on first
+    # import, where it may be disabled or the directory read-only.
+    py_compile.compile(module_path, doraise=True)
+    return module_path, True
+
+
+def load_compiled_module(source_path, output_dir):
+    """Import the module compiled from a schema file.
+
+    A stale module is compiled again before import, see :func:`is_stale`.
+    A module that is already imported, and is not stale, is returned as
+    is.
+
+    :param source_path: The path of the schema file.
+    :type source_path: str
+    :param output_dir: The directory of the compiled modules.
+    :type output_dir: str
+    :return: The compiled module.
+    :rtype: module
+    :raises ValueError: If the schema file cannot be compiled.
+    :raises ValidationException: If a property schema does not meet the
+        meta-schema requirements.
+    """
+    module_path, compiled = compile_schema_file(source_path, output_dir)
+    module_name = os.path.splitext(os.path.basename(module_path))[0]
+    module = sys.modules.get(module_name)
+    if not compiled and module is not None and getattr(
+            module, 'SOURCE_FINGERPRINT', None) == _read_header(
+                module_path)['SOURCE_FINGERPRINT']:
+        return module
+    module_file, path, description = imp.find_module(
+        module_name, [os.path.dirname(module_path) or '.'])
+    try:
+        return imp.load_module(module_name, module_file, path, description)
+    finally:
+        module_file.close()
+
+
+def _source_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for file_name in sorted(os.listdir(path)):
+                if file_name.endswith(SOURCE_EXTENSION):
+                    yield os.path.join(path, file_name)
+        else:
+            yield path
+
+
+def main(argv=None):
+    """Compile the schema files named on the command line.
+
+    :param argv: The command line arguments, *sys.argv[1:]* if None.
+    :type argv: list<str>, None
+    :return: The exit status.
+    :rtype: int
+    """
+    # Imported on use, so that the command line parser is not imported by
+    # the modules that load compiled modules.
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m ontic.compile',
+        description='Compile JSON schema files into Python modules.')
+    parser.add_argument('sources', nargs='+', metavar='SOURCE',
+                        help='a schema file, or a directory of *%s files' %
+                        SOURCE_EXTENSION)
+    parser.add_argument('-o', '--output', required=True, metavar='DIR',
+                        help='the directory of the compiled modules')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='compile the modules that are not stale')
+    arguments = parser.parse_args(argv)
+
+    for source_path in _source_paths(arguments.sources):
+        module_path, compiled = compile_schema_file(
+            source_path, arguments.output, arguments.force)
+        print('%s %s -> %s' % ('compiled' if compiled else 'up to date',
+                               source_path, module_path))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
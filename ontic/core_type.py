@@ -1,4 +1,4 @@
-from copy import copy, deepcopy
+from copy import deepcopy
 
 
 class CoreType(dict):
@@ -14,7 +14,15 @@ class CoreType(dict):
     >>> assert some_object['key2'] == 'value2'
     >>> some_object['key3'] = 'value3'
     >>> assert some_object.key3 == 'value3'
+
+    An attribute that is not found on the type is looked up as a dict key,
+    and an attribute assignment or deletion is applied to the dict keys,
+    unless the type declares a data descriptor of that name, such as a slot
+    or a property. A *CoreType* has no instance *__dict__*, and holds no
+    reference to itself, so that an unreferenced instance is freed by
+    reference counting, without waiting for the cyclic garbage collector.
     """
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         r"""**CoreType** initialized as a `dict` type.
@@ -41,16 +49,40 @@ class CoreType(dict):
         """
         super(CoreType, self).__init__(*args, **kwargs)
 
-        self.__dict__ = self
-
-    def __del__(self):
-        # The self reference is removed to promote fast garbage collection.
-        self.__dict__ = None
-        super(CoreType, self).__del__()
+    def __getattr__(self, name):
+        # Only called when the attribute is not found on the type.
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if _is_data_descriptor(type(self), name):
+            super(CoreType, self).__setattr__(name, value)
+        else:
+            self[name] = value
+
+    def __delattr__(self, name):
+        if _is_data_descriptor(type(self), name):
+            super(CoreType, self).__delattr__(name)
+        else:
+            try:
+                del self[name]
+            except KeyError:
+                raise AttributeError(name)
+
+    def __reduce__(self):
+        # The instance state is the dict content.
+        return type(self), (dict(self),)
 
     def __copy__(self):
-        return type(self)(copy(dict(self)))
+        return type(self)(self)
 
     def __deepcopy__(self, memo):
-        the_copy = dict(self.__dict__)
+        the_copy = dict(self)
         return type(self)(deepcopy(the_copy, memo))
+
+
+def _is_data_descriptor(a_type, name):
+    """True if *name* is a slot, property or other data descriptor."""
+    return hasattr(getattr(a_type, name, None), '__set__')
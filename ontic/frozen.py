@@ -0,0 +1,163 @@
+"""Read-only containers for default values that are shared by objects.
+
+.. contents::
+
+======
+Usage
+======
+
+The default value of a collection property is deep copied for each object
+that is perfected, so that no two objects share a collection. Where a large
+default is rarely changed, the copies are a waste of time and memory. A
+property schema with the *shared_default* setting assigns a single frozen
+copy of its default to each object instead, see
+:meth:`ontic.property_schema.PropertySchema.make_default`.
+
+The frozen containers are subclasses of *list*, *dict* and *set*, that pass
+the *type* validation of their base type, but raise a *TypeError* on any
+in place modification. Unlike their base types, they are hashable if their
+members are::
+
+    >>> tags = freeze(['red', 'blue'])
+    >>> isinstance(tags, list)
+    True
+    >>> tags.append('green')
+    Traceback (most recent call last):
+    ...
+    TypeError: A FrozenList is read-only, it must be replaced or thawed.
+
+A frozen value is replaced when the property is written. The
+:func:`thaw` function returns a modifiable deep copy, the copy that would
+otherwise have been made when the object was perfected::
+
+    >>> tags = thaw(tags)
+    >>> tags.append('green')
+    >>> tags
+    ['red', 'blue', 'green']
+
+"""
+from copy import deepcopy
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError('A %s is read-only, it must be replaced or thawed.' %
+                    type(self).__name__)
+
+
+class FrozenList(list):
+    """A list that cannot be modified in place."""
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = _read_only
+    __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return type(self)(deepcopy(list(self), memo))
+
+
+class FrozenDict(dict):
+    """A dict that cannot be modified in place."""
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self):
+        return hash(frozenset(self.iteritems()))
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return type(self)(deepcopy(dict(self), memo))
+
+
+class FrozenSet(set):
+    """A set that cannot be modified in place.
+
+    Unlike a :class:`frozenset`, a *FrozenSet* is an instance of *set*.
+    """
+    __slots__ = ()
+
+    add = clear = discard = pop = remove = update = _read_only
+    difference_update = intersection_update = _read_only
+    symmetric_difference_update = _read_only
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+
+    def __hash__(self):
+        return hash(frozenset(self))
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return type(self)(deepcopy(list(self), memo))
+
+
+# : The frozen container types.
+FROZEN_TYPES = (FrozenList, FrozenDict, FrozenSet)
+
+
+def freeze(value):
+    """Make a frozen deep copy of a value.
+
+    The lists, dicts and sets of *value*, at any depth, are converted to
+    their frozen counterparts, including those held by tuples. Other values
+    are deep copied.
+
+    :param value: The value to be frozen.
+    :type value: object
+    :return: The frozen copy of *value*.
+    :rtype: object
+    """
+    if isinstance(value, FROZEN_TYPES):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(
+            (freeze(key), freeze(item)) for key, item in value.iteritems())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, set):
+        return FrozenSet(freeze(item) for item in value)
+    if type(value) is tuple:
+        return tuple(freeze(item) for item in value)
+    return deepcopy(value)
+
+
+def thaw(value):
+    """Make a modifiable deep copy of a value.
+
+    The frozen containers of *value*, at any depth, are converted to plain
+    lists, dicts and sets, including those held by tuples.
+
+    :param value: The value to be thawed.
+    :type value: object
+    :return: The modifiable copy of *value*.
+    :rtype: object
+    """
+    if isinstance(value, dict):
+        return dict(
+            (thaw(key), thaw(item)) for key, item in value.iteritems())
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, set):
+        return set(thaw(item) for item in value)
+    if type(value) is tuple:
+        return tuple(thaw(item) for item in value)
+    return deepcopy(value)
@@ -0,0 +1,182 @@
+"""Size bounded memo caches for repeated validation work.
+
+.. contents::
+
+======
+Usage
+======
+
+The :class:`LRUCache` holds a bounded number of entries. When full, the
+least recently used entry is evicted to make room for a new entry. The
+cache counts its hits, misses and evictions, so that its capacity can be
+tuned to the cardinality of the cached keys::
+
+    >>> cache = LRUCache(2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3)
+    >>> 'b' in cache
+    False
+    >>> cache.get('b') is None
+    True
+    >>> cache.hits, cache.misses, cache.evictions
+    (1, 1, 1)
+
+"""
+
+# The fields of the links in the list of cache entries.
+_PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
+
+class LRUCache(object):
+    """A least recently used cache of bounded size.
+
+    :ivar capacity: The maximum number of entries.
+    :ivar hits: The number of lookups that found an entry.
+    :ivar misses: The number of lookups that found no entry.
+    :ivar evictions: The number of entries evicted to make room for new
+        entries.
+    """
+
+    def __init__(self, capacity):
+        """Create an empty cache.
+
+        :param capacity: The maximum number of entries.
+        :type capacity: int
+        :raises ValueError: If *capacity* is not a positive int.
+        """
+        if isinstance(capacity, bool) or not isinstance(
+                capacity, (int, long)) or capacity < 1:
+            raise ValueError('"capacity" must be a positive int.')
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._links = {}
+        # The entries are kept in a circular doubly linked list, from the
+        # least to the most recently used.
+        self._root = root = []
+        root[:] = [root, root, None, None]
+
+    def __len__(self):
+        return len(self._links)
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def get(self, key, default=None):
+        """Lookup an entry, and mark it as the most recently used.
+
+        :param key: The key of the entry.
+        :type key: hashable
+        :param default: The value returned if there is no entry for *key*.
+        :type default: object
+        :return: The value of the entry, or *default*.
+        :rtype: object
+        :raises TypeError: If *key* is not hashable.
+        """
+        link = self._links.get(key)
+        if link is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        root = self._root
+        if link[_NEXT] is not root:
+            link_prev, link_next = link[_PREV], link[_NEXT]
+            link_prev[_NEXT] = link_next
+            link_next[_PREV] = link_prev
+            last = root[_PREV]
+            last[_NEXT] = root[_PREV] = link
+            link[_PREV] = last
+            link[_NEXT] = root
+        return link[_VALUE]
+
+    def put(self, key, value):
+        """Add or replace an entry, evicting the least recently used entry
+        if the cache is full.
+
+        :param key: The key of the entry.
+        :type key: hashable
+        :param value: The value of the entry.
+        :type value: object
+        :rtype: None
+        :raises TypeError: If *key* is not hashable.
+        """
+        links = self._links
+        link = links.get(key)
+        if link is not None:
+            link[_VALUE] = value
+            return
+        root = self._root
+        if len(links) >= self.capacity:
+            oldest = root[_NEXT]
+            root[_NEXT] = oldest[_NEXT]
+            oldest[_NEXT][_PREV] = root
+            del links[oldest[_KEY]]
+            self.evictions += 1
+        last = root[_PREV]
+        link = [last, root, key, value]
+        last[_NEXT] = root[_PREV] = links[key] = link
+
+    def pop(self, key, default=None):
+        """Remove an entry.
+
+        :param key: The key of the entry.
+        :type key: hashable
+        :param default: The value returned if there is no entry for *key*.
+        :type default: object
+        :return: The value of the removed entry, or *default*.
+        :rtype: object
+        :raises TypeError: If *key* is not hashable.
+        """
+        link = self._links.pop(key, None)
+        if link is None:
+            return default
+        link_prev, link_next = link[_PREV], link[_NEXT]
+        link_prev[_NEXT] = link_next
+        link_next[_PREV] = link_prev
+        return link[_VALUE]
+
+    def clear(self):
+        """Remove all entries, and reset the counters.
+
+        :rtype: None
+        """
+        self._links.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """The counters and size of the cache.
+
+        :return: The *capacity*, *size*, *hits*, *misses* and *evictions* of
+            the cache.
+        :rtype: dict<str, int>
+        """
+        return {
+            'capacity': self.capacity,
+            'size': len(self._links),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+def check_capacity(capacity):
+    """Ensure that a given cache capacity is supported.
+
+    :param capacity: The capacity to be checked. None or 0 disable a cache.
+    :type capacity: int, None
+    :rtype: None
+    :raises ValueError: If *capacity* is not None or a non-negative int.
+    """
+    if capacity is None:
+        return
+    if isinstance(capacity, bool) or not isinstance(
+            capacity, (int, long)) or capacity < 0:
+        raise ValueError('"capacity" must be a non-negative int or None.')
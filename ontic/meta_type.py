@@ -71,6 +71,8 @@ class MetaType(CoreType):
 
             MetaType(one=1, two=2)
     """
+    __slots__ = ()
+
     # : The Ontic schema pointer.
     ONTIC_SCHEMA = None
 
@@ -289,12 +291,24 @@ def validate_member_regex(key, member_value, property_schema, value_errors):
     :type value_errors: list<str>
     :rtype: None
     """
-    if not re.match(property_schema.regex, member_value):
+    if not _match_regex(property_schema, member_value):
         value_errors.append(
             'Value "%s" for "%s" does not meet regex: %s' %
             (member_value, key, property_schema.regex))
 
 
+def _match_regex(property_schema, value):
+    """Match a value with the regex of a property schema.
+
+    The pattern compiled once by a
+    :class:`ontic.property_schema.PropertySchema` is used, if any.
+    """
+    pattern = getattr(property_schema, 'regex_pattern', None)
+    if pattern is None:
+        return re.match(property_schema.regex, value)
+    return pattern.match(value)
+
+
 def validate_member_min(key, member_value, property_schema, value_errors):
     """Validate a member of a collection for minimum allowable value.
 
@@ -446,7 +460,7 @@ def non_none_singular_validation(key, property_schema, value, value_errors):
     # regex validation
     if property_schema.regex:
         if property_schema.type in STRING_TYPES and value is not '':
-            if not re.match(property_schema.regex, value):
+            if not _match_regex(property_schema, value):
                 value_errors.append(
                     'Value "%s" for %s does not meet regex: %s' %
                     (value, key, property_schema.regex))
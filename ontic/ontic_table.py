@@ -0,0 +1,821 @@
+"""Columnar storage of large collections of *Ontic* objects.
+
+.. contents::
+
+======
+Usage
+======
+
+An :class:`OnticTable` holds many records of a single *Ontic* type as a
+column per schema property, rather than as a dict per record. Numeric
+columns are held in :mod:`array` arrays, or in NumPy arrays when
+`NumPy <http://www.numpy.org>`_ is installed. The columns of properties
+with an *enum* setting are dictionary encoded, as an array of codes into
+the list of the distinct values of the column. Other properties are held in
+a list of values. Each column has a validity bitmap that marks the rows
+whose value is not None.
+
+    >>> from ontic.ontic_type import create_ontic_type
+    >>> point_type = create_ontic_type('Point', {
+    ...     'x': {'type': 'float', 'required': True},
+    ...     'y': {'type': 'float', 'default': 0.5},
+    ...     'color': {'type': 'str', 'enum': {'red', 'blue'}},
+    ... })
+    >>> table = OnticTable.from_records(point_type, [
+    ...     {'x': 1.5, 'color': 'red'}, {'x': 2.5, 'y': 1.0}])
+    >>> len(table)
+    2
+    >>> table[0]['color']
+    'red'
+    >>> table[1].y
+    1.0
+
+The rows of a table are :class:`OnticRow` views of the columns, that
+support the dict style access of an *Ontic* object. Changes to a row are
+written to the columns. A row is converted to an instance of the type of
+the table with :meth:`OnticRow.to_object`.
+
+The records of a table are perfected and validated column by column::
+
+    >>> table.perfect()
+    >>> table.column('y')
+    [0.5, 1.0]
+    >>> table.append({'color': 'green'})
+    >>> sorted(table.validate().keys())
+    [2]
+
+The numeric columns, and the codes of the dictionary encoded columns, are
+exposed without copying with :meth:`OnticTable.buffer`, as an
+:class:`array.array` or a :class:`numpy.ndarray` view, both of which
+support the buffer protocol.
+
+A value whose type is not that of a numeric column, or that is not hashable
+for a dictionary encoded column, cannot be held by the column. The column
+is then converted to a list of values, so that any value can be stored and
+reported by validation, as with an *Ontic* object. The non-schema
+properties of the appended records are not stored.
+
+"""
+from array import array
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ontic.meta_type import COLLECTION_TYPES, TYPE_MAP
+from ontic.ontic_type import ONTIC_TYPES
+from ontic.validation_exception import ValidationException
+from ontic.validation_plan import check_validation_mode
+from ontic.vectorized import check_column
+
+# : True if NumPy is installed, and numeric columns may be NumPy arrays.
+NUMPY_AVAILABLE = numpy is not None
+
+# : The array typecodes of the numeric column types.
+ARRAY_TYPECODES = {bool: 'B', float: 'd', int: 'l'}
+
+# : The NumPy dtypes of the array typecodes.
+_NUMPY_DTYPES = {'B': '?', 'd': 'd', 'l': 'l'}
+
+# : The initial number of rows allocated for a NumPy column.
+_MIN_CAPACITY = 16
+
+
+class OnticTable(object):
+    """A columnar container of the records of an *Ontic* type.
+
+    :ivar ontic_type: The type of the records of the table.
+    :ivar names: The sorted schema property names, one column per name.
+    """
+
+    def __init__(self, ontic_type, records=None, use_numpy=None):
+        """Create a table for the records of an *Ontic* type.
+
+        :param ontic_type: The type of the records of the table.
+        :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+        :param records: The records initially appended to the table.
+        :type records: iterable<:class:`ontic.ontic_type.OnticType`>,
+            iterable<dict>, None
+        :param use_numpy: If None, the numeric columns are NumPy arrays when
+            NumPy is installed. If False, the numeric columns are
+            :class:`array.array` arrays. If True, NumPy is required.
+        :type use_numpy: bool, None
+        :raises ValueError: If *ontic_type* is not an *Ontic* type, or
+            *use_numpy* is True and NumPy is not installed.
+        """
+        if not isinstance(ontic_type, type) or not issubclass(
+                ontic_type, ONTIC_TYPES):
+            raise ValueError('"ontic_type" must be OnticType or child type '
+                             'of OnticType.')
+        if use_numpy is None:
+            use_numpy = NUMPY_AVAILABLE
+        elif use_numpy and not NUMPY_AVAILABLE:
+            raise ValueError('NumPy is required for NumPy columns.')
+
+        self.ontic_type = ontic_type
+        self.names = tuple(sorted(ontic_type.get_schema()))
+        self._use_numpy = bool(use_numpy)
+        self._count = 0
+        self._columns = dict(
+            (name, self._new_column(property_schema))
+            for name, property_schema in
+            ontic_type.get_schema().iteritems())
+        if records is not None:
+            self.extend(records)
+
+    @classmethod
+    def from_records(cls, ontic_type, records, use_numpy=None):
+        """Create a table holding a given batch of records.
+
+        :param ontic_type: The type of the records of the table.
+        :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+        :param records: The records of the table.
+        :type records: iterable<:class:`ontic.ontic_type.OnticType`>,
+            iterable<dict>
+        :param use_numpy: See :meth:`__init__`.
+        :type use_numpy: bool, None
+        :return: The new table.
+        :rtype: :class:`OnticTable`
+        """
+        return cls(ontic_type, records, use_numpy)
+
+    def _new_column(self, property_schema):
+        value_type = TYPE_MAP.get(property_schema.type, property_schema.type)
+        if property_schema.enum:
+            return _EnumColumn()
+        if value_type in ARRAY_TYPECODES:
+            if self._use_numpy:
+                return _NumpyColumn(value_type)
+            return _ArrayColumn(value_type)
+        return _ObjectColumn()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return OnticRow(self, self._row_index(index))
+
+    def __iter__(self):
+        for index in xrange(self._count):
+            yield OnticRow(self, index)
+
+    def __repr__(self):
+        return 'OnticTable(%s, %d rows)' % (
+            self.ontic_type.__name__, self._count)
+
+    def _row_index(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('table index out of range')
+        return index
+
+    def append(self, record):
+        """Append a record to the table.
+
+        :param record: The record to be appended.
+        :type record: :class:`ontic.ontic_type.OnticType`, dict
+        :rtype: None
+        """
+        self.extend((record,))
+
+    def extend(self, records):
+        """Append a batch of records to the table, column by column.
+
+        :param records: The records to be appended.
+        :type records: iterable<:class:`ontic.ontic_type.OnticType`>,
+            iterable<dict>
+        :rtype: None
+        """
+        if not isinstance(records, (list, tuple)):
+            records = list(records)
+        for name in self.names:
+            values = [record.get(name) for record in records]
+            column = self._columns[name]
+            if not column.accepts_all(values):
+                column = self._to_object_column(name)
+            column.extend(values)
+        self._count += len(records)
+
+    def get_value(self, index, name):
+        """The value of a property of a row.
+
+        :param index: The index of the row.
+        :type index: int
+        :param name: The name of the property.
+        :type name: str
+        :return: The value of the property, None if not set.
+        :rtype: object
+        :raises KeyError: If *name* is not a property of the schema.
+        """
+        return self._columns[name].get(self._row_index(index))
+
+    def set_value(self, index, name, value):
+        """Set the value of a property of a row.
+
+        :param index: The index of the row.
+        :type index: int
+        :param name: The name of the property.
+        :type name: str
+        :param value: The value of the property. None unsets the property.
+        :type value: object
+        :rtype: None
+        :raises ValueError: If *name* is not a property of the schema.
+        """
+        if name not in self._columns:
+            raise ValueError('"%s" is not a recognized property.' % name)
+        index = self._row_index(index)
+        column = self._columns[name]
+        if value is not None and not column.accepts(value):
+            column = self._to_object_column(name)
+        column.set(index, value)
+
+    def _to_object_column(self, name):
+        values = self.column(name)
+        column = self._columns[name] = _ObjectColumn()
+        column.extend(values)
+        return column
+
+    def column(self, name):
+        """The values of a property, one per row.
+
+        :param name: The name of the property.
+        :type name: str
+        :return: The values of the property, None for the rows where the
+            property is not set.
+        :rtype: list
+        :raises KeyError: If *name* is not a property of the schema.
+        """
+        return self._columns[name].to_list()
+
+    def buffer(self, name):
+        """The storage of a numeric or dictionary encoded column.
+
+        The storage is returned without copying. For a numeric column, it
+        holds a value per row. For a dictionary encoded column, it holds the
+        index of the value of each row in :meth:`dictionary`. The rows where
+        the property is not set hold 0, see :meth:`validity`. An
+        :class:`array.array` is reallocated as it grows, a buffer must not
+        be read across appends to the table.
+
+        :param name: The name of the property.
+        :type name: str
+        :return: The column storage, a :class:`numpy.ndarray` view for a
+            NumPy column, else an :class:`array.array`.
+        :rtype: numpy.ndarray, array.array
+        :raises ValueError: If the column is held as a list of values.
+        """
+        column = self._columns[name]
+        if isinstance(column, _ObjectColumn):
+            raise ValueError(
+                'The "%s" column is not numeric or dictionary encoded.' %
+                name)
+        return column.buffer()
+
+    def dictionary(self, name):
+        """The distinct values of a dictionary encoded column.
+
+        :param name: The name of the property.
+        :type name: str
+        :return: The values indexed by the codes of :meth:`buffer`.
+        :rtype: list
+        :raises ValueError: If the column is not dictionary encoded.
+        """
+        column = self._columns[name]
+        if not isinstance(column, _EnumColumn):
+            raise ValueError(
+                'The "%s" column is not dictionary encoded.' % name)
+        return column.dictionary
+
+    def validity(self, name):
+        """The validity bitmap of a column.
+
+        :param name: The name of the property.
+        :type name: str
+        :return: A bitmap with a bit set for each row where the property is
+            not None. The bit of row *i* is
+            ``bitmap[i >> 3] & (1 << (i & 7))``.
+        :rtype: bytearray
+        """
+        return self._columns[name].validity
+
+    def nbytes(self):
+        """The bytes of the column storage of the table.
+
+        The values held by reference in a list or a dictionary are not
+        counted, they are shared with the records the table is made from.
+
+        :return: The bytes of the arrays, lists and bitmaps of the columns.
+        :rtype: int
+        """
+        return sum(column.nbytes() for column in self._columns.itervalues())
+
+    def to_objects(self):
+        """Convert the rows of the table to *Ontic* objects.
+
+        :return: An instance of the type of the table per row.
+        :rtype: list<:class:`ontic.ontic_type.OnticType`>
+        """
+        return [row.to_object() for row in self]
+
+    def perfect(self):
+        """Set the default value of each property that is not set.
+
+        The default values are made as for
+        :func:`ontic.ontic_type.perfect_object`, see
+        :meth:`ontic.property_schema.PropertySchema.make_default`. A default
+        value that is shared by the objects is set in bulk, other default
+        values are made for each row.
+
+        :rtype: None
+        """
+        for name, property_schema in \
+                self.ontic_type.get_schema().iteritems():
+            if property_schema.default is None and \
+                    property_schema.default_factory is None:
+                continue
+            column = self._columns[name]
+            missing = column.missing_indexes(self._count)
+            if not missing:
+                continue
+            if property_schema.default_factory is None and (
+                    property_schema.shared_default or
+                    TYPE_MAP.get(property_schema.type) not in
+                    COLLECTION_TYPES):
+                defaults = [property_schema.make_default()]
+            else:
+                defaults = [property_schema.make_default()
+                            for _ in missing]
+            if not column.accepts_all(defaults):
+                column = self._to_object_column(name)
+            if len(defaults) == 1:
+                column.fill(missing, defaults[0])
+            else:
+                for index, value in zip(missing, defaults):
+                    column.set(index, value)
+
+    def validate(self, mode='full'):
+        """Validate the rows of the table column by column.
+
+        The values of a dictionary encoded column are validated once per
+        distinct value.
+
+        :param mode: In the default *full* mode, the validation errors of
+            each failing row are collected. In the *fast* mode, a failure
+            bitmap is returned without building any error records.
+        :type mode: str
+        :return: In *full* mode, a dict of the
+            :class:`~ontic.validation_exception.ValidationError` lists keyed
+            by the index of the failing rows. In *fast* mode, a bitmap of
+            the failing rows, see
+            :func:`ontic.validation_plan.bitmap_indexes`.
+        :rtype: dict<int, list<ValidationError>>, bytearray
+        :raises ValueError: If *mode* is not supported.
+        """
+        check_validation_mode(mode)
+        count = self._count
+        if mode == 'fast':
+            bitmap = bytearray((count + 7) >> 3)
+            for validator in self.ontic_type.get_validation_plan().validators:
+                for index, value in self._columns[
+                        validator.name].failures(validator):
+                    bitmap[index >> 3] |= 1 << (index & 7)
+            return bitmap
+
+        row_errors = {}
+        for validator in self.ontic_type.get_validation_plan().validators:
+            for index, value_errors in self._columns[
+                    validator.name].errors(validator):
+                if index in row_errors:
+                    row_errors[index].extend(value_errors)
+                else:
+                    row_errors[index] = list(value_errors)
+        return row_errors
+
+
+class OnticRow(object):
+    """A view of a row of an :class:`OnticTable`.
+
+    A row supports the dict style access, by key and by attribute, of an
+    *Ontic* object. A property is set if its value is not None. Reading a
+    row reads the columns of the table, writing a row writes the columns.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        """Create a view of a row of a table.
+
+        :param table: The table of the row.
+        :type table: :class:`OnticTable`
+        :param index: The index of the row.
+        :type index: int
+        """
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_index', index)
+
+    def get_schema(self):
+        """The schema of the type of the table."""
+        return self._table.ontic_type.get_schema()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._table.set_value(self._index, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._table.set_value(self._index, key, None)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        return self.iterkeys()
+
+    def __len__(self):
+        return sum(1 for _ in self.iterkeys())
+
+    def __eq__(self, other):
+        if isinstance(other, OnticRow):
+            other = dict(other.iteritems())
+        elif not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.iteritems()) == other
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'OnticRow(%r)' % dict(self.iteritems())
+
+    def get(self, key, default=None):
+        columns = self._table._columns
+        if key not in columns:
+            return default
+        value = columns[key].get(self._index)
+        return default if value is None else value
+
+    def iteritems(self):
+        columns = self._table._columns
+        for name in self._table.names:
+            value = columns[name].get(self._index)
+            if value is not None:
+                yield name, value
+
+    def iterkeys(self):
+        for name, value in self.iteritems():
+            yield name
+
+    def itervalues(self):
+        for name, value in self.iteritems():
+            yield value
+
+    def items(self):
+        return list(self.iteritems())
+
+    def keys(self):
+        return list(self.iterkeys())
+
+    def values(self):
+        return list(self.itervalues())
+
+    def to_object(self):
+        """Convert the row to an *Ontic* object.
+
+        :return: An instance of the type of the table, with the properties
+            that are set in the row.
+        :rtype: :class:`ontic.ontic_type.OnticType`
+        """
+        return self._table.ontic_type(self.iteritems())
+
+    def is_valid(self):
+        """Fail-fast test of the row against the schema requirements.
+
+        :return: True if the row is valid, else False.
+        :rtype: bool
+        """
+        return self._table.ontic_type.get_validation_plan().is_valid(self)
+
+    def validate(self, raise_validation_exception=True, records=False):
+        """Validate the row against the schema requirements.
+
+        :param raise_validation_exception: If True, a validation failure
+            raises a *ValidationException*, else the list of the error
+            messages is returned.
+        :type raise_validation_exception: bool
+        :param records: If True, the validation errors are returned as
+            :class:`~ontic.validation_exception.ValidationError` records,
+            whose messages are rendered on access. Else the messages of all
+            of the errors are rendered before they are returned.
+        :type records: bool
+        :return: The list of the validation error messages, or records.
+        :rtype: list<str>, list<ValidationError>
+        :raises ValidationException: If the row does not meet the schema
+            requirements, and *raise_validation_exception* is True.
+        """
+        value_errors = self._table.ontic_type.get_validation_plan().validate(
+            self)
+        if value_errors and raise_validation_exception:
+            raise ValidationException(value_errors)
+        if records:
+            return value_errors
+        return [str(error) for error in value_errors]
+
+
+class _Column(object):
+    """The base of the column storage classes.
+
+    Each column has a validity bitmap, with the bit of a row set when the
+    value of the row is not None.
+    """
+
+    def __init__(self):
+        self.validity = bytearray()
+
+    def _mark(self, index, present):
+        byte = index >> 3
+        if byte >= len(self.validity):
+            self.validity.extend(bytearray(byte + 1 - len(self.validity)))
+        if present:
+            self.validity[byte] |= 1 << (index & 7)
+        else:
+            self.validity[byte] &= ~(1 << (index & 7)) & 0xff
+
+    def _mark_all(self, start, values):
+        validity = self.validity
+        size = (start + len(values) + 7) >> 3
+        if size > len(validity):
+            validity.extend(bytearray(size - len(validity)))
+        for index, value in enumerate(values, start):
+            if value is not None:
+                validity[index >> 3] |= 1 << (index & 7)
+
+    def is_set(self, index):
+        return self.validity[index >> 3] & (1 << (index & 7))
+
+    def _apply_validity(self, values):
+        """Replace the values of the rows that are not set with None."""
+        validity = self.validity
+        full_bytes = len(values) >> 3
+        if not validity[:full_bytes].translate(None, b'\xff') and all(
+                self.is_set(index)
+                for index in xrange(full_bytes << 3, len(values))):
+            return values
+        return [value if validity[index >> 3] & (1 << (index & 7)) else None
+                for index, value in enumerate(values)]
+
+    def missing_indexes(self, count):
+        return [index for index in xrange(count) if not self.is_set(index)]
+
+    def accepts(self, value):
+        return True
+
+    def accepts_all(self, values):
+        accepts = self.accepts
+        return all(accepts(value) for value in values if value is not None)
+
+    def fill(self, indexes, value):
+        for index in indexes:
+            self.set(index, value)
+
+    def failures(self, validator):
+        is_valid = validator.is_valid
+        return [(index, value) for index, value in enumerate(self.to_list())
+                if not is_valid(value)]
+
+    def errors(self, validator):
+        validate = validator.validate
+        for index, value in self.failures(validator):
+            value_errors = []
+            validate(value, value_errors)
+            yield index, value_errors
+
+
+class _ObjectColumn(_Column):
+    """A column of any values, held in a list."""
+
+    def __init__(self):
+        super(_ObjectColumn, self).__init__()
+        self.values = []
+
+    def extend(self, values):
+        self._mark_all(len(self.values), values)
+        self.values.extend(values)
+
+    def get(self, index):
+        return self.values[index]
+
+    def set(self, index, value):
+        self.values[index] = value
+        self._mark(index, value is not None)
+
+    def to_list(self):
+        return list(self.values)
+
+    def nbytes(self):
+        return sys.getsizeof(self.values) + sys.getsizeof(self.validity)
+
+
+class _ArrayColumn(_Column):
+    """A column of numeric values, held in an :class:`array.array`."""
+
+    def __init__(self, value_type):
+        super(_ArrayColumn, self).__init__()
+        self.value_type = value_type
+        self.data = array(ARRAY_TYPECODES[value_type])
+
+    def accepts(self, value):
+        return type(value) is self.value_type
+
+    def extend(self, values):
+        self._mark_all(len(self.data), values)
+        self.data.extend(0 if value is None else value for value in values)
+
+    def get(self, index):
+        if not self.is_set(index):
+            return None
+        value = self.data[index]
+        if self.value_type is bool:
+            return bool(value)
+        return value
+
+    def set(self, index, value):
+        present = value is not None
+        self.data[index] = value if present else 0
+        self._mark(index, present)
+
+    def to_list(self):
+        values = self.data.tolist()
+        if self.value_type is bool:
+            values = map(bool, values)
+        return self._apply_validity(values)
+
+    def buffer(self):
+        return self.data
+
+    def nbytes(self):
+        return sys.getsizeof(self.data) + sys.getsizeof(self.validity)
+
+
+class _NumpyColumn(_ArrayColumn):
+    """A column of numeric values, held in a NumPy array.
+
+    The array is allocated with spare capacity, that doubles as the column
+    grows.
+    """
+
+    def __init__(self, value_type):
+        _Column.__init__(self)
+        self.value_type = value_type
+        self.count = 0
+        self.data = numpy.zeros(
+            _MIN_CAPACITY, dtype=_NUMPY_DTYPES[ARRAY_TYPECODES[value_type]])
+
+    def extend(self, values):
+        count = self.count
+        new_count = count + len(values)
+        if new_count > len(self.data):
+            data = numpy.zeros(
+                max(new_count, 2 * len(self.data)), dtype=self.data.dtype)
+            data[:count] = self.data[:count]
+            self.data = data
+        self._mark_all(count, values)
+        self.data[count:new_count] = [
+            0 if value is None else value for value in values]
+        self.count = new_count
+
+    def get(self, index):
+        if not self.is_set(index):
+            return None
+        return self.data[index].item()
+
+    def to_list(self):
+        return self._apply_validity(self.data[:self.count].tolist())
+
+    def buffer(self):
+        return self.data[:self.count]
+
+    def failures(self, validator):
+        values = self.to_list()
+        mask, failed_rows = check_column(
+            validator.property_schema, values, use_numpy=True)
+        return [(index, values[index]) for index in failed_rows]
+
+    def nbytes(self):
+        return self.data.nbytes + sys.getsizeof(self.validity)
+
+
+class _EnumColumn(_Column):
+    """A dictionary encoded column of hashable values.
+
+    The column holds the distinct values in a dictionary list, and the index
+    of the value of each row in an :class:`array.array` of codes. Values of
+    different types that are equal, such as 1 and True, are held as
+    distinct values.
+    """
+
+    def __init__(self):
+        super(_EnumColumn, self).__init__()
+        self.dictionary = []
+        self.codes = array('l')
+        self._code_map = {}
+
+    def accepts(self, value):
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    def _encode(self, value):
+        if value is None:
+            return 0
+        key = (type(value), value)
+        code = self._code_map.get(key)
+        if code is None:
+            code = self._code_map[key] = len(self.dictionary)
+            self.dictionary.append(value)
+        return code
+
+    def extend(self, values):
+        self._mark_all(len(self.codes), values)
+        self.codes.extend(self._encode(value) for value in values)
+
+    def get(self, index):
+        if not self.is_set(index):
+            return None
+        return self.dictionary[self.codes[index]]
+
+    def set(self, index, value):
+        self.codes[index] = self._encode(value)
+        self._mark(index, value is not None)
+
+    def fill(self, indexes, value):
+        code = self._encode(value)
+        for index in indexes:
+            self.codes[index] = code
+            self._mark(index, True)
+
+    def to_list(self):
+        dictionary = self.dictionary
+        return self._apply_validity([dictionary[code] for code in self.codes])
+
+    def failures(self, validator):
+        is_valid = validator.is_valid
+        failing_codes = set(code for code, value in
+                            enumerate(self.dictionary) if not is_valid(value))
+        none_fails = not is_valid(None)
+        if not failing_codes and not none_fails:
+            return []
+        dictionary = self.dictionary
+        return [(index, dictionary[code] if self.is_set(index) else None)
+                for index, code in enumerate(self.codes)
+                if (code in failing_codes if self.is_set(index)
+                    else none_fails)]
+
+    def errors(self, validator):
+        # The error records of a distinct value are built once, and are
+        # shared by the rows holding the value.
+        cache = {}
+        validate = validator.validate
+        for index, value in self.failures(validator):
+            key = None if value is None else (type(value), value)
+            value_errors = cache.get(key)
+            if value_errors is None:
+                value_errors = cache[key] = []
+                validate(value, value_errors)
+            yield index, value_errors
+
+    def buffer(self):
+        return self.codes
+
+    def nbytes(self):
+        return (sys.getsizeof(self.codes) + sys.getsizeof(self.dictionary) +
+                sys.getsizeof(self.validity))
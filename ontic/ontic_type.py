@@ -49,12 +49,66 @@ with the use of the :meth:`create_ontic_type` function.
     >>> my_object.prop
     3
 
+Compact Ontic Types
+---------------------
+
+For large numbers of instances, a :class:`CompactOnticType` holds the
+property values in slots, rather than a dict, with the same dict style
+access.
+
+    >>> compact_type = create_ontic_type(
+    ...     'CompactType', {'prop': {'type': 'int'}}, compact=True)
+    >>> my_object = compact_type(prop=3)
+    >>> my_object['prop']
+    3
+    >>> validate_object(my_object)
+    []
+
+Copy Ontic Objects
+--------------------
+
+The deep copy of an Ontic object is driven by the schema of its type. The
+values of the immutable types, such as *str*, *int* or *date*, are shared by
+the copy, and only collections and values of other types are copied, see
+:func:`get_copy_plan`. With :meth:`OnticType.clone`, the properties that are
+copied can be chosen::
+
+    >>> list_type = create_ontic_type('ListType', {
+    ...     'name': {'type': 'str'}, 'tags': {'type': 'list'}})
+    >>> my_object = list_type(name='a', tags=['b'])
+    >>> my_object.clone().tags is my_object.tags
+    False
+    >>> my_object.clone(shallow_fields=['tags']).tags is my_object.tags
+    True
+
+Frozen Ontic Types
+--------------------
+
+The instances of a :class:`FrozenOnticType` cannot be modified, and are
+hashable. A frozen copy of an object is made with :meth:`OnticType.freeze`::
+
+    >>> frozen_object = list_type(name='a', tags=['b']).freeze()
+    >>> frozen_object.name = 'c'
+    Traceback (most recent call last):
+    ...
+    TypeError: A FrozenListType is read-only, it must be replaced or thawed.
+    >>> frozen_object in {frozen_object}
+    True
+
 """
 from copy import deepcopy
+from datetime import date, datetime, time
+from functools import partial
+from itertools import imap, izip
+import re
+import sys
+import weakref
 
-from ontic import meta_type
-from ontic.meta_type import COLLECTION_TYPES, MetaType, TYPE_MAP
-from ontic.schema_type import SchemaType
+from ontic import type_registry, validation_plan
+from ontic.frozen import FROZEN_TYPES, _read_only, freeze, thaw
+from ontic.meta_type import COLLECTION_TYPES, TYPE_MAP, MetaType
+from ontic.property_schema import new_property_schema
+from ontic.schema_type import SchemaType, create_schema
 from ontic.validation_exception import ValidationException
 
 
@@ -63,19 +117,598 @@ class OnticType(MetaType):
 
     The **OnticType** provides the schema management functionality to a
     derived **Ontic** type instance.
+
+    Once an *OnticType* instance has been validated, the properties written
+    since, by item or attribute assignment, deletion, or the dict update
+    methods, are tracked as dirty. The next validation of the object only
+    validates the dirty properties, and those whose values are mutable
+    collections, and reuses the earlier results for the other properties.
+    See :meth:`invalidate`.
+
+    If *VALIDATE_ON_SET* is True for a derived type, then each property
+    value is validated when it is assigned, by item or attribute, and an
+    invalid value raises a
+    :class:`~ontic.validation_exception.ValidationException` without being
+    assigned. The deletion of a property is validated as the assignment of
+    None.
     """
+    __slots__ = ('_dirty', '_validation_cache')
+
+    # : If True, property values are validated on assignment.
+    VALIDATE_ON_SET = False
+
+    # : The capacity of the value memo of each property validator, see
+    # : :meth:`ontic.validation_plan.ValidationPlan.configure_memo`.
+    VALUE_MEMO_CAPACITY = None
+
+    # : The capacity of the record memo of the validation plan.
+    RECORD_MEMO_CAPACITY = None
+
+    def __init__(self, *args, **kwargs):
+        r"""Initializes in accordance with dict specification.
+
+        Dict Style Initialization
+            OnticType() -> new empty OnticType
+
+            OnticType(mapping) -> new OnticType initialized from a mapping
+            object's (key, value) pairs
+
+            OnticType(iterable) -> new OnticType initialized as if via::
+
+                d = OnticType()
+                for k, v in iterable:
+                    d[k] = v
+
+            OnticType(\*\*kwargs) -> new OnticType initialized with the
+            name=value pairs in the keyword argument list.  For example::
+
+                OnticType(one=1, two=2)
+        """
+        self._dirty = None
+        self._validation_cache = None
+        super(OnticType, self).__init__(*args, **kwargs)
+        if self.VALIDATE_ON_SET:
+            _check_assignments(self, self)
+
+    def __setitem__(self, key, value):
+        if self.VALIDATE_ON_SET:
+            _check_assignment(self, key, value)
+        dict.__setitem__(self, key, value)
+        if self._dirty is not None:
+            self._dirty.add(key)
+
+    def __delitem__(self, key):
+        if self.VALIDATE_ON_SET and key in self:
+            _check_assignment(self, key, None)
+        dict.__delitem__(self, key)
+        if self._dirty is not None:
+            self._dirty.add(key)
+
+    def clear(self):
+        if self.VALIDATE_ON_SET:
+            _check_assignments(self, dict.fromkeys(self))
+        if self._dirty is not None:
+            self._dirty.update(self)
+        dict.clear(self)
+
+    def pop(self, key, *default):
+        if key in self:
+            if self.VALIDATE_ON_SET:
+                _check_assignment(self, key, None)
+            if self._dirty is not None:
+                self._dirty.add(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        if self.VALIDATE_ON_SET and self:
+            key = next(self.iterkeys())
+            _check_assignment(self, key, None)
+            return key, self.pop(key)
+        key, value = dict.popitem(self)
+        if self._dirty is not None:
+            self._dirty.add(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            if self.VALIDATE_ON_SET:
+                _check_assignment(self, key, default)
+            if self._dirty is not None:
+                self._dirty.add(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        if self._dirty is None and not self.VALIDATE_ON_SET:
+            dict.update(self, *args, **kwargs)
+        else:
+            items = dict(*args, **kwargs)
+            if self.VALIDATE_ON_SET:
+                _check_assignments(self, items)
+            dict.update(self, items)
+            if self._dirty is not None:
+                self._dirty.update(items)
+
+    def invalidate(self):
+        """Drops the validation results that are reused by validation.
+
+        The next validation of the object validates every property. Used
+        when a value of the object has been modified without assignment to
+        the object, or when the object schema has been modified in place.
+        """
+        self._dirty = None
+        self._validation_cache = None
+
+    @classmethod
+    def get_validation_plan(cls):
+        """Returns the compiled validation plan for the type schema.
+
+        :return: The plan compiled from the schema of the type.
+        :rtype: :class:`ontic.validation_plan.ValidationPlan`
+        """
+        return validation_plan.get_validation_plan(cls)
+
+    @classmethod
+    def clear_validation_plan(cls):
+        """Drops the compiled validation plan after a schema modification.
+
+        The cached pickle encoding and copy plan of the type schema are
+        dropped as well.
+        """
+        validation_plan.clear_validation_plan(cls)
+        _clear_type_caches(cls)
+
+    def __reduce__(self):
+        token, names = get_pickle_token(type(self))
+        get = self.get
+        values = tuple(get(name, _MISSING) for name in names)
+        extras = None
+        if len(self) > len(names) - values.count(_MISSING):
+            extras = dict((key, value) for key, value in self.iteritems()
+                          if key not in self.get_schema())
+        return rebuild_ontic_object, (token, values, extras)
+
+    def __copy__(self):
+        the_copy = _new_instance(type(self))
+        dict.update(the_copy, self)
+        return the_copy
+
+    def __deepcopy__(self, memo):
+        return _deep_copy(self, memo, get_copy_plan(type(self)))
+
+    def clone(self, shallow_fields=None, deep_fields=None):
+        return clone_object(self, shallow_fields, deep_fields)
+
+    def freeze(self):
+        return freeze_object(self)
 
     def perfect(self):
         perfect_object(self)
 
-    def validate(self, raise_validation_exception=True):
-        return validate_object(self, raise_validation_exception)
+    def validate(self, raise_validation_exception=True, records=False):
+        return validate_object(self, raise_validation_exception,
+                               records=records)
+
+    def ensure(self, raise_validation_exception=True, records=False):
+        return perfect_and_validate(self, raise_validation_exception,
+                                    records)
+
+    def is_valid(self):
+        return is_valid(self)
+
+    @classmethod
+    def validate_batch(cls, objects, mode='full', workers=None,
+                       chunk_size=None):
+        return validate_many(cls, objects, mode, workers, chunk_size)
+
+    @classmethod
+    def ensure_batch(cls, objects):
+        return perfect_and_validate_many(cls, objects)
+
+    @classmethod
+    def perfect_many(cls, objects):
+        perfect_many(cls, objects)
+
+    def validate_value(self, value_name, raise_validation_exception=True,
+                       records=False):
+        return validate_value(value_name, self, raise_validation_exception,
+                              records)
+
+
+class FrozenOnticType(OnticType):
+    """An :class:`OnticType` whose instances cannot be modified.
+
+    The property values of a frozen instance are frozen copies, made by
+    :func:`ontic.frozen.freeze`, whose lists, dicts and sets are
+    :class:`~ontic.frozen.FrozenList`, :class:`~ontic.frozen.FrozenDict` and
+    :class:`~ontic.frozen.FrozenSet` instances. Any modification of the
+    instance or its collections raises a *TypeError*.
+
+    A frozen instance is hashable, if its values are, and its hash is
+    computed once. It may be used as a dict key or set member, and be
+    shared between threads. The result of its first validation is kept,
+    and is returned by later validations until the schema of the type is
+    changed. The copies of a frozen instance are the instance itself.
+    """
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kwargs):
+        r"""Initializes in accordance with dict specification.
+
+        Dict Style Initialization
+            FrozenOnticType() -> new empty FrozenOnticType
+
+            FrozenOnticType(mapping) -> new FrozenOnticType initialized
+            with frozen copies of a mapping object's (key, value) pairs
+
+            FrozenOnticType(iterable) -> new FrozenOnticType initialized
+            with frozen copies of the (key, value) pairs of an iterable.
+
+            FrozenOnticType(\*\*kwargs) -> new FrozenOnticType initialized
+            with frozen copies of the name=value pairs in the keyword
+            argument list.  For example::
+
+                FrozenOnticType(one=1, two=2)
+        """
+        self._hash = None
+        OnticType.__init__(self, (
+            (key, freeze(value))
+            for key, value in dict(*args, **kwargs).iteritems()))
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self):
+        the_hash = self._hash
+        if the_hash is None:
+            the_hash = self._hash = hash(frozenset(self.iteritems()))
+        return the_hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def freeze(self):
+        return self
+
+
+class CompactOnticMeta(type):
+    """The metaclass of :class:`CompactOnticType`.
+
+    The metaclass declares a slot for each property of the *ONTIC_SCHEMA* of
+    a class that is not already a slot of a base class. A class that
+    declares its own *__slots__* is left as is.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        schema = namespace.get('ONTIC_SCHEMA')
+        inherited_names = frozenset().union(
+            *(getattr(base, '_property_set', ()) for base in bases))
+        if '__slots__' not in namespace:
+            names = sorted(schema) if schema is not None else ()
+            for property_name in names:
+                if property_name in inherited_names:
+                    continue
+                if not isinstance(property_name, basestring) or \
+                        not _IDENTIFIER.match(property_name):
+                    raise ValueError(
+                        'The property name "%s" is not a valid identifier '
+                        'for a compact type.' % property_name)
+                if any(property_name in vars(base) for base in
+                       CompactOnticType.__mro__):
+                    raise ValueError(
+                        'The property name "%s" conflicts with an attribute '
+                        'of CompactOnticType.' % property_name)
+            namespace['__slots__'] = tuple(
+                property_name for property_name in names
+                if property_name not in inherited_names)
+
+        compact_type = super(CompactOnticMeta, mcs).__new__(
+            mcs, name, bases, namespace)
+        if schema is not None:
+            compact_type._property_names = tuple(sorted(schema))
+            compact_type._property_set = frozenset(schema)
+        if compact_type.VALIDATE_ON_SET and \
+                '__setattr__' not in namespace:
+            compact_type.__setattr__ = _compact_checked_setattr
+            compact_type.__delattr__ = _compact_checked_delattr
+        return compact_type
+
+
+class CompactOnticType(object):
+    """A compact **Ontic** type, with a slot for each schema property.
+
+    A *CompactOnticType* holds its property values in *__slots__* declared
+    from the schema of the type, rather than in a dict, see
+    :class:`CompactOnticMeta`. The properties are accessed by attribute, or
+    with the dict style methods that ontic relies upon. An unset property is
+    a missing key. Only the properties of the schema can be set, the
+    assignment of any other property raises a ValueError.
+
+    A compact type is defined with a *ONTIC_SCHEMA* as a class definition::
+
+        class MyCompactType(CompactOnticType):
+            ONTIC_SCHEMA = SchemaType({'prop': {'type': 'int'}})
+
+    or with :func:`create_ontic_type` and *compact* set to True. The schema
+    of a compact type is fixed when the class is created. Instances are
+    validated as a whole, there is no tracking of dirty properties.
+
+    An instance holds a pointer per schema property, rather than a dict
+    table. The bytes per instance, without the property values, as measured
+    by ``bench/memory_bench.py`` with CPython 2.7 on a 64 bit platform:
+
+    ==========  ======  =========  =======
+    properties  dict    OnticType  compact
+    ==========  ======  =========  =======
+    1           280     296        56
+    10          1048    1064       128
+    20          1048    1064       208
+    50          3352    3368       448
+    ==========  ======  =========  =======
+
+    The construction of a compact instance is slower than that of a dict,
+    by about a third of a microsecond per property.
+    """
+    __metaclass__ = CompactOnticMeta
+    __slots__ = ()
+
+    # : The Ontic schema pointer.
+    ONTIC_SCHEMA = None
 
-    def validate_value(self, value_name, raise_validation_exception=True):
-        return validate_value(value_name, self, raise_validation_exception)
+    # : If True, property values are validated on assignment.
+    VALIDATE_ON_SET = False
 
+    # : The capacity of the value memo of each property validator.
+    VALUE_MEMO_CAPACITY = None
 
-def create_ontic_type(name, schema):
+    # : The capacity of the record memo of the validation plan.
+    RECORD_MEMO_CAPACITY = None
+
+    # : The schema property names, in sorted order, and as a set.
+    _property_names = ()
+    _property_set = frozenset()
+
+    def __init__(self, *args, **kwargs):
+        r"""Initializes in accordance with dict specification.
+
+        Dict Style Initialization
+            CompactOnticType() -> new empty CompactOnticType
+
+            CompactOnticType(mapping) -> new CompactOnticType initialized
+            from a mapping object's (key, value) pairs
+
+            CompactOnticType(iterable) -> new CompactOnticType initialized as
+            if via::
+
+                d = CompactOnticType()
+                for k, v in iterable:
+                    d[k] = v
+
+            CompactOnticType(\*\*kwargs) -> new CompactOnticType initialized
+            with the name=value pairs in the keyword argument list.  For
+            example::
+
+                CompactOnticType(one=1, two=2)
+
+        :raises ValueError: If a key is not a property of the schema.
+        """
+        if args or kwargs:
+            items = dict(*args, **kwargs)
+            for key, value in items.iteritems():
+                self._check_property(key)
+                object.__setattr__(self, key, value)
+            if self.VALIDATE_ON_SET:
+                _check_assignments(self, items)
+
+    def _check_property(self, key):
+        if key not in self._property_set:
+            raise ValueError('"%s" is not a recognized property.' % key)
+
+    @classmethod
+    def get_schema(cls):
+        """Returns the schema object for the given type definition.
+
+        :return: The schema of the type.
+        :rtype: :class:`ontic.schema_type.SchemaType`
+        """
+        return cls.ONTIC_SCHEMA
+
+    @classmethod
+    def get_validation_plan(cls):
+        """Returns the compiled validation plan for the type schema.
+
+        :return: The plan compiled from the schema of the type.
+        :rtype: :class:`ontic.validation_plan.ValidationPlan`
+        """
+        return validation_plan.get_validation_plan(cls)
+
+    @classmethod
+    def clear_validation_plan(cls):
+        """Drops the compiled validation plan after a schema modification.
+
+        The cached pickle encoding and copy plan of the type schema are
+        dropped as well.
+        """
+        validation_plan.clear_validation_plan(cls)
+        _clear_type_caches(cls)
+
+    def __reduce__(self):
+        token, names = get_pickle_token(type(self))
+        return rebuild_ontic_object, (
+            token, tuple(getattr(self, name, _MISSING) for name in names),
+            None)
+
+    def __copy__(self):
+        the_copy = _new_instance(type(self))
+        for name, value in self.iteritems():
+            object.__setattr__(the_copy, name, value)
+        return the_copy
+
+    def __deepcopy__(self, memo):
+        return _deep_copy(self, memo, get_copy_plan(type(self)))
+
+    def clone(self, shallow_fields=None, deep_fields=None):
+        return clone_object(self, shallow_fields, deep_fields)
+
+    def __getitem__(self, key):
+        if key in self._property_set:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self._check_property(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key in self._property_set and hasattr(self, key):
+            delattr(self, key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._property_set and hasattr(self, key)
+
+    has_key = __contains__
+
+    def __iter__(self):
+        return self.iterkeys()
+
+    def __len__(self):
+        return sum(1 for _ in self.iterkeys())
+
+    def __eq__(self, other):
+        if isinstance(other, CompactOnticType):
+            other = dict(other.iteritems())
+        elif not isinstance(other, dict):
+            return NotImplemented
+        return dict(self.iteritems()) == other
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.iteritems()))
+
+    def get(self, key, default=None):
+        if key in self._property_set:
+            return getattr(self, key, default)
+        return default
+
+    def iteritems(self):
+        for name in self._property_names:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                yield name, value
+
+    def iterkeys(self):
+        for name in self._property_names:
+            if hasattr(self, name):
+                yield name
+
+    def itervalues(self):
+        for name, value in self.iteritems():
+            yield value
+
+    def items(self):
+        return list(self.iteritems())
+
+    def keys(self):
+        return list(self.iterkeys())
+
+    def values(self):
+        return list(self.itervalues())
+
+    def clear(self):
+        for name in self.keys():
+            del self[name]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        for key in items:
+            self._check_property(key)
+        if self.VALIDATE_ON_SET:
+            _check_assignments(self, items)
+        for key, value in items.iteritems():
+            object.__setattr__(self, key, value)
+
+    def perfect(self):
+        perfect_object(self)
+
+    def validate(self, raise_validation_exception=True, records=False):
+        return validate_object(self, raise_validation_exception,
+                               records=records)
+
+    def ensure(self, raise_validation_exception=True, records=False):
+        return perfect_and_validate(self, raise_validation_exception,
+                                    records)
+
+    def is_valid(self):
+        return is_valid(self)
+
+    @classmethod
+    def validate_batch(cls, objects, mode='full', workers=None,
+                       chunk_size=None):
+        return validate_many(cls, objects, mode, workers, chunk_size)
+
+    @classmethod
+    def ensure_batch(cls, objects):
+        return perfect_and_validate_many(cls, objects)
+
+    @classmethod
+    def perfect_many(cls, objects):
+        perfect_many(cls, objects)
+
+    def validate_value(self, value_name, raise_validation_exception=True,
+                       records=False):
+        return validate_value(value_name, self, raise_validation_exception,
+                              records)
+
+
+def _compact_checked_setattr(self, name, value):
+    if name in self._property_set:
+        _check_assignment(self, name, value)
+    object.__setattr__(self, name, value)
+
+
+def _compact_checked_delattr(self, name):
+    if name in self._property_set and hasattr(self, name):
+        _check_assignment(self, name, None)
+    object.__delattr__(self, name)
+
+
+# : The classes of the Ontic schema defined object types.
+ONTIC_TYPES = (OnticType, CompactOnticType)
+
+# : A valid property name of a compact type.
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def create_ontic_type(name, schema, validate_on_set=False, compact=False,
+                      frozen=False, interned=False, trusted=False,
+                      lazy=False, registered=False):
     """Create an **Ontic** type to generate objects with a given schema.
 
     *create_ontic_type* function creates an :class:`OnticType` with a given
@@ -94,10 +727,40 @@ def create_ontic_type(name, schema):
     :type name: str
     :param schema: A representation of the schema in dictionary format.
     :type schema: dict, :class:`ontic.schema_type.SchemaType`
-    :return: A class whose base is :class:`OnticType`.
+    :param validate_on_set: If True, the property values of the created
+        type are validated on assignment, see :class:`OnticType`.
+    :type validate_on_set: bool
+    :param compact: If True, a :class:`CompactOnticType` is created, that
+        holds the property values in slots rather than a dict.
+    :type compact: bool
+    :param frozen: If True, a :class:`FrozenOnticType` is created, whose
+        instances cannot be modified. A compact type cannot be frozen.
+    :type frozen: bool
+    :param interned: If True, and *schema* is a dict, the property schemas
+        of the created type are shared with the types of identical property
+        schema definitions, see :func:`ontic.schema_type.create_schema`.
+    :type interned: bool
+    :param trusted: If True, and *schema* is a dict, the property schema
+        definitions are not validated against the meta-schema.
+    :type trusted: bool
+    :param lazy: If True, and *schema* is a dict, each property schema is
+        made and validated the first time it is used, see
+        :class:`ontic.schema_type.LazySchemaType`.
+    :type lazy: bool
+    :param registered: If True, a type of the same name, schema fingerprint
+        and options that is registered in the :mod:`ontic.type_registry`
+        is returned, rather than a new type. A new type is registered. The
+        fingerprint is computed from the property schemas, that are made
+        at once for a lazy schema.
+    :type registered: bool
+    :return: A class whose base is :class:`OnticType`,
+        :class:`CompactOnticType` if *compact* is True, or
+        :class:`FrozenOnticType` if *frozen* is True.
     :rtype: ClassType
     :raises ValueError: String name required. Dict or
-        :class:`ontic.schema_type.SchemaType` schema required.
+        :class:`ontic.schema_type.SchemaType` schema required. For a compact
+        type, the property names must be valid identifiers, and the type
+        must not be frozen.
     """
     if name is None or name is '':
         raise ValueError('The string "name" argument is required.')
@@ -106,16 +769,476 @@ def create_ontic_type(name, schema):
     if not isinstance(schema, dict):
         raise ValueError('The schema must be a dict or SchemaType.')
 
-    ontic_type = type(name, (OnticType, ), dict())
+    if compact and frozen:
+        raise ValueError('A compact type cannot be frozen.')
 
     if not isinstance(schema, SchemaType):
-        schema = SchemaType(schema)
+        schema = create_schema(schema, interned, trusted, lazy)
+
+    if registered:
+        fingerprint = type_registry.schema_fingerprint(schema)
+        ontic_type = type_registry.get_registered_type((name, fingerprint))
+        if ontic_type is not None and _type_options(ontic_type) == (
+                bool(validate_on_set), bool(compact), bool(frozen)):
+            return ontic_type
 
-    ontic_type.ONTIC_SCHEMA = schema
+    if compact:
+        ontic_type = CompactOnticMeta(name, (CompactOnticType, ), dict(
+            ONTIC_SCHEMA=schema, VALIDATE_ON_SET=bool(validate_on_set)))
+    else:
+        ontic_type = type(name, (FrozenOnticType if frozen else OnticType, ),
+                          dict(__slots__=()))
+        if validate_on_set:
+            ontic_type.VALIDATE_ON_SET = True
 
+        ontic_type.ONTIC_SCHEMA = schema
+
+    if registered:
+        type_registry.register_type(ontic_type, fingerprint)
     return ontic_type
 
 
+def define_type(module_name, name, settings):
+    """Define an :class:`OnticType` of perfected property schema settings.
+
+    Used by the modules compiled by :mod:`ontic.compile`, that import this
+    module rather than the compiler. The property schemas are made from
+    their settings as they are, see
+    :func:`ontic.property_schema.new_property_schema`.
+
+    :param module_name: The name of the module that defines the type.
+    :type module_name: str
+    :param name: The name of the type.
+    :type name: str
+    :param settings: The complete property schema settings keyed by
+        property name.
+    :type settings: dict<str, dict>
+    :return: The defined type.
+    :rtype: :class:`OnticType` derived class
+    """
+    schema = SchemaType()
+    for property_name, property_settings in settings.iteritems():
+        dict.__setitem__(schema, property_name,
+                         new_property_schema(property_settings))
+    return type(name, (OnticType, ), dict(
+        __slots__=(), __module__=module_name, ONTIC_SCHEMA=schema))
+
+
+# : The value types that may be modified without assignment to the object.
+_MUTABLE_TYPES = (dict, list, set)
+
+
+class _Missing(object):
+    """Marks a schema property that is absent from a pickled object."""
+
+    def __reduce__(self):
+        return '_MISSING'
+
+    def __repr__(self):
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+# : The types rebuilt from pickle tokens in this process, keyed by
+# : (name, schema fingerprint, options), as a weak reference to the type, so
+# : that a type no longer in use is freed, and the property order of the
+# : token.
+_rebuilt_types = {}
+
+
+def get_pickle_token(ontic_type):
+    """The pickle encoding of an :class:`OnticType` derived class.
+
+    The instances of an *OnticType* are pickled as a token of their type and
+    a tuple of their property values, in the order of the sorted schema
+    property names. A type that can be found by module and name is encoded
+    by reference. Other types, such as those made by
+    :func:`create_ontic_type`, are encoded by name, schema fingerprint and
+    schema settings, see :mod:`ontic.type_registry`. The settings of a
+    schema that is not portable, such as one with a lambda
+    *default_factory*, are not encoded, see
+    :func:`ontic.type_registry.is_portable`. The type of such a token is
+    found by its fingerprint in the process where it was encoded, or in the
+    type registry. The token is cached on the type, and is written once per
+    pickle of many instances.
+
+    :param ontic_type: The type to be encoded.
+    :type ontic_type: :class:`OnticType` derived class
+    :return: The token of the type, and the property names in the order of
+        the pickled values.
+    :rtype: tuple<tuple, tuple<str>>
+    """
+    schema = ontic_type.get_schema()
+    cached = ontic_type.__dict__.get('_pickle_token')
+    if cached is not None and cached[0] is schema:
+        return cached[1:]
+
+    names = tuple(sorted(schema.keys()))
+    module = sys.modules.get(ontic_type.__module__)
+    if getattr(module, ontic_type.__name__, None) is ontic_type:
+        token = (ontic_type, names)
+    else:
+        # The settings of a property are None if they cannot be pickled.
+        portable = type_registry.is_portable(schema)
+        token = (ontic_type.__name__,
+                 type_registry.schema_fingerprint(schema),
+                 tuple((name, dict(schema[name]) if portable else None)
+                       for name in names),
+                 _type_options(ontic_type))
+        # Objects pickled and loaded in the same process keep their type.
+        if token[:2] + token[3:] not in _rebuilt_types:
+            _remember_rebuilt_type(token[:2] + token[3:], ontic_type, names)
+    ontic_type._pickle_token = (schema, token, names)
+    return token, names
+
+
+def _type_options(ontic_type):
+    """The options of :func:`create_ontic_type` that rebuild a type."""
+    return (bool(ontic_type.VALIDATE_ON_SET),
+            issubclass(ontic_type, CompactOnticType),
+            issubclass(ontic_type, FrozenOnticType))
+
+
+def rebuild_ontic_object(token, values, extras):
+    """Rebuild a pickled :class:`OnticType` instance.
+
+    A type encoded by schema is found in the
+    :mod:`ontic.type_registry`, or is created and registered, once per
+    process. The values are not validated on assignment.
+
+    :param token: The pickle token of the type, see
+        :func:`get_pickle_token`.
+    :type token: tuple
+    :param values: The property values in the order of the token.
+    :type values: tuple
+    :param extras: The properties that are not declared in the schema.
+    :type extras: dict, None
+    :return: The rebuilt object.
+    :rtype: :class:`OnticType`, :class:`CompactOnticType`
+    :raises ValueError: If the type of a token without schema settings is
+        not found.
+    """
+    if len(token) == 2:
+        ontic_type, names = token
+    else:
+        key = token[:2] + token[3:]
+        rebuilt = _rebuilt_types.get(key)
+        ontic_type = rebuilt[0]() if rebuilt is not None else None
+        if ontic_type is None:
+            name, fingerprint, schema_settings, options = token
+            names = tuple(item[0] for item in schema_settings)
+            ontic_type = type_registry.get_registered_type(token[:2])
+            if ontic_type is None or _type_options(ontic_type) != options:
+                if any(settings is None for _, settings in schema_settings):
+                    raise ValueError(
+                        'The type "%s" is not found, and cannot be rebuilt, '
+                        'as its schema holds callables that are not found '
+                        'by module and name.' % name)
+                validate_on_set, compact, frozen = options
+                ontic_type = create_ontic_type(
+                    name, SchemaType(schema_settings), validate_on_set,
+                    compact, frozen)
+                type_registry.register_type(ontic_type, fingerprint)
+            _remember_rebuilt_type(key, ontic_type, names)
+        else:
+            names = rebuilt[1]
+
+    the_object = _new_instance(ontic_type)
+    if isinstance(the_object, CompactOnticType):
+        for name, value in izip(names, values):
+            if value is not _MISSING:
+                object.__setattr__(the_object, name, value)
+        return the_object
+    dict.update(the_object, (
+        (name, value) for name, value in izip(names, values)
+        if value is not _MISSING))
+    if extras:
+        dict.update(the_object, extras)
+    return the_object
+
+
+def _remember_rebuilt_type(key, ontic_type, names):
+    _rebuilt_types[key] = (
+        weakref.ref(ontic_type, partial(_forget_rebuilt_type, key)), names)
+
+
+def _forget_rebuilt_type(key, reference):
+    """Drop the entry of a rebuilt type that has been freed."""
+    # The module globals are None while the interpreter shuts down.
+    if _rebuilt_types is not None and _rebuilt_types.get(
+            key, (None, ))[0] is reference:
+        del _rebuilt_types[key]
+
+
+def _new_instance(ontic_type):
+    """An empty instance of a type, made without validation."""
+    the_object = ontic_type.__new__(ontic_type)
+    if issubclass(ontic_type, FrozenOnticType):
+        FrozenOnticType.__init__(the_object)
+    elif not issubclass(ontic_type, CompactOnticType):
+        OnticType.__init__(the_object)
+    return the_object
+
+
+def _clear_type_caches(ontic_type):
+    """Drop the pickle token and the copy, perfect and ensure plans cached
+    on a type, and the validation plan of its frozen variant."""
+    for name in ('_pickle_token', '_copy_plan', '_perfect_plan',
+                 '_ensure_plan'):
+        if name in ontic_type.__dict__:
+            delattr(ontic_type, name)
+    frozen_type = ontic_type.__dict__.get('_frozen_type')
+    if frozen_type is not None:
+        frozen_type.clear_validation_plan()
+
+
+# : The value types that are never modified in place. Their values are
+# : shared by the copies of an object rather than copied.
+IMMUTABLE_TYPES = frozenset((bool, complex, date, datetime, float, int, long,
+                             str, time, unicode, type(None)))
+
+# : The collection types that are copied shallowly if their members are of
+# : the immutable types.
+_FLAT_COPY_TYPES = frozenset((dict, list, set))
+
+
+def _share_value(value, memo):
+    return value
+
+
+def _copy_value(value, memo):
+    """Share an immutable value, or deep copy any other value."""
+    if type(value) in IMMUTABLE_TYPES:
+        return value
+    return deepcopy(value, memo)
+
+
+def _copy_collection(value, memo):
+    """Copy a collection of immutable members shallowly, or deep copy it."""
+    value_type = type(value)
+    if value_type not in _FLAT_COPY_TYPES:
+        return deepcopy(value, memo)
+    the_copy = memo.get(id(value))
+    if the_copy is not None:
+        return the_copy
+    if not IMMUTABLE_TYPES.issuperset(imap(type, value)) or (
+            value_type is dict and
+            not IMMUTABLE_TYPES.issuperset(imap(type, value.itervalues()))):
+        return deepcopy(value, memo)
+    the_copy = memo[id(value)] = value_type(value)
+    return the_copy
+
+
+def get_copy_plan(ontic_type):
+    """The functions that deep copy the property values of a type.
+
+    The plan is derived from the schema of the type. The value of a
+    collection property (dict, list, set) is copied shallowly if its
+    members are of the :data:`IMMUTABLE_TYPES`, and is deep copied
+    otherwise. The value of any other property, or a property with no
+    declared type, is shared if it is of the *IMMUTABLE_TYPES*, and is deep
+    copied otherwise. The plan is cached on the type, see
+    :meth:`OnticType.clear_validation_plan`.
+
+    :param ontic_type: The type whose values are to be copied.
+    :type ontic_type: :class:`OnticType`, :class:`CompactOnticType`
+    :return: The copy functions keyed by property name. The functions have
+        the signature ``copy_value(value, memo)``.
+    :rtype: dict<str, function>
+    """
+    schema = ontic_type.get_schema()
+    cached = ontic_type.__dict__.get('_copy_plan')
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    copiers = dict(
+        (name, _copy_collection
+         if TYPE_MAP.get(property_schema.type) in COLLECTION_TYPES
+         else _copy_value)
+        for name, property_schema in schema.iteritems())
+    ontic_type._copy_plan = (schema, copiers)
+    return copiers
+
+
+def _deep_copy(the_object, memo, copiers, default_copier=_copy_value):
+    """Copy the values of an object with the copy function of each name."""
+    the_copy = _new_instance(type(the_object))
+    memo[id(the_object)] = the_copy
+    get_copier = copiers.get
+    items = [(name, get_copier(name, default_copier)(value, memo))
+             for name, value in the_object.iteritems()]
+    if isinstance(the_copy, CompactOnticType):
+        for name, value in items:
+            object.__setattr__(the_copy, name, value)
+    else:
+        dict.update(the_copy, items)
+    return the_copy
+
+
+def _field_names(fields, argument):
+    if isinstance(fields, basestring):
+        raise ValueError(
+            '"%s" must be an iterable of property names.' % argument)
+    return set(fields)
+
+
+def clone_object(the_object, shallow_fields=None, deep_fields=None):
+    """Copy an object, choosing the properties whose values are copied.
+
+    By default, the clone is the deep copy of *the_object*, made with the
+    copy plan of its type, see :func:`get_copy_plan`. The values of the
+    *shallow_fields* are shared by the clone. If *deep_fields* is given,
+    only the values of the *deep_fields* are copied, and the values of the
+    other properties are shared. The clone is not validated.
+
+    :param the_object: The object to be cloned.
+    :type the_object: :class:`OnticType`, :class:`CompactOnticType`
+    :param shallow_fields: The names of the properties whose values are
+        shared, rather than copied.
+    :type shallow_fields: iterable<str>, None
+    :param deep_fields: The names of the only properties whose values are
+        copied. If None, all of the values are copied.
+    :type deep_fields: iterable<str>, None
+    :return: The clone, of the type of *the_object*.
+    :rtype: :class:`OnticType`, :class:`CompactOnticType`
+    :raises ValueError: If *the_object* is not an Ontic object, or a name is
+        in both *shallow_fields* and *deep_fields*.
+    """
+    if the_object is None:
+        raise ValueError('"the_object" must be provided.')
+    if not isinstance(the_object, ONTIC_TYPES):
+        raise ValueError('"the_object" must be OnticType type.')
+
+    copiers = get_copy_plan(type(the_object))
+    default_copier = _copy_value
+    if deep_fields is not None:
+        deep_fields = _field_names(deep_fields, 'deep_fields')
+        copiers = dict((name, copiers.get(name, _copy_value))
+                       for name in deep_fields)
+        default_copier = _share_value
+    if shallow_fields is not None:
+        shallow_fields = _field_names(shallow_fields, 'shallow_fields')
+        if deep_fields and shallow_fields & deep_fields:
+            raise ValueError(
+                'The properties %s are both shallow and deep fields.' %
+                ', '.join(sorted(shallow_fields & deep_fields)))
+        copiers = dict(copiers)
+        copiers.update(dict.fromkeys(shallow_fields, _share_value))
+    return _deep_copy(the_object, {}, copiers, default_copier)
+
+
+def get_frozen_type(ontic_type):
+    """The frozen variant of an :class:`OnticType` derived class.
+
+    The frozen variant is a subclass of both :class:`FrozenOnticType` and
+    *ontic_type*, named with a *Frozen* prefix. It is created once and
+    cached on *ontic_type*.
+
+    :param ontic_type: The type whose frozen variant is returned.
+    :type ontic_type: :class:`OnticType` derived class
+    :return: The frozen variant, or *ontic_type* if it is frozen.
+    :rtype: :class:`FrozenOnticType` derived class
+    :raises ValueError: If *ontic_type* is not an :class:`OnticType`
+        derived class.
+    """
+    if not isinstance(ontic_type, type) or not issubclass(
+            ontic_type, OnticType):
+        raise ValueError('"ontic_type" must be OnticType or child type of '
+                         'OnticType.')
+    if issubclass(ontic_type, FrozenOnticType):
+        return ontic_type
+    frozen_type = ontic_type.__dict__.get('_frozen_type')
+    if frozen_type is None:
+        frozen_type = type('Frozen' + ontic_type.__name__,
+                           (FrozenOnticType, ontic_type),
+                           dict(__slots__=(),
+                                __module__=ontic_type.__module__))
+        ontic_type._frozen_type = frozen_type
+    return frozen_type
+
+
+def freeze_object(the_object):
+    """Make a frozen copy of an object.
+
+    The copy is an instance of the frozen variant of the object type, see
+    :func:`get_frozen_type`, with frozen copies of the property values.
+
+    :param the_object: The object to be frozen.
+    :type the_object: :class:`OnticType`
+    :return: The frozen copy, or *the_object* if it is frozen.
+    :rtype: :class:`FrozenOnticType`
+    :raises ValueError: If *the_object* is not an :class:`OnticType`.
+    """
+    if not isinstance(the_object, OnticType):
+        raise ValueError('"the_object" must be OnticType type.')
+    if isinstance(the_object, FrozenOnticType):
+        return the_object
+    return get_frozen_type(type(the_object))(the_object)
+
+
+def get_perfect_plan(ontic_type):
+    """The plan that perfects the objects of a type.
+
+    The plan is derived from the schema of the type, see
+    :func:`perfect_object`. The default value of a property is assigned by
+    reference if it is the same for every object: a default of a type other
+    than the collection types (dict, list, set), or the frozen copy of a
+    collection default with the *shared_default* setting. Otherwise, a new
+    default value is made for each object, by the *default_factory*
+    setting, or as a copy of the *default* setting. The copy is shallow if
+    the members of the *default* setting are of the :data:`IMMUTABLE_TYPES`,
+    and deep otherwise. The plan is cached on the type, see
+    :meth:`OnticType.clear_validation_plan`.
+
+    :param ontic_type: The type whose objects are to be perfected.
+    :type ontic_type: :class:`OnticType`, :class:`CompactOnticType`
+    :return: The property names of the schema, the defaults assigned by
+        reference as (name, value) pairs, the functions that make a new
+        default as (name, function) pairs, and the names of the properties
+        with no default.
+    :rtype: tuple<frozenset<str>, list<tuple>, list<tuple>, list<str>>
+    """
+    schema = ontic_type.get_schema()
+    cached = ontic_type.__dict__.get('_perfect_plan')
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    shared_defaults = []
+    made_defaults = []
+    no_defaults = []
+    for name, property_schema in schema.iteritems():
+        factory = property_schema.default_factory
+        default = property_schema.default
+        if factory is not None:
+            made_defaults.append((name, factory))
+        elif default is None:
+            no_defaults.append(name)
+        elif TYPE_MAP.get(property_schema.type) in COLLECTION_TYPES and \
+                not property_schema.shared_default:
+            made_defaults.append((name, _default_copier(default)))
+        else:
+            shared_defaults.append((name, property_schema.make_default()))
+    perfect_plan = (
+        frozenset(schema), shared_defaults, made_defaults, no_defaults)
+    ontic_type._perfect_plan = (schema, perfect_plan)
+    return perfect_plan
+
+
+def _default_copier(default):
+    """The function that copies a collection default, shallowly if its
+    members are immutable, see :func:`_copy_collection`."""
+    if isinstance(default, FROZEN_TYPES):
+        # The default of an interned property schema.
+        return partial(thaw, default)
+    if type(default) in _FLAT_COPY_TYPES and IMMUTABLE_TYPES.issuperset(
+            imap(type, default)) and (
+            type(default) is not dict or
+            IMMUTABLE_TYPES.issuperset(imap(type, default.itervalues()))):
+        return partial(type(default), default)
+    return partial(deepcopy, default)
+
+
 def perfect_object(the_object):
     """Function to ensure complete attribute settings for a given object.
 
@@ -124,8 +1247,12 @@ def perfect_object(the_object):
     object, those properties will be added and set to the default value or
     None, if no default has been set.
 
-    For the collection types (dict, list, set), the default values are deep
-    copied.
+    The default value of a property is made by
+    :meth:`ontic.property_schema.PropertySchema.make_default`. It is the
+    result of the *default_factory* setting, if declared. For the collection
+    types (dict, list, set), the default values are deep copied, or shared as
+    a frozen copy with the *shared_default* setting. The extra properties and
+    the defaults are resolved once per type, see :func:`get_perfect_plan`.
 
     :param the_object: Ab object instance that is to be perfected.
     :type the_object: :class:`ontic.ontic_type.OnticType`
@@ -133,64 +1260,487 @@ def perfect_object(the_object):
     """
     if the_object is None:
         raise ValueError('"the_object" must be provided.')
-    if not isinstance(the_object, OnticType):
+    if not isinstance(the_object, ONTIC_TYPES):
         raise ValueError('"the_object" must be OnticType type.')
 
-    schema = the_object.get_schema()
+    _perfect_object(the_object, get_perfect_plan(type(the_object)))
+
+
+def perfect_many(ontic_type, objects):
+    """Perfect a batch of objects of a given type.
+
+    The objects are those of :func:`perfect_object` for each object. The
+    objects are checked, and the :func:`get_perfect_plan` of *ontic_type*
+    is resolved, once for the batch.
+
+    :param ontic_type: The type of the objects.
+    :type ontic_type: :class:`OnticType` derived class
+    :param objects: The objects to be perfected.
+    :type objects: iterable<:class:`OnticType`>
+    :rtype: None
+    :raises ValueError: If *ontic_type* is not an :class:`OnticType`
+        derived class, or an object is not an instance of *ontic_type*.
+    """
+    if not isinstance(ontic_type, type) or not issubclass(
+            ontic_type, ONTIC_TYPES):
+        raise ValueError('"ontic_type" must be OnticType or child type of '
+                         'OnticType.')
+
+    rows = list(objects)
+    for the_object in rows:
+        if not isinstance(the_object, ontic_type):
+            raise ValueError(
+                'The objects must be instances of "ontic_type".')
+
+    perfect_plan = get_perfect_plan(ontic_type)
+    for the_object in rows:
+        if type(the_object) is ontic_type:
+            _perfect_object(the_object, perfect_plan)
+        else:
+            perfect_object(the_object)
+
 
-    extra_properties = set(the_object.keys()) - set(schema.keys())
-    for property_name in extra_properties:
-        del the_object[property_name]
+def _perfect_object(the_object, perfect_plan):
+    """Perfect an object with a perfect plan.
 
-    for property_name, property_schema in schema.iteritems():
-        if property_name not in the_object:
-            the_object[property_name] = None
+    The properties are assigned at once, so that an object that validates
+    on assignment is validated once.
+    """
+    names, shared_defaults, made_defaults, no_defaults = perfect_plan
+    if not names.issuperset(the_object):
+        for name in [key for key in the_object if key not in names]:
+            del the_object[name]
 
-        if the_object[property_name] is None \
-                and property_schema.default is not None:
-            if TYPE_MAP.get(property_schema.type) in COLLECTION_TYPES:
-                the_object[property_name] = deepcopy(property_schema.default)
-            else:
-                the_object[property_name] = property_schema.default
+    get = the_object.get
+    values = {}
+    for name, default in shared_defaults:
+        if get(name) is None:
+            values[name] = default
+    for name, make_default in made_defaults:
+        if get(name) is None:
+            values[name] = make_default()
+    for name in no_defaults:
+        if name not in the_object:
+            values[name] = None
+    if values:
+        the_object.update(values)
 
 
-def validate_object(the_object, raise_validation_exception=True):
+def validate_object(the_object, raise_validation_exception=True,
+                    mode='full', records=False):
     """Function that will validate if an object meets the schema requirements.
 
+    Validation is executed by the compiled
+    :class:`~ontic.validation_plan.ValidationPlan` of the object type, see
+    :meth:`OnticType.get_validation_plan`.
+
     :param the_object: An object instant to be validity tested.
     :type the_object: :class:`OnticType`
     :param raise_validation_exception: If True, then *validate_object* will
         throw a *ValueException* upon validation failure. If False, then a
         list of validation errors is returned. Defaults to True.
     :type raise_validation_exception: bool
+    :param mode: In the default *full* mode, all validation errors are
+        collected. Only the properties written since the previous *full*
+        validation of the object are validated again, see
+        :class:`OnticType`. A validation of every property goes through the
+        record memo of the plan, if configured. In the *fast* mode,
+        validation stops at the first failing rule without building error
+        messages, and a bool is returned.
+    :type mode: str
+    :param records: If True, the validation errors are returned as
+        :class:`~ontic.validation_exception.ValidationError` records, whose
+        messages are rendered on access. Else the messages of all of the
+        errors are rendered before they are returned.
+    :type records: bool
     :return: If no validation errors are found, then *None* is
         returned. If validation fails, then a list of the errors is returned
-        if the *raise_validation_exception* is set to True.
-    :rtype: list<str>, None
+        if the *raise_validation_exception* is set to True. In *fast* mode,
+        True is returned for a valid object, else False.
+    :rtype: list<str>, list<ValidationError>, None, bool
     :raises ValueError: If *the_object* is None or not of type
-        :class:`~ontic.ontic_type.OnticType`.
+        :class:`~ontic.ontic_type.OnticType`, or *mode* is not supported.
     :raises ValidationException: A property of *the_object* does not meet
-        schema requirements.
+        schema requirements. The exception carries the failures as
+        :class:`~ontic.validation_exception.ValidationError` records, whose
+        messages are rendered on access. In *fast* mode, the exception
+        carries no validation errors.
     """
-    if not isinstance(the_object, OnticType):
+    if not isinstance(the_object, ONTIC_TYPES):
         raise ValueError(
             'Validation can only support validation of objects derived from '
             'ontic.ontic_type.OnticType.')
 
-    value_errors = []
+    if mode == 'fast':
+        if is_valid(the_object):
+            return True
+        if raise_validation_exception:
+            raise ValidationException()
+        return False
+    validation_plan.check_validation_mode(mode)
 
-    for property_name in the_object.get_schema().keys():
-        value_errors.extend(validate_value(property_name, the_object, False))
+    if isinstance(the_object, CompactOnticType):
+        value_errors = the_object.get_validation_plan().validate(the_object)
+    else:
+        value_errors = _validate_tracked(the_object)
 
     if value_errors and raise_validation_exception:
         raise ValidationException(value_errors)
 
+    if records:
+        return value_errors
+    return [str(error) for error in value_errors]
+
+
+def get_ensure_plan(ontic_type):
+    """The plan that perfects and validates the objects of a type.
+
+    The plan is derived from the schema and the validation plan of the
+    type, see :func:`perfect_and_validate`. It is cached on the type, see
+    :meth:`OnticType.clear_validation_plan`.
+
+    :param ontic_type: The type whose objects are to be perfected and
+        validated.
+    :type ontic_type: :class:`OnticType` derived class
+    :return: The property names of the schema, and a step for each
+        property in the order of the validation plan. A step is the name of
+        the property, its
+        :class:`~ontic.validation_plan.PropertyValidator`, the default
+        assigned by reference, and the function that makes a new default,
+        see :func:`get_perfect_plan`.
+    :rtype: tuple<frozenset<str>, list<tuple>>
+    """
+    schema = ontic_type.get_schema()
+    plan = ontic_type.get_validation_plan()
+    cached = ontic_type.__dict__.get('_ensure_plan')
+    if cached is not None and cached[0] is schema and cached[1] is plan:
+        return cached[2]
+
+    names, shared_defaults, made_defaults, _ = get_perfect_plan(ontic_type)
+    shared_defaults = dict(shared_defaults)
+    made_defaults = dict(made_defaults)
+    steps = [(validator.name, validator,
+              shared_defaults.get(validator.name),
+              made_defaults.get(validator.name))
+             for validator in plan.validators]
+    ensure_plan = (names, steps)
+    ontic_type._ensure_plan = (schema, plan, ensure_plan)
+    return ensure_plan
+
+
+def perfect_and_validate(the_object, raise_validation_exception=True,
+                         records=False):
+    """Perfect an object and validate it, in a single pass.
+
+    The results, and the object, are those of :func:`perfect_object`
+    followed by :func:`validate_object`. The properties that are not
+    declared in the schema are removed, and each declared property is
+    assigned its default value if it is None or missing, and validated, in
+    one pass over the steps of the :func:`get_ensure_plan` of the object
+    type. The objects of a compact or frozen type, or a type that validates
+    on assignment, are perfected and validated in sequence.
+
+    :param the_object: The object to be perfected and validated.
+    :type the_object: :class:`OnticType`
+    :param raise_validation_exception: If True, then a *ValidationException*
+        is raised upon validation failure. If False, then a list of
+        validation errors is returned. Defaults to True.
+    :type raise_validation_exception: bool
+    :param records: If True, the validation errors are returned as
+        :class:`~ontic.validation_exception.ValidationError` records, see
+        :func:`validate_object`.
+    :type records: bool
+    :return: The list of the validation errors, empty if *the_object* is
+        valid.
+    :rtype: list<str>, list<ValidationError>
+    :raises ValueError: If *the_object* is None or not of type
+        :class:`~ontic.ontic_type.OnticType`.
+    :raises ValidationException: A property of *the_object* does not meet
+        schema requirements.
+    """
+    if not isinstance(the_object, ONTIC_TYPES):
+        raise ValueError('"the_object" must be OnticType type.')
+
+    if not _is_ensured_in_place(the_object):
+        perfect_object(the_object)
+        return validate_object(the_object, raise_validation_exception,
+                               records=records)
+
+    value_errors = _perfect_and_validate(
+        the_object, get_ensure_plan(type(the_object)))
+    if value_errors and raise_validation_exception:
+        raise ValidationException(value_errors)
+    if records:
+        return value_errors
+    return [str(error) for error in value_errors]
+
+
+def perfect_and_validate_many(ontic_type, objects):
+    """Perfect and validate a batch of objects of a given type.
+
+    The results, and the objects, are those of :func:`perfect_object` for
+    each object followed by :func:`validate_many` of the batch. The objects
+    are checked, and the :func:`get_perfect_plan` and validation plan of
+    *ontic_type* are resolved, once for the batch. The objects are then
+    perfected one by one, and validated column by column, see
+    :meth:`ontic.validation_plan.ValidationPlan.validate_batch`.
+
+    :param ontic_type: The type of the objects.
+    :type ontic_type: :class:`OnticType` derived class
+    :param objects: The objects to be perfected and validated.
+    :type objects: iterable<:class:`OnticType`>
+    :return: The :class:`~ontic.validation_exception.ValidationError` lists
+        keyed by the index of the failing objects.
+    :rtype: dict<int, list<ValidationError>>
+    :raises ValueError: If *ontic_type* is not an :class:`OnticType`
+        derived class, or an object is not an instance of *ontic_type*.
+    """
+    if not isinstance(ontic_type, type) or not issubclass(
+            ontic_type, ONTIC_TYPES):
+        raise ValueError('"ontic_type" must be OnticType or child type of '
+                         'OnticType.')
+
+    rows = list(objects)
+    for the_object in rows:
+        if not isinstance(the_object, ontic_type):
+            raise ValueError(
+                'The objects must be instances of "ontic_type".')
+
+    perfect_plan = get_perfect_plan(ontic_type)
+    for the_object in rows:
+        if type(the_object) is ontic_type:
+            _perfect_object(the_object, perfect_plan)
+        else:
+            perfect_object(the_object)
+    return ontic_type.get_validation_plan().validate_batch(rows)
+
+
+def _is_ensured_in_place(the_object):
+    """Test whether an object is perfected and validated in one pass."""
+    return isinstance(the_object, OnticType) and not isinstance(
+        the_object, FrozenOnticType) and not the_object.VALIDATE_ON_SET
+
+
+def _perfect_and_validate(the_object, ensure_plan):
+    """Perfect and validate an object with the steps of an ensure plan.
+
+    The validation results of the object are kept, as those of a full
+    validation, see :func:`_validate_tracked`.
+    """
+    names, steps = ensure_plan
+    if not names.issuperset(the_object):
+        for name in [key for key in the_object if key not in names]:
+            dict.__delitem__(the_object, name)
+
+    get = the_object.get
+    plan = the_object.get_validation_plan()
+    if plan.record_memo is not None:
+        # The defaults are applied first, and the whole record is validated
+        # with the record memo.
+        for name, _, default, make_default in steps:
+            if get(name) is None:
+                dict.__setitem__(the_object, name, default
+                                 if make_default is None else make_default())
+        return _validate_memoized(the_object, plan)
+
+    value_errors = []
+    property_errors = {}
+    volatile = set()
+    for name, validator, default, make_default in steps:
+        value = get(name)
+        if value is None:
+            value = default if make_default is None else make_default()
+            dict.__setitem__(the_object, name, value)
+        if not validator.is_valid(value):
+            errors = property_errors[name] = []
+            validator.validate(value, errors)
+            value_errors.extend(errors)
+        if isinstance(value, _MUTABLE_TYPES) and not isinstance(
+                value, FROZEN_TYPES):
+            volatile.add(name)
+
+    the_object._dirty = set()
+    the_object._validation_cache = (plan, property_errors, volatile)
+    return value_errors
+
+
+def _check_assignment(the_object, key, value):
+    """Validate a value on assignment to a property of an object."""
+    validator = the_object.get_validation_plan().validator_map.get(key)
+    if validator is None or validator.is_valid(value):
+        return
+    if value is None and key not in the_object:
+        # An absent property is validated as None, assignment of None does
+        # not change the validity of the object.
+        return
+    value_errors = []
+    validator.validate(value, value_errors)
+    raise ValidationException(value_errors)
+
+
+def _check_assignments(the_object, items):
+    """Validate the values of many assignments before any is assigned."""
+    validator_map = the_object.get_validation_plan().validator_map
+    value_errors = []
+    for key, value in items.iteritems():
+        validator = validator_map.get(key)
+        if validator is not None and not validator.is_valid(value):
+            if value is None and key not in the_object:
+                continue
+            validator.validate(value, value_errors)
+    if value_errors:
+        raise ValidationException(value_errors)
+
+
+def _validate_tracked(the_object):
+    """Validate the dirty properties of an object, reusing earlier results.
+    """
+    plan = the_object.get_validation_plan()
+    cache = the_object._validation_cache
+    dirty = the_object._dirty
+    get = the_object.get
+
+    if cache is None or cache[0] is not plan or dirty is None:
+        if plan.record_memo is not None:
+            return _validate_memoized(the_object, plan)
+        property_errors = {}
+        volatile = set()
+        validators = plan.validators
+    else:
+        property_errors, volatile = cache[1], cache[2]
+        validator_map = plan.validator_map
+        validators = [validator_map[name] for name in dirty | volatile
+                      if name in validator_map]
+
+    for validator in validators:
+        name = validator.name
+        value = get(name)
+        value_errors = []
+        validator.validate(value, value_errors)
+        if value_errors:
+            property_errors[name] = value_errors
+        else:
+            property_errors.pop(name, None)
+        if isinstance(value, _MUTABLE_TYPES) and not isinstance(
+                value, FROZEN_TYPES):
+            volatile.add(name)
+        else:
+            volatile.discard(name)
+
+    the_object._dirty = set()
+    the_object._validation_cache = (plan, property_errors, volatile)
+
+    if not property_errors:
+        return []
+    return [error for validator in plan.validators
+            for error in property_errors.get(validator.name, ())]
+
+
+def _validate_memoized(the_object, plan):
+    """Validate all of the properties of an object with the record memo of
+    its plan, and keep the results as those of a full validation."""
+    value_errors = list(plan._memo_validate(the_object))
+    property_errors = {}
+    for error in value_errors:
+        property_errors.setdefault(error.path, []).append(error)
+    get = the_object.get
+    volatile = set()
+    for name in plan.validator_map:
+        value = get(name)
+        if isinstance(value, _MUTABLE_TYPES) and not isinstance(
+                value, FROZEN_TYPES):
+            volatile.add(name)
+
+    the_object._dirty = set()
+    the_object._validation_cache = (plan, property_errors, volatile)
     return value_errors
 
 
+def is_valid(the_object):
+    """Fail-fast test of an object against the schema requirements.
+
+    The test stops at the first failing rule, and builds no error messages.
+    It is the equivalent of :func:`validate_object` in *fast* mode, without
+    raising a :class:`~ontic.validation_exception.ValidationException`.
+
+    :param the_object: An object instant to be validity tested.
+    :type the_object: :class:`OnticType`
+    :return: True if *the_object* is valid, else False.
+    :rtype: bool
+    :raises ValueError: If *the_object* is None or not of type
+        :class:`~ontic.ontic_type.OnticType`.
+    """
+    if not isinstance(the_object, ONTIC_TYPES):
+        raise ValueError(
+            'Validation can only support validation of objects derived from '
+            'ontic.ontic_type.OnticType.')
+
+    if isinstance(the_object, FrozenOnticType):
+        # The validation results of a frozen object are kept.
+        return not _validate_tracked(the_object)
+    return the_object.get_validation_plan().is_valid(the_object)
+
+
+def validate_many(ontic_type, objects, mode='full', workers=None,
+                  chunk_size=None):
+    """Validate a batch of objects of a given :class:`OnticType`.
+
+    The schema of *ontic_type* is compiled once for the batch, and the
+    objects are validated property by property, see
+    :meth:`ontic.validation_plan.ValidationPlan.validate_batch`. The
+    objects are not required to be instances of *ontic_type*, any mapping
+    with the properties of the schema can be validated.
+
+    With *workers*, the batch is split into chunks that are validated in a
+    pool of worker processes, see :func:`ontic.parallel.validate_parallel`.
+    The results are the same as those of validation in a single process.
+
+    :param ontic_type: The type whose schema is utilized for validation.
+    :type ontic_type: :class:`OnticType` derived class
+    :param objects: The objects to be validated.
+    :type objects: iterable<:class:`OnticType`>, iterable<dict>
+    :param mode: In the default *full* mode, the validation errors of each
+        failing object are collected. In the *fast* mode, a failure bitmap
+        is returned without building any error records.
+    :type mode: str
+    :param workers: The number of worker processes. If None, the objects
+        are validated in the calling process.
+    :type workers: int, None
+    :param chunk_size: The number of objects sent to a worker per task.
+        Only utilized with *workers*.
+    :type chunk_size: int, None
+    :return: In *full* mode, a dict of the
+        :class:`~ontic.validation_exception.ValidationError` lists keyed by
+        the index of the failing objects. In *fast* mode, a bitmap of the
+        failing objects, see :func:`ontic.validation_plan.bitmap_indexes`.
+    :rtype: dict<int, list<ValidationError>>, bytearray
+    :raises ValueError: If *ontic_type* is not an :class:`OnticType`
+        derived class, *mode* is not supported, or *workers* or
+        *chunk_size* is not a positive int.
+    """
+    if not isinstance(ontic_type, type) or not issubclass(
+            ontic_type, ONTIC_TYPES):
+        raise ValueError('"ontic_type" must be OnticType or child type of '
+                         'OnticType.')
+    validation_plan.check_validation_mode(mode)
+
+    if workers is not None:
+        # Imported on use, so that multiprocessing is not imported with the
+        # module.
+        from ontic import parallel
+        return parallel.validate_parallel(
+            ontic_type.get_schema(), objects, workers, chunk_size, mode)
+
+    plan = ontic_type.get_validation_plan()
+    if mode == 'fast':
+        return plan.check_batch(objects)
+    return plan.validate_batch(objects)
+
+
 def validate_value(property_name,
                    ontic_object,
-                   raise_validation_exception=True):
+                   raise_validation_exception=True,
+                   records=False):
     """Validate a specific value of a given :class:`OnticType` instance.
 
     :param property_name: The value to be validated against the given
@@ -202,10 +1752,14 @@ def validate_value(property_name,
         throw a *ValueException* upon validation failure. If False, then a
         list of validation errors is returned. Defaults to True.
     :type raise_validation_exception: bool
+    :param records: If True, the validation errors are returned as
+        :class:`~ontic.validation_exception.ValidationError` records, see
+        :func:`validate_object`.
+    :type records: bool
     :return: If no validation errors are found, then *None* is
         returned. If validation fails, then a list of the errors is returned
         if the *raise_validation_exception* is set to True.
-    :rtype: list<str>, None
+    :rtype: list<str>, list<ValidationError>, None
     :raises ValueError: If *property_name* is not provided or is not a valid
         string.
     :raises ValueError: If *ontic_object* is None, or not instance of
@@ -223,23 +1777,23 @@ def validate_value(property_name,
     if ontic_object is None:
         raise ValueError(
             '"ontic_object" is required, cannot be None.')
-    if not isinstance(ontic_object, OnticType):
+    if not isinstance(ontic_object, ONTIC_TYPES):
         raise ValueError(
             '"ontic_object" must be OnticType or child type of OnticType.')
 
     value_errors = []
 
-    property_schema = ontic_object.get_schema().get(property_name)
-    if property_schema is None:
+    validator = ontic_object.get_validation_plan().validator_map.get(
+        property_name)
+    if validator is None:
         raise ValueError(
             '"%s" is not a recognized property.' % property_name)
 
-    value = ontic_object.get(property_name, None)
-
-    value_errors.extend(
-        meta_type.validate_value(property_name, property_schema, value))
+    validator.validate(ontic_object.get(property_name, None), value_errors)
 
     if value_errors and raise_validation_exception:
         raise ValidationException(value_errors)
 
-    return value_errors
+    if records:
+        return value_errors
+    return [str(error) for error in value_errors]
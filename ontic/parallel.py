@@ -0,0 +1,176 @@
+"""Parallel validation of large batches of objects in a process pool.
+
+.. contents::
+
+======
+Usage
+======
+
+Validation is pure Python work, and a single process validates a batch on
+a single core. The *parallel* module splits a batch into chunks of rows that
+are validated by a :class:`multiprocessing.Pool` of worker processes.
+
+    >>> from ontic.schema_type import SchemaType
+    >>> schema = SchemaType({'some_property': {'type': 'int', 'min': 3}})
+    >>> rows = [{'some_property': 7}, {'some_property': 1}] * 4
+    >>> row_errors = validate_parallel(schema, rows, workers=2, chunk_size=3)
+    >>> sorted(row_errors.keys())
+    [1, 3, 5, 7]
+    >>> row_errors[1]
+    [ValidationError('some_property', 'min', 1)]
+
+The schema is sent to each worker once, when the worker process starts, and
+is compiled into a :class:`ontic.validation_plan.ValidationPlan` by the
+worker. The *default_factory* settings, that are not used by validation and
+may not be pickled, are not sent. The rows are sent as tuples of the schema
+property values, so that the rows of types created with
+:func:`ontic.ontic_type.create_ontic_type`, which cannot be pickled by
+reference, can be validated. The workers return the failures as compact
+``(row_index, path, rule, value)`` tuples, which are rebuilt into
+:class:`ontic.validation_exception.ValidationError` records in the calling
+process.
+
+The results are the same as those of
+:meth:`ontic.validation_plan.ValidationPlan.validate_batch` and
+:meth:`ontic.validation_plan.ValidationPlan.check_batch`.
+
+"""
+from multiprocessing import Pool
+
+from ontic.schema_type import SchemaType
+from ontic.validation_exception import ValidationError
+from ontic.validation_plan import (ValidationPlan, bitmap_indexes,
+                                   check_validation_mode)
+
+# : The number of chunks per worker when no chunk size is given.
+CHUNKS_PER_WORKER = 4
+
+# : The property names and validation plan of a worker process, set by
+# : _init_worker.
+_worker_names = None
+_worker_plan = None
+
+
+def validate_parallel(schema, rows, workers, chunk_size=None, mode='full'):
+    """Validate a batch of objects in a pool of worker processes.
+
+    :param schema: The schema that is utilized for validation.
+    :type schema: :class:`ontic.schema_type.SchemaType`
+    :param rows: The objects to be validated.
+    :type rows: iterable<:class:`ontic.ontic_type.OnticType`>,
+        iterable<dict>
+    :param workers: The number of worker processes.
+    :type workers: int
+    :param chunk_size: The number of rows sent to a worker per task. By
+        default, the batch is split into :data:`CHUNKS_PER_WORKER` chunks
+        per worker.
+    :type chunk_size: int, None
+    :param mode: In the default *full* mode, the validation errors of each
+        failing row are collected. In the *fast* mode, a failure bitmap is
+        returned without building any error records.
+    :type mode: str
+    :return: In *full* mode, a dict of the
+        :class:`~ontic.validation_exception.ValidationError` lists keyed by
+        the index of the failing rows. In *fast* mode, a bitmap of the
+        failing rows, see :func:`ontic.validation_plan.bitmap_indexes`.
+    :rtype: dict<int, list<ValidationError>>, bytearray
+    :raises ValueError: If *workers* or *chunk_size* is not a positive int,
+        or *mode* is not supported.
+    """
+    check_workers(workers)
+    if chunk_size is not None and (
+            not isinstance(chunk_size, (int, long)) or chunk_size < 1):
+        raise ValueError('"chunk_size" must be a positive int.')
+    check_validation_mode(mode)
+
+    names = schema.keys()
+    chunk = [tuple(row.get(name) for name in names) for row in rows]
+    row_count = len(chunk)
+    if chunk_size is None:
+        chunk_size = max(
+            1, -(-row_count // (workers * CHUNKS_PER_WORKER)))
+    tasks = [(start, mode, chunk[start:start + chunk_size])
+             for start in xrange(0, row_count, chunk_size)]
+    del chunk
+
+    pool = Pool(workers, _init_worker,
+                (names, [_worker_settings(schema[name]) for name in names]))
+    try:
+        results = pool.map(_validate_chunk, tasks, chunksize=1)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    if mode == 'fast':
+        bitmap = bytearray((row_count + 7) >> 3)
+        for failed_rows in results:
+            for index in failed_rows:
+                bitmap[index >> 3] |= 1 << (index & 7)
+        return bitmap
+
+    row_errors = {}
+    for failures in results:
+        for index, path, rule, value in failures:
+            error = ValidationError(path, rule, value, schema[path])
+            if index in row_errors:
+                row_errors[index].append(error)
+            else:
+                row_errors[index] = [error]
+
+    # The schema of a worker may iterate in a different order, the errors of
+    # each row are reported in the property order of the calling process.
+    order = dict((name, position) for position, name in enumerate(names))
+    for value_errors in row_errors.itervalues():
+        value_errors.sort(key=lambda error: order[error.path])
+    return row_errors
+
+
+def check_workers(workers):
+    """Ensure that a given number of worker processes is supported.
+
+    :param workers: The number of worker processes to be checked.
+    :type workers: int
+    :rtype: None
+    :raises ValueError: If *workers* is not a positive int.
+    """
+    if isinstance(workers, bool) or not isinstance(
+            workers, (int, long)) or workers < 1:
+        raise ValueError('"workers" must be a positive int.')
+
+
+def _worker_settings(property_schema):
+    """The settings of a property schema that are sent to a worker.
+
+    Defaults are not used by validation, and a *default_factory*, that may
+    not be pickled, is not sent.
+    """
+    settings = dict(property_schema)
+    settings.pop('default_factory', None)
+    return settings
+
+
+def _init_worker(names, property_schemas):
+    global _worker_names, _worker_plan
+    _worker_names = names
+    _worker_plan = ValidationPlan(
+        SchemaType(zip(names, property_schemas)))
+
+
+def _validate_chunk(task):
+    start, mode, chunk = task
+    plan = _worker_plan
+    rows = [dict(zip(_worker_names, values)) for values in chunk]
+
+    if mode == 'fast':
+        return [start + index
+                for index in bitmap_indexes(plan.check_batch(rows))]
+
+    failures = []
+    for index, value_errors in plan.validate_batch(rows).iteritems():
+        for error in value_errors:
+            failures.append(
+                (start + index, error.path, error.rule, error.value))
+    return failures
@@ -46,8 +46,9 @@ The most straight forward way to create an instance of a
 >>> prop_schema = PropertySchema(type='str', required=True, min=3)
 >>> prop_schema
 {'regex': None, 'enum': None, 'min': 3, 'default': None, 'max': None, \
-'required': True, 'member_type': None, 'member_min': None, \
-'type': <type 'str'>, 'member_max': None}
+'required': True, 'member_min': None, 'member_type': None, \
+'shared_default': False, 'default_factory': None, 'type': <type 'str'>, \
+'member_max': None}
 
 Demonstrated above is the creation of a property schema of type string. In
 addition the property schema forces the value of the property to required and
@@ -63,6 +64,16 @@ A :class:`PropertySchema` can be created or modified dynamically. If done so,
 then the final schema instance should be validated with the use of the method
 :meth:`validate_property_schema`.
 
+Where many schemas are made from the same property definitions, the
+:func:`intern_property_schema` function returns one shared, read-only
+:class:`InternedPropertySchema` for each distinct definition, and
+:func:`create_property_schema` can skip the meta-schema validation of a
+trusted definition:
+
+>>> intern_property_schema({'type': 'str'}) is intern_property_schema(
+...     {'type': str})
+True
+
 Utilizing Property Schema
 --------------------------
 
@@ -107,50 +118,52 @@ after the table.
 
 .. table:: Property Schema Settings
 
-    ============ ========= ======== ========  =================================
-    Name         Type      Default  Required  Enumeration
-    ============ ========= ======== ========  =================================
-    type         str       None     False     basestring, bool, complex, date,
-                 type                         datetime, dict, float, int, list,
-                                              long, None, set, str, time,
-                                              unicode
-    default      None      None     False
-    required     bool      False    False
-    enum         set       None     False
-    min          complex   None     False
-                 date
-                 datetime
-                 float
-                 int
-                 long
-                 time
-    max          complex   None     False
-                 date
-                 datetime
-                 float
-                 int
-                 long
-                 time
-    regex        str       None     False
-    member_type  str       None     False     basestring, bool, complex, date,
-                 type                         datetime, dict, float, int, list,
-                                              long, None, set, str, time,
-                                              unicode
-    member_min   complex   None     False
-                 date
-                 datetime
-                 float
-                 int
-                 long
-                 time
-    member_max   complex   None     False
-                 date
-                 datetime
-                 float
-                 int
-                 long
-                 time
-    ============ ========= ======== ========  =================================
+    =============== ========= ======== ========  ==============================
+    Name            Type      Default  Required  Enumeration
+    =============== ========= ======== ========  ==============================
+    type            str       None     False     basestring, bool, complex,
+                    type                         date, datetime, dict, float,
+                                                 int, list, long, None, set,
+                                                 str, time, unicode
+    default         None      None     False
+    default_factory callable  None     False
+    shared_default  bool      False    False
+    required        bool      False    False
+    enum            set       None     False
+    min             complex   None     False
+                    date
+                    datetime
+                    float
+                    int
+                    long
+                    time
+    max             complex   None     False
+                    date
+                    datetime
+                    float
+                    int
+                    long
+                    time
+    regex           str       None     False
+    member_type     str       None     False     basestring, bool, complex,
+                    type                         date, datetime, dict, float,
+                                                 int, list, long, None, set,
+                                                 str, time, unicode
+    member_min      complex   None     False
+                    date
+                    datetime
+                    float
+                    int
+                    long
+                    time
+    member_max      complex   None     False
+                    date
+                    datetime
+                    float
+                    int
+                    long
+                    time
+    =============== ========= ======== ========  ==============================
 
 *type*
     The *type* settings restricts a property to a known type. If no type is
@@ -172,7 +185,16 @@ after the table.
 
     For the collection types (dict, list, and set), the default value is deep
     copied. This is done to ensure that there is no sharing of collection
-    instances or values.
+    instances or values, unless the *shared_default* setting is True.
+*default_factory*
+    A callable, that is called without arguments for each default value
+    applied. The *default* and *default_factory* settings are exclusive.
+*shared_default*
+    If True, the default value of a collection type is not copied for each
+    object. A single frozen copy of the default value, that raises a
+    *TypeError* on modification, is shared by the objects. A shared default
+    value is replaced by assignment of another value, or by the modifiable
+    copy returned by :func:`ontic.frozen.thaw`.
 *required*
     A *PropertySchema* with a required setting of *True*, will fail
     validation if the property value is *None*.
@@ -200,6 +222,9 @@ after the table.
     is 'str' and the *regex* setting is not None. When active, the *regex*
     setting will be used to test the given string value.  If the property
     value is 'None', then no regex testing will be done.
+
+    The *regex* setting is compiled when the property schema is perfected,
+    and is available as :attr:`PropertySchema.regex_pattern`.
 *member_type*
     The *member_type* setting is used to restrict the value type for property
     *type* 'list' or 'set'. It does so ensuring that each member of the
@@ -227,13 +252,23 @@ after the table.
 
 """
 
+from copy import deepcopy
+import re
+from weakref import WeakValueDictionary
+
 from meta_type import validate_value, TYPE_MAP
 from ontic.core_type import CoreType
-from ontic.meta_type import (MetaType, TYPE_MAP, COMPARABLE_TYPES)
+from ontic import validation_plan
+from ontic.frozen import FROZEN_TYPES, _read_only, freeze, thaw
+from ontic.meta_type import (MetaType, TYPE_MAP, COLLECTION_TYPES,
+                             COMPARABLE_TYPES)
 from validation_exception import ValidationException
 
 __author__ = 'raulg'
 
+# : The number of times a regex setting has been compiled into a pattern.
+_regex_compile_count = 0
+
 
 class PropertySchema(MetaType):
     """The object type for representing Property schema definitions.
@@ -275,6 +310,9 @@ class PropertySchema(MetaType):
         >>> val_errors = validate_property_schema(nutty_schema)
         >>> assert val_errors == []
     """
+    # Slot storage is kept out of the dict items of the schema definition.
+    __slots__ = ('_regex_pattern', '_frozen_default')
+
     # The schema definition for the **PropertySchema** type.
     ONTIC_SCHEMA = CoreType({
         'type': MetaType({
@@ -301,6 +339,30 @@ class PropertySchema(MetaType):
             'member_min': None,
             'member_max': None,
         }),
+        'default_factory': MetaType({
+            'type': None,
+            'default': None,
+            'required': False,
+            'enum': None,
+            'min': None,
+            'max': None,
+            'regex': None,
+            'member_type': None,
+            'member_min': None,
+            'member_max': None,
+        }),
+        'shared_default': MetaType({
+            'type': bool,
+            'default': False,
+            'required': False,
+            'enum': None,
+            'min': None,
+            'max': None,
+            'regex': None,
+            'member_type': None,
+            'member_min': None,
+            'member_max': None,
+        }),
         'required': MetaType({
             'type': bool,
             'default': False,
@@ -427,20 +489,265 @@ class PropertySchema(MetaType):
 
                 PropertySchema(one=1, two=2)
         """
+        self._regex_pattern = None
+        self._frozen_default = None
+
         super(PropertySchema, self).__init__(*args, **kwargs)
 
         self.perfect()
         self.validate()
 
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    @property
+    def regex_pattern(self):
+        """The compiled pattern of the *regex* setting.
+
+        The pattern is compiled when the property schema is perfected. If the
+        *regex* setting has been changed since, then the pattern is compiled
+        again on access.
+
+        :return: The compiled *regex* setting, or None if no *regex* is set.
+        :rtype: _sre.SRE_Pattern, None
+        """
+        pattern = self._regex_pattern
+        regex = self.get('regex')
+        if pattern is None:
+            if regex:
+                pattern = compile_regex_pattern(self)
+        elif pattern.pattern != regex:
+            pattern = compile_regex_pattern(self)
+        return pattern
+
+    def make_default(self):
+        """The default value of the property for an object being perfected.
+
+        If the *default_factory* setting is declared, it is called for each
+        default value. For the collection types (dict, list, set), the
+        *default* setting is deep copied, or, with the *shared_default*
+        setting, a single frozen copy of the *default* setting is shared,
+        see :mod:`ontic.frozen`. The frozen copy is made once per *default*
+        setting.
+
+        :return: The default value, None if no default is declared.
+        :rtype: object
+        """
+        factory = self.get('default_factory')
+        if factory is not None:
+            return factory()
+        default = self.get('default')
+        if default is None or \
+                TYPE_MAP.get(self.get('type')) not in COLLECTION_TYPES:
+            return default
+        if not self.get('shared_default'):
+            if isinstance(default, FROZEN_TYPES):
+                # The default of an interned property schema.
+                return thaw(default)
+            return deepcopy(default)
+        frozen_default = self._frozen_default
+        if frozen_default is None or frozen_default[0] is not default:
+            frozen_default = self._frozen_default = (default, freeze(default))
+        return frozen_default[1]
+
     def validate(self, raise_validation_exception=True):
         return validate_property_schema(self, raise_validation_exception)
 
+    def is_valid(self):
+        return validate_property_schema(self, False, mode='fast')
+
     def perfect(self):
         perfect_property_schema(self)
 
 
+class InternedPropertySchema(PropertySchema):
+    """A read-only, shared :class:`PropertySchema`.
+
+    Interned property schemas are made by :func:`intern_property_schema`,
+    that returns one shared instance for each distinct property schema
+    definition. An interned property schema is perfected and validated once,
+    when it is made, and any modification of its settings, or of the lists,
+    dicts and sets of its settings, raises a *TypeError*, see
+    :mod:`ontic.frozen`. The validation functions compiled for an interned
+    property schema are shared by the validators of the properties of the
+    same name, see :class:`ontic.validation_plan.PropertyValidator`. The
+    copies of an interned property schema are the instance itself. An
+    interned property schema that is no longer in use is freed.
+
+    :ivar _compiled: The compiled validation functions keyed by property
+        name.
+    :ivar _canonical: The repr of the canonical form of the settings, that
+        is fingerprinted by :func:`ontic.type_registry.schema_fingerprint`,
+        or None until first computed.
+    """
+    __slots__ = ('_compiled', '_canonical', '__weakref__')
+
+    def __init__(self, *args, **kwargs):
+        r"""Initializes in accordance with dict specification.
+
+        The settings are perfected and validated as those of a
+        :class:`PropertySchema`. Use :func:`intern_property_schema` to share
+        the instances of identical settings.
+        """
+        _fill_interned(self, PropertySchema(*args, **kwargs))
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return intern_property_schema, (dict(self), True)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _fill_interned(interned, property_schema):
+    """Copy the settings of a perfected property schema to an interned one.
+    """
+    interned._compiled = {}
+    interned._canonical = None
+    interned._regex_pattern = property_schema._regex_pattern
+    interned._frozen_default = None
+    dict.update(interned, (
+        (name, freeze(value)) for name, value in property_schema.iteritems()))
+
+
+# : The interned property schemas keyed by their definitions, see
+# : :func:`intern_property_schema`. A schema no longer in use is freed.
+_interned = WeakValueDictionary()
+
+
+# : The base types of the frozen containers.
+_THAWED_TYPES = dict(zip(FROZEN_TYPES, (list, dict, set)))
+
+
+def _definition_key(definition):
+    """The hashable form of the settings of a property schema definition.
+    """
+    return frozenset((name, _value_key(value))
+                     for name, value in definition.iteritems())
+
+
+def _value_key(value):
+    """The hashable form of a setting, that tells apart equal values of
+    distinct types, such as 1 and 1.0, at any depth. A frozen container is
+    the same as its base type."""
+    value_type = _THAWED_TYPES.get(type(value), type(value))
+    if isinstance(value, dict):
+        return value_type, frozenset(
+            (_value_key(key), _value_key(member))
+            for key, member in value.iteritems())
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(_value_key(member) for member in value)
+    if isinstance(value, (set, frozenset)):
+        return value_type, frozenset(_value_key(member) for member in value)
+    return value_type, value
+
+
+def create_property_schema(definition, trusted=False):
+    """Create a property schema, optionally without meta-schema validation.
+
+    :param definition: The property schema settings.
+    :type definition: dict
+    :param trusted: If True, the settings are perfected but are not
+        validated against the meta-schema. Only for definitions that have
+        been validated before, or are loaded from a verified source.
+    :type trusted: bool
+    :return: The perfected property schema.
+    :rtype: :class:`PropertySchema`
+    :raises ValueError: If a type, default_factory or regex declaration is
+        illegal.
+    :raises ValidationException: If *trusted* is False and the settings do
+        not meet the meta-schema requirements.
+    """
+    if not trusted:
+        return PropertySchema(definition)
+    property_schema = new_property_schema(definition)
+    perfect_property_schema(property_schema)
+    return property_schema
+
+
+def new_property_schema(settings):
+    """Make a property schema of given settings as they are.
+
+    The settings are neither perfected nor validated. Used to restore
+    property schemas whose settings have been perfected and validated
+    before, such as those of :mod:`ontic.compile`.
+
+    :param settings: The complete, perfected property schema settings.
+    :type settings: dict
+    :return: The property schema of *settings*.
+    :rtype: :class:`PropertySchema`
+    """
+    property_schema = PropertySchema.__new__(PropertySchema)
+    property_schema._regex_pattern = None
+    property_schema._frozen_default = None
+    dict.update(property_schema, settings)
+    return property_schema
+
+
+def intern_property_schema(definition, trusted=False):
+    """Retrieve the shared property schema of a definition.
+
+    Identical definitions, and definitions that are identical once
+    perfected, such as ``{'type': 'str'}`` and ``{'type': str}``, return
+    the same :class:`InternedPropertySchema`. A definition is perfected and
+    validated when first interned. A definition whose settings are not
+    hashable, even when frozen, is not shared.
+
+    :param definition: The property schema settings.
+    :type definition: dict, :class:`PropertySchema`
+    :param trusted: If True, a definition that is first interned is not
+        validated against the meta-schema, see
+        :func:`create_property_schema`.
+    :type trusted: bool
+    :return: The shared property schema.
+    :rtype: :class:`InternedPropertySchema`
+    :raises ValueError: If a type, default_factory or regex declaration is
+        illegal.
+    :raises ValidationException: If *trusted* is False and the settings of
+        a definition that is first interned do not meet the meta-schema
+        requirements.
+    """
+    if isinstance(definition, InternedPropertySchema):
+        return definition
+    try:
+        key = _definition_key(definition)
+        interned = _interned.get(key)
+    except TypeError:
+        key = interned = None
+    if interned is not None:
+        return interned
+
+    property_schema = create_property_schema(definition, trusted)
+    interned = InternedPropertySchema.__new__(InternedPropertySchema)
+    _fill_interned(interned, property_schema)
+    if key is None:
+        return interned
+    # The perfected definition is the key of the shared instance.
+    interned = _interned.setdefault(
+        _definition_key(property_schema), interned)
+    _interned[key] = interned
+    return interned
+
+
+def clear_interned_property_schemas():
+    """Drop the shared property schemas made by
+    :func:`intern_property_schema`.
+
+    The schemas already in use are not modified.
+
+    :rtype: None
+    """
+    _interned.clear()
+
+
 def validate_property_schema(candidate_property_schema,
-                             raise_validation_exception=True):
+                             raise_validation_exception=True,
+                             mode='full'):
     """Method to validate a property schema definition.
 
     :param candidate_property_schema: The schema property to be validated.
@@ -449,12 +756,17 @@ def validate_property_schema(candidate_property_schema,
         will throw a *ValueException* upon validation failure. If False,
         then a list of validation errors is returned. Defaults to True.
     :type raise_validation_exception: bool
+    :param mode: In the default *full* mode, all validation errors are
+        collected. In the *fast* mode, validation stops at the first failing
+        setting without building error messages, and a bool is returned.
+    :type mode: str
     :return: If no validation errors are found, then *None* is
         returned. If validation fails, then a list of the errors is returned
-        if the *raise_validation_exception* is set to True.
-    :rtype: list<str>, None
+        if the *raise_validation_exception* is set to True. In *fast* mode,
+        True is returned for a valid property schema, else False.
+    :rtype: list<str>, None, bool
     :raises ValueError: *the_candidate_schema_property* is not an
-        :class:`~ontic.ontic_type.OnticType`.
+        :class:`~ontic.ontic_type.OnticType`, or *mode* is not supported.
     :raises ValidationException: A property of *candidate_property_schema*
         does not meet schema requirements.
     """
@@ -464,14 +776,26 @@ def validate_property_schema(candidate_property_schema,
         raise ValueError(
             '"candidate_property_schema" must be PropertySchema type.')
 
-    value_errors = list()
-
-    for schema_name, schema_setting in (
-            candidate_property_schema.get_schema().iteritems()):
-        setting_value = candidate_property_schema.get(schema_name, None)
-
-        value_errors.extend(
-            validate_value(schema_name, schema_setting, setting_value))
+    if isinstance(candidate_property_schema, InternedPropertySchema):
+        # Interned property schemas are validated when interned.
+        validation_plan.check_validation_mode(mode)
+        return True if mode == 'fast' else []
+
+    plan = validation_plan.get_validation_plan(
+        type(candidate_property_schema))
+    if mode == 'fast':
+        if plan.is_valid(candidate_property_schema):
+            return True
+        if raise_validation_exception:
+            raise ValidationException()
+        return False
+    validation_plan.check_validation_mode(mode)
+
+    # The error messages are only built for an invalid property schema.
+    if plan.is_valid(candidate_property_schema):
+        return []
+    value_errors = [str(error)
+                    for error in plan.validate(candidate_property_schema)]
 
     if value_errors and raise_validation_exception:
         raise ValidationException(value_errors)
@@ -499,38 +823,93 @@ def perfect_property_schema(candidate_property_schema):
     if not isinstance(candidate_property_schema, PropertySchema):
         raise ValueError(
             '"candidate_property_schema" must be PropertySchema type.')
+    if isinstance(candidate_property_schema, InternedPropertySchema):
+        # Interned property schemas are perfected when interned.
+        return
 
     schema_property_schema = candidate_property_schema.get_schema()
+    # The settings are accessed as dict items, rather than attributes, as
+    # the schemas of wide types perfect many property schemas.
+    get = candidate_property_schema.get
 
     # remove un-necessary properties.
-    extra_properties = set(candidate_property_schema.keys()) - set(
-        schema_property_schema.keys())
+    extra_properties = [
+        property_name for property_name in candidate_property_schema
+        if property_name not in schema_property_schema]
     for property_name in extra_properties:
         del candidate_property_schema[property_name]
 
-    if 'type' in candidate_property_schema:
-        # ensure that the type declaration is valid
-        if candidate_property_schema.type not in TYPE_MAP:
-            raise ValueError('Illegal type declaration: %s' %
-                             candidate_property_schema.type)
-        # coerce type declarations as string to base types.
-        candidate_property_schema.type = TYPE_MAP.get(
-            candidate_property_schema.type, None)
-    else:
-        candidate_property_schema.type = None
-
-    if 'member_type' in candidate_property_schema:
-        # coerce member_type declarations as string to base types.
-        candidate_property_schema.member_type = TYPE_MAP[
-            candidate_property_schema.member_type]
-    else:
-        candidate_property_schema.member_type = None
+    type_setting = get('type')
+    # ensure that the type declaration is valid
+    if type_setting not in TYPE_MAP:
+        raise ValueError('Illegal type declaration: %s' % type_setting)
+    # coerce type declarations as string to base types.
+    candidate_property_schema['type'] = TYPE_MAP[type_setting]
+
+    # coerce member_type declarations as string to base types.
+    candidate_property_schema['member_type'] = TYPE_MAP[get('member_type')]
+
+    default_factory = get('default_factory')
+    if default_factory is not None:
+        if not callable(default_factory):
+            raise ValueError('Illegal default_factory declaration: %s' %
+                             default_factory)
+        if get('default') is not None:
+            raise ValueError(
+                'The "default" and "default_factory" settings are exclusive.')
 
     for property_name, property_schema in (
             schema_property_schema.iteritems()):
-        if property_name not in candidate_property_schema:
-            candidate_property_schema[
-                property_name] = property_schema.default
-            continue
-        if not candidate_property_schema[property_name]:
-            candidate_property_schema[property_name] = property_schema.default
+        if not get(property_name):
+            candidate_property_schema[property_name] = property_schema[
+                'default']
+
+    compile_regex_pattern(candidate_property_schema)
+
+
+def compile_regex_pattern(candidate_property_schema):
+    """Compile the *regex* setting of a given property schema.
+
+    The compiled pattern is held by the property schema and is utilized by
+    the scalar and member regex validations. Each compilation is counted, see
+    :func:`get_regex_compile_count`.
+
+    :param candidate_property_schema: The property schema whose *regex*
+        setting is to be compiled.
+    :type candidate_property_schema: :class:`property_schema.PropertySchema`
+    :return: The compiled pattern, or None if no *regex* is set.
+    :rtype: _sre.SRE_Pattern, None
+    :raises ValueError: If the *regex* setting is not a valid regular
+        expression.
+    """
+    global _regex_compile_count
+
+    regex = candidate_property_schema.get('regex')
+    if not regex:
+        pattern = None
+    elif not isinstance(regex, basestring):
+        # Reported by meta-schema validation.
+        pattern = None
+    else:
+        try:
+            pattern = re.compile(regex)
+        except re.error as error:
+            raise ValueError(
+                'Illegal regex declaration: %s (%s)' % (regex, error))
+        _regex_compile_count += 1
+
+    candidate_property_schema._regex_pattern = pattern
+    return pattern
+
+
+def get_regex_compile_count():
+    """The number of times a *regex* setting has been compiled.
+
+    Compilation happens when a property schema is perfected, and when the
+    *regex* setting of a property schema has been changed since the last
+    compilation.
+
+    :return: The count of regex compilations in the process.
+    :rtype: int
+    """
+    return _regex_compile_count
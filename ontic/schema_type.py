@@ -51,10 +51,34 @@ and :meth:`validate_schema`.
     >>> perfect_schema(a_schema)
     >>> errors = validate_schema(a_schema)
 
+Where many schemas are made from the same property definitions, the
+:meth:`create_schema` function shares one read-only property schema per
+distinct definition::
+
+    >>> schema_1 = create_schema({'name': {'type': 'str'}}, interned=True)
+    >>> schema_2 = create_schema({'name': {'type': str}}, interned=True)
+    >>> schema_1['name'] is schema_2['name']
+    True
+
+Where many schemas are defined but few are used, a lazy schema makes each
+property schema the first time it is read. The :meth:`materialize_schema`
+function makes them all at once::
+
+    >>> lazy_schema = create_schema({'name': {'type': 'str'}}, lazy=True)
+    >>> isinstance(dict.get(lazy_schema, 'name'), PropertySchema)
+    False
+    >>> lazy_schema['name'].type
+    <type 'str'>
+    >>> materialize_schema(lazy_schema)
+
 """
+from copy import deepcopy
+
 from core_type import CoreType
+from ontic import validation_plan
 from ontic.validation_exception import ValidationException
-from property_schema import (PropertySchema, validate_property_schema,
+from property_schema import (PropertySchema, create_property_schema,
+                             intern_property_schema, validate_property_schema,
                              perfect_property_schema)
 
 
@@ -76,6 +100,7 @@ class SchemaType(CoreType):
     For a complete list of :class:`ontic.meta_type.PropertySchema`, see
     :ref:`property-schema-settings-table`.
     """
+    __slots__ = ()
 
     def __init__(self, *args, **kwargs):
         r"""Initializes in accordance with dict specification.
@@ -110,6 +135,147 @@ class SchemaType(CoreType):
     def validate(self):
         return validate_schema(self)
 
+    def is_valid(self):
+        return validate_schema(self, False, mode='fast')
+
+    def materialize(self):
+        materialize_schema(self)
+
+
+class LazySchemaType(SchemaType):
+    """A schema whose property schemas are made on first use.
+
+    The property schema definitions are kept as given, and each is made
+    into a :class:`ontic.property_schema.PropertySchema`, and validated,
+    the first time it is read. Where many schemas are defined but few are
+    used, such as a schema catalog loaded by a command line tool, the
+    unused property schemas cost next to nothing. A *LazySchemaType* is
+    made by :func:`create_schema`, and :meth:`materialize` makes all of its
+    property schemas at once.
+
+    A definition that does not meet the meta-schema requirements raises
+    the :class:`ontic.validation_exception.ValidationException` where its
+    property schema is first read, rather than where the schema is made.
+    """
+    __slots__ = ('_options',)
+
+    def __init__(self, *args, **kwargs):
+        # The definitions are kept as they are, see __getitem__.
+        CoreType.__init__(self, *args, **kwargs)
+        self._options = (False, False)
+
+    def __getitem__(self, name):
+        value = dict.__getitem__(self, name)
+        if isinstance(value, PropertySchema):
+            return value
+        interned, trusted = self._options
+        make = intern_property_schema if interned else create_property_schema
+        property_schema = make(value, trusted)
+        dict.__setitem__(self, name, property_schema)
+        return property_schema
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            dict.__setitem__(self, name, default)
+        return self[name]
+
+    def pop(self, name, *default):
+        if name not in self:
+            return dict.pop(self, name, *default)
+        property_schema = self[name]
+        dict.__delitem__(self, name)
+        return property_schema
+
+    def popitem(self):
+        if not self:
+            raise KeyError('popitem(): dictionary is empty')
+        name = next(iter(self))
+        return name, self.pop(name)
+
+    def itervalues(self):
+        for name in self:
+            yield self[name]
+
+    def iteritems(self):
+        for name in self:
+            yield name, self[name]
+
+    def values(self):
+        return list(self.itervalues())
+
+    def items(self):
+        return list(self.iteritems())
+
+    def __eq__(self, other):
+        materialize_schema(self)
+        if isinstance(other, LazySchemaType):
+            materialize_schema(other)
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reduce__(self):
+        return create_schema, (dict(self), ) + self._options + (True, )
+
+    def __copy__(self):
+        return create_schema(dict(self), *self._options, lazy=True)
+
+    def __deepcopy__(self, memo):
+        return create_schema(
+            deepcopy(dict(self), memo), *self._options, lazy=True)
+
+
+def create_schema(definition, interned=False, trusted=False, lazy=False):
+    """Create a :class:`SchemaType` from a schema definition.
+
+    Unlike the *SchemaType* constructor, the property schemas may be
+    shared, made without meta-schema validation, or made on first use. This
+    is of use where many schemas are made from identical property schema
+    definitions, or where few of many schemas are used.
+
+    :param definition: The property schema definitions keyed by property
+        name.
+    :type definition: dict
+    :param interned: If True, the property schemas are the shared, read-only
+        instances of :func:`ontic.property_schema.intern_property_schema`.
+    :type interned: bool
+    :param trusted: If True, the property schema definitions are not
+        validated against the meta-schema, see
+        :func:`ontic.property_schema.create_property_schema`.
+    :type trusted: bool
+    :param lazy: If True, a :class:`LazySchemaType` is returned, whose
+        property schemas are made as set out by *interned* and *trusted*
+        the first time they are read.
+    :type lazy: bool
+    :return: The schema of the property schema definitions.
+    :rtype: :class:`SchemaType`
+    :raises ValueError: *definition* is not a dict, or a property schema
+        declaration is illegal.
+    :raises ValidationException: If *trusted* and *lazy* are False and a
+        property schema definition does not meet the meta-schema
+        requirements.
+    """
+    if not isinstance(definition, dict):
+        raise ValueError('"definition" must be a dict.')
+    if lazy:
+        schema = LazySchemaType(definition)
+        schema._options = (bool(interned), bool(trusted))
+        return schema
+    if interned:
+        make = intern_property_schema
+    elif trusted:
+        make = create_property_schema
+    else:
+        return SchemaType(definition)
+    return SchemaType(
+        (name, make(property_schema, trusted))
+        for name, property_schema in definition.iteritems())
+
 
 def perfect_schema(candidate_schema):
     """Method to clean and perfect a given schema.
@@ -131,7 +297,34 @@ def perfect_schema(candidate_schema):
         perfect_property_schema(property_schema)
 
 
-def validate_schema(candidate_schema, raise_validation_exception=True):
+def materialize_schema(candidate_schema):
+    """Make the property schemas of a schema that are not made yet.
+
+    The property schemas of a :class:`LazySchemaType` are made and
+    validated, so that an invalid definition is found at once, rather than
+    where its property schema is first read. The property schemas of other
+    schemas are made with the schema, and are left as they are.
+
+    :param candidate_schema: The schema whose property schemas are made.
+    :type candidate_schema: :class:`SchemaType`
+    :rtype: None
+    :raises ValueError: *candidate_schema* is None, or not of type
+        :class:`SchemaType`, or a property schema declaration is illegal.
+    :raises ValidationException: A property schema definition does not
+        meet the meta-schema requirements.
+    """
+    if candidate_schema is None:
+        raise ValueError('"candidate_schema" must be provided.')
+    if not isinstance(candidate_schema, SchemaType):
+        raise ValueError('"candidate_schema" must be of SchemaType.')
+
+    for name in candidate_schema:
+        # Reading a property schema of a LazySchemaType makes it.
+        candidate_schema[name]
+
+
+def validate_schema(candidate_schema, raise_validation_exception=True,
+                    mode='full'):
     """Validate a given :class:`SchemaType`.
 
     This method will iterate through all of the
@@ -147,12 +340,18 @@ def validate_schema(candidate_schema, raise_validation_exception=True):
         throw a *ValidationException* upon validation failure. If False, then a
         list of validation errors is returned. Defaults to True.
     :type raise_validation_exception: bool
+    :param mode: In the default *full* mode, all validation errors are
+        collected. In the *fast* mode, validation stops at the first failing
+        property schema setting without building error messages, and a bool
+        is returned.
+    :type mode: str
     :return: If no validation errors are found, then *None* is
         returned. If validation fails, then a list of the errors is returned,
-        if the *raise_value_error* is not set to True.
-    :rtype: list<str>, None
+        if the *raise_value_error* is not set to True. In *fast* mode, True
+        is returned for a valid schema, else False.
+    :rtype: list<str>, None, bool
     :raises ValueError: *candidate_schema* is None, or not of type
-        :class:`SchemaType`.
+        :class:`SchemaType`, or *mode* is not supported.
     :raises ValidationException: A property of *candidate_schema* does not
         meet schema requirements.
     """
@@ -161,6 +360,16 @@ def validate_schema(candidate_schema, raise_validation_exception=True):
     if not isinstance(candidate_schema, SchemaType):
         raise ValueError('"candidate_schema" must be of SchemaType.')
 
+    if mode == 'fast':
+        for candidate_property_schema in candidate_schema.itervalues():
+            if not validate_property_schema(
+                    candidate_property_schema, False, mode='fast'):
+                if raise_validation_exception:
+                    raise ValidationException()
+                return False
+        return True
+    validation_plan.check_validation_mode(mode)
+
     value_errors = []
     for candidate_property_schema in candidate_schema.values():
         value_errors.extend(
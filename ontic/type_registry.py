@@ -0,0 +1,334 @@
+"""A registry of *Ontic* types keyed by name and schema fingerprint.
+
+.. contents::
+
+======
+Usage
+======
+
+Types created with :func:`ontic.ontic_type.create_ontic_type` are not bound
+to a module attribute, and cannot be found again by module and name. The
+*type_registry* module identifies such types by their name and the
+fingerprint of their schema, so that a type can be rebuilt from its schema
+once per process and found again by its key.
+
+The fingerprint of a schema is a digest of the schema settings that does not
+depend on the iteration order of the schema::
+
+    >>> from ontic.schema_type import SchemaType
+    >>> fingerprint = schema_fingerprint(SchemaType(
+    ...     prop_1={'type': 'int'}, prop_2={'type': 'str'}))
+    >>> fingerprint == schema_fingerprint(SchemaType(
+    ...     prop_2={'type': 'str'}, prop_1={'type': 'int'}))
+    True
+    >>> fingerprint == schema_fingerprint(SchemaType(prop_1={'type': 'int'}))
+    False
+
+A type is registered with :func:`register_type`, and found again with
+:func:`get_registered_type`::
+
+    >>> from ontic.ontic_type import create_ontic_type
+    >>> some_type = create_ontic_type('SomeType', {'prop': {'type': 'int'}})
+    >>> key = register_type(some_type)
+    >>> get_registered_type(key) is some_type
+    True
+
+The registry does not keep a type alive for ever. It holds weak references
+to the registered types, and strong references to the most recently used
+types only, at most :data:`DEFAULT_CAPACITY` unless changed with
+:func:`set_registry_capacity`. A type that is neither recently used nor
+referenced elsewhere, such as by its instances, is freed and drops out of
+the registry. The :func:`registry_stats` function counts the lookups and
+the live types::
+
+    >>> sorted(registry_stats())
+    ['capacity', 'evictions', 'hits', 'live', 'misses', 'retained']
+
+A type made by :func:`ontic.ontic_type.create_ontic_type` with the
+*registered* option is looked up before it is made, so that repeated
+definitions of a type share one class and its compiled caches.
+
+"""
+from functools import partial
+from hashlib import sha1
+import sys
+import weakref
+
+from ontic.memo import LRUCache, check_capacity
+from ontic.property_schema import InternedPropertySchema
+
+# : The default number of recently used types that are kept alive by the
+# : registry.
+DEFAULT_CAPACITY = 1024
+
+# : Weak references to the registered types, keyed by (name, schema
+# : fingerprint).
+_registry = {}
+
+# : The names of the registered types, keyed by schema fingerprint.
+_names = {}
+
+# : The most recently used registered types, or None if no registered type
+# : is kept alive by the registry.
+_recent = LRUCache(DEFAULT_CAPACITY)
+
+# : The lookups of registered types.
+_lookups = {'hits': 0, 'misses': 0}
+
+# : The setting value types whose canonical form is their repr.
+_REPR_TYPES = frozenset((
+    bool, float, int, long, str, unicode, type(None)))
+
+
+def schema_fingerprint(schema):
+    """Compute the fingerprint of a schema.
+
+    :param schema: The schema to be fingerprinted.
+    :type schema: :class:`ontic.schema_type.SchemaType`
+    :return: The hex digest of the canonical form of the schema settings.
+    :rtype: str
+    """
+    # The repr of the sorted canonical items of the schema, from the repr
+    # of each property schema, that is cached for interned property schemas.
+    items = sorted((_canonical(name), _canonical_repr(property_schema))
+                   for name, property_schema in schema.iteritems())
+    return sha1('[%s]' % ', '.join(
+        '(%r, %s)' % item for item in items)).hexdigest()
+
+
+def type_key(ontic_type):
+    """The registry key of an *Ontic* type.
+
+    :param ontic_type: The type whose key is requested.
+    :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+    :return: The name and schema fingerprint of *ontic_type*.
+    :rtype: tuple<str, str>
+    """
+    return ontic_type.__name__, schema_fingerprint(ontic_type.get_schema())
+
+
+def register_type(ontic_type, fingerprint=None):
+    """Register an *Ontic* type under its name and schema fingerprint.
+
+    A type registered under the key of a previously registered type
+    replaces the previous type. The registry keeps a weak reference to the
+    type, and a strong reference while the type is one of the most recently
+    used, see :func:`set_registry_capacity`.
+
+    :param ontic_type: The type to be registered.
+    :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+    :param fingerprint: The schema fingerprint of *ontic_type*, computed if
+        None.
+    :type fingerprint: str, None
+    :return: The registry key of *ontic_type*, see :func:`type_key`.
+    :rtype: tuple<str, str>
+    """
+    if fingerprint is None:
+        key = type_key(ontic_type)
+    else:
+        key = ontic_type.__name__, fingerprint
+    _registry[key] = weakref.ref(ontic_type, partial(_remove, key))
+    _names.setdefault(key[1], set()).add(key[0])
+    if _recent is not None:
+        _recent.put(key, ontic_type)
+    return key
+
+
+def get_registered_type(key):
+    """Find a registered *Ontic* type by its registry key.
+
+    The type found becomes the most recently used type.
+
+    :param key: The name and schema fingerprint of the type.
+    :type key: tuple<str, str>
+    :return: The registered type, or None if no type is registered under
+        *key*.
+    :rtype: :class:`ontic.ontic_type.OnticType` derived class, None
+    """
+    reference = _registry.get(key)
+    ontic_type = reference() if reference is not None else None
+    if ontic_type is None:
+        _lookups['misses'] += 1
+        return None
+    _lookups['hits'] += 1
+    if _recent is not None and _recent.get(key) is None:
+        _recent.put(key, ontic_type)
+    return ontic_type
+
+
+def find_registered_types(fingerprint):
+    """Find the registered *Ontic* types of a schema fingerprint.
+
+    Of use where a type is to be found by its schema alone, such as when
+    deserializing data that is tagged with a schema fingerprint.
+
+    :param fingerprint: The schema fingerprint, see
+        :func:`schema_fingerprint`.
+    :type fingerprint: str
+    :return: The registered types of the fingerprint, sorted by name.
+    :rtype: list<:class:`ontic.ontic_type.OnticType` derived class>
+    """
+    found = []
+    for name in sorted(_names.get(fingerprint, ())):
+        ontic_type = get_registered_type((name, fingerprint))
+        if ontic_type is not None:
+            found.append(ontic_type)
+    return found
+
+
+def unregister_type(ontic_type):
+    """Remove an *Ontic* type from the registry.
+
+    :param ontic_type: The type to be removed.
+    :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+    :rtype: None
+    """
+    key = type_key(ontic_type)
+    reference = _registry.get(key)
+    if reference is not None and reference() is ontic_type:
+        _discard(key)
+        if _recent is not None:
+            _recent.pop(key)
+
+
+def set_registry_capacity(capacity):
+    """Set the number of recently used types kept alive by the registry.
+
+    The registered types stay registered while they are referenced
+    elsewhere, and are kept alive again once they are used.
+
+    :param capacity: The number of recently used types that are kept
+        alive. None or 0 keep no type alive.
+    :type capacity: int, None
+    :rtype: None
+    :raises ValueError: If *capacity* is not None or a non-negative int.
+    """
+    global _recent
+    check_capacity(capacity)
+    _recent = LRUCache(capacity) if capacity else None
+
+
+def registry_stats():
+    """The counters of the registry.
+
+    :return: The *hits* and *misses* of the registry lookups, the number of
+        *live* registered types, the number of types *retained* by the
+        registry, its *capacity*, and the number of types it stopped
+        retaining as *evictions*.
+    :rtype: dict<str, int>
+    """
+    recent = _recent.stats() if _recent is not None else {}
+    return {
+        'hits': _lookups['hits'],
+        'misses': _lookups['misses'],
+        'live': len(_registry),
+        'retained': recent.get('size', 0),
+        'capacity': recent.get('capacity', 0),
+        'evictions': recent.get('evictions', 0),
+    }
+
+
+def clear_registry():
+    """Remove all of the registered types, and reset the counters.
+
+    :rtype: None
+    """
+    _registry.clear()
+    _names.clear()
+    if _recent is not None:
+        _recent.clear()
+    _lookups['hits'] = _lookups['misses'] = 0
+
+
+def _remove(key, reference):
+    """Drop the key of a type that has been freed."""
+    # The module globals are None while the interpreter shuts down.
+    if _registry is not None and _registry.get(key) is reference:
+        _discard(key)
+
+
+def _discard(key):
+    del _registry[key]
+    names = _names[key[1]]
+    names.discard(key[0])
+    if not names:
+        del _names[key[1]]
+
+
+def _canonical_repr(property_schema):
+    if isinstance(property_schema, InternedPropertySchema):
+        # The settings of an interned property schema cannot change, and
+        # the repr of its canonical form is computed once.
+        if property_schema._canonical is None:
+            property_schema._canonical = repr(_canonical(property_schema))
+        return property_schema._canonical
+    return repr(_canonical(property_schema))
+
+
+def is_importable(value):
+    """Test whether a value is found again by its module and name.
+
+    :param value: The value to be tested, such as a type or a function.
+    :type value: object
+    :return: True if *value* is the attribute of its module by its name.
+    :rtype: bool
+    """
+    name = getattr(value, '__name__', None)
+    module = sys.modules.get(getattr(value, '__module__', None))
+    return isinstance(name, basestring) and \
+        getattr(module, name, None) is value
+
+
+def is_portable(schema):
+    """Test whether the settings of a schema are rebuilt in other processes.
+
+    The settings are portable unless they hold a callable, such as a lambda
+    or closure *default_factory*, that is not found by module and name, see
+    :func:`is_importable`. The fingerprint of a schema that is not portable
+    holds the identities of such callables, and is the same in this process
+    and the processes it forks only.
+
+    :param schema: The schema to be tested.
+    :type schema: :class:`ontic.schema_type.SchemaType`
+    :return: True if the settings of *schema* can be pickled.
+    :rtype: bool
+    """
+    return all(_is_portable(property_schema)
+               for property_schema in schema.itervalues())
+
+
+def _is_portable(value):
+    if type(value) in _REPR_TYPES:
+        return True
+    if callable(value):
+        return is_importable(value)
+    if isinstance(value, dict):
+        return all(_is_portable(key) and _is_portable(item)
+                   for key, item in value.iteritems())
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return all(_is_portable(item) for item in value)
+    return True
+
+
+def _canonical(value):
+    if type(value) in _REPR_TYPES:
+        return repr(value)
+    if callable(value):
+        # Types and functions, such as default factories, by reference.
+        if is_importable(value):
+            return '%s.%s' % (value.__module__, value.__name__)
+        # Other callables, such as lambdas and closures, by identity. A
+        # registered type keeps the callables of its schema alive, so that
+        # their identities are not reused while the type is registered.
+        return '<%s at %#x>' % (type(value).__name__, id(value))
+    if isinstance(value, dict):
+        return sorted(
+            (_canonical(key), _canonical(item))
+            for key, item in value.iteritems())
+    if isinstance(value, (set, frozenset)):
+        return ('set', sorted(_canonical(item) for item in value))
+    if isinstance(value, (list, tuple)):
+        # A frozen list is the same as a list, see ontic.frozen.
+        return ('list' if isinstance(value, list) else 'tuple',
+                [_canonical(item) for item in value])
+    return repr(value)
@@ -1,4 +1,167 @@
-"""An exception to signal a validation failure."""
+"""An exception to signal a validation failure.
+
+Validation failures are recorded as :class:`ValidationError` instances. A
+*ValidationError* is a lightweight record of the property path, the rule
+that failed, the offending value, and the property schema of the rule. The
+error message of a record is only rendered when it is read, via
+:attr:`ValidationError.message` or ``str()``. A :class:`ValidationException`
+holds the records, and renders their messages on first access. The lists
+of errors returned by :func:`ontic.ontic_type.validate_object` and the
+other validation functions are rendered as they are returned, unless the
+records are requested with their *records* argument.
+
+    >>> from ontic.property_schema import PropertySchema
+    >>> error = ValidationError(
+    ...     'some_prop', 'max', 'frog', PropertySchema(type='str', max=3))
+    >>> error.rule
+    'max'
+    >>> str(error)
+    'The value of "frog" for "some_prop" fails max of 3.'
+
+"""
+from ontic.meta_type import STRING_TYPES
+
+
+class ValidationError(object):
+    """A structured record of a single validation failure.
+
+    :ivar path: The name of the property that failed validation.
+    :ivar rule: The code of the failing rule. One of the keys of
+        :data:`MESSAGE_RENDERERS`.
+    :ivar value: The offending value. For the member rules of a collection
+        property, this is the offending member.
+    :ivar property_schema: The property schema that declares the rule.
+    """
+    __slots__ = ('path', 'rule', 'value', 'property_schema')
+
+    def __init__(self, path, rule, value=None, property_schema=None):
+        """Record a validation failure.
+
+        :param path: The name of the property that failed validation.
+        :type path: str
+        :param rule: The code of the failing rule.
+        :type rule: str
+        :param value: The offending value.
+        :type value: object
+        :param property_schema: The property schema that declares the rule.
+        :type property_schema: :class:`ontic.property_schema.PropertySchema`
+        """
+        self.path = path
+        self.rule = rule
+        self.value = value
+        self.property_schema = property_schema
+
+    def __reduce__(self):
+        return (type(self),
+                (self.path, self.rule, self.value, self.property_schema))
+
+    def __eq__(self, other):
+        if not isinstance(other, ValidationError):
+            return NotImplemented
+        return (self.path == other.path and self.rule == other.rule and
+                self.value == other.value and
+                self.property_schema == other.property_schema)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'ValidationError(%r, %r, %r)' % (self.path, self.rule,
+                                                 self.value)
+
+    def __str__(self):
+        return self.message
+
+    @property
+    def message(self):
+        """The rendered error message of the validation failure.
+
+        :rtype: str
+        """
+        return MESSAGE_RENDERERS[self.rule](self)
+
+
+def _render_required(error):
+    return 'The value for "%s" is required.' % error.path
+
+
+def _render_type(error):
+    return 'The value for "%s" is not of type "%s": %s' % (
+        error.path, error.property_schema.type, str(error.value))
+
+
+def _render_enum(error):
+    return 'The value "%s" for "%s" not in enumeration %s.' % (
+        error.value, error.path, list(error.property_schema.enum))
+
+
+def _render_min(error):
+    return 'The value of "%s" for "%s" fails min of %s.' % (
+        error.value, error.path, error.property_schema.min)
+
+
+def _render_max(error):
+    return 'The value of "%s" for "%s" fails max of %s.' % (
+        error.value, error.path, error.property_schema.max)
+
+
+def _render_regex(error):
+    return 'Value "%s" for %s does not meet regex: %s' % (
+        error.value, error.path, error.property_schema.regex)
+
+
+def _render_member_enum(error):
+    return 'The value "%s" for "%s" not in enumeration %s.' % (
+        error.value, error.path, sorted(list(error.property_schema.enum)))
+
+
+def _render_member_type(error):
+    return 'The value "%s" for "%s" is not of type "%s".' % (
+        str(error.value), error.path, error.property_schema.member_type)
+
+
+def _render_member_regex(error):
+    return 'Value "%s" for "%s" does not meet regex: %s' % (
+        error.value, error.path, error.property_schema.regex)
+
+
+def _render_member_min(error):
+    if error.property_schema.member_type in STRING_TYPES:
+        message = 'The value of "%s" for "%s" fails min length of %s.'
+    else:
+        message = 'The value of "%s" for "%s" fails min size of %s.'
+    return message % (
+        error.value, error.path, error.property_schema.member_min)
+
+
+def _render_member_max(error):
+    if error.property_schema.member_type in STRING_TYPES:
+        message = 'The value of "%s" for "%s" fails max length of %s.'
+    else:
+        message = 'The value of "%s" for "%s" fails max size of %s.'
+    return message % (
+        error.value, error.path, error.property_schema.member_max)
+
+
+# : The message renderer of each validation rule code.
+MESSAGE_RENDERERS = {
+    'required': _render_required,
+    'type': _render_type,
+    'enum': _render_enum,
+    'min': _render_min,
+    'max': _render_max,
+    'regex': _render_regex,
+    'member_enum': _render_member_enum,
+    'member_type': _render_member_type,
+    'member_regex': _render_member_regex,
+    'member_min': _render_member_min,
+    'member_max': _render_member_max,
+}
 
 
 class ValidationException(Exception):
@@ -8,18 +171,47 @@ class ValidationException(Exception):
         """
 
         :param validation_errors: A list of validation failures that are
-            triggering the *ValidationException*.
-        :type validation_errors: list<str>
+            triggering the *ValidationException*. The failures may be given
+            as :class:`ValidationError` records or as error message strings.
+        :type validation_errors: list<ValidationError>, list<str>
         """
-        self._validation_errors = validation_errors if validation_errors else []
-        message = str.join(' \n', validation_errors)
-        super(ValidationException, self).__init__(message)
+        self._errors = validation_errors if validation_errors else []
+        self._validation_errors = None
+        super(ValidationException, self).__init__()
+
+    def __reduce__(self):
+        return type(self), (self._errors,)
+
+    def __str__(self):
+        return self.message
+
+    @property
+    def errors(self):
+        """The validation failures that triggered the *ValidationException*.
+
+        :return: The failures as given to the exception, without rendering
+            any error messages.
+        :rtype: list<ValidationError>, list<str>
+        """
+        return self._errors
+
+    @property
+    def message(self):
+        """The rendered validation error messages, one failure per line.
+
+        :rtype: str
+        """
+        return str.join(' \n', self.validation_errors)
 
     @property
     def validation_errors(self):
         """List of validation errors that triggered the *ValidationException*.
 
+        The error messages are rendered on first access.
+
         :return: A list of the validation errors encountered.
         :rtype: list<str>
         """
+        if self._validation_errors is None:
+            self._validation_errors = [str(error) for error in self._errors]
         return self._validation_errors
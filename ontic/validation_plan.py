@@ -0,0 +1,819 @@
+"""Compiled validation plans for schema defined **Ontic** types.
+
+.. contents::
+
+======
+Usage
+======
+
+The generic validation functions in :mod:`ontic.meta_type` decide, for each
+value, which of the schema settings apply before any check is run. The
+*validation_plan* module moves those decisions to a one time compilation
+step. Each :class:`ontic.property_schema.PropertySchema` is compiled into a
+:class:`PropertyValidator` that only contains the checks the property schema
+actually declares, and a :class:`ontic.schema_type.SchemaType` is compiled
+into a :class:`ValidationPlan` of property validators.
+
+    >>> from ontic.schema_type import SchemaType
+    >>> plan = ValidationPlan(SchemaType({
+    ...     'some_property': {'type': 'int', 'required': True, 'min': 3},
+    ... }))
+    >>> plan.validate({'some_property': 7})
+    []
+    >>> errors = plan.validate({'some_property': 1})
+    >>> errors
+    [ValidationError('some_property', 'min', 1)]
+    >>> str(errors[0])
+    'The value of "1" for "some_property" fails min of 3.'
+
+The errors are reported as :class:`ontic.validation_exception.ValidationError`
+records, whose messages are only rendered when read.
+
+The plan of an :class:`ontic.ontic_type.OnticType` derived class is compiled
+on first use and cached on the class. It is retrieved with
+:func:`get_validation_plan`. A cached plan is recompiled when the class is
+assigned a different *ONTIC_SCHEMA*. If a schema is modified in place, the
+cached plan of the class must be dropped with :func:`clear_validation_plan`.
+
+Where only the outcome of validation is of interest, the *fast* validation
+mode stops at the first failing rule and builds no error messages::
+
+    >>> plan.is_valid({'some_property': 1})
+    False
+
+Where the same values are validated repeatedly, the results of validation
+can be memoized with :meth:`ValidationPlan.configure_memo`. The value memo
+of a property validator caches the failing rules of the scalar values of
+:data:`MEMOIZABLE_TYPES`. The record memo of a plan caches the errors of
+whole records whose property values are hashable. Both are
+:class:`ontic.memo.LRUCache` instances, whose counters are reported by
+:meth:`ValidationPlan.memo_stats`. For an
+:class:`ontic.ontic_type.OnticType`, the memos are configured by the
+*VALUE_MEMO_CAPACITY* and *RECORD_MEMO_CAPACITY* class attributes when the
+plan is compiled.
+
+
+"""
+from datetime import date
+from functools import partial
+from itertools import imap
+from operator import gt, lt
+
+from ontic.memo import LRUCache, check_capacity
+from ontic.meta_type import (BOUNDABLE_TYPES, COLLECTION_TYPES,
+                             COMPARABLE_TYPES, STRING_TYPES)
+from ontic.validation_exception import ValidationError
+
+# : The validation modes. The *full* mode collects all of the validation
+# : errors, the *fast* mode stops at the first failing rule.
+VALIDATION_MODES = ('full', 'fast')
+
+# : The immutable value types whose validation results are memoized by the
+# : value memo. Values of the same type that are equal fail the same rules.
+MEMOIZABLE_TYPES = frozenset((bool, int, long, float, str, unicode, date))
+
+# : The value types that are keyed on their type and value by the record
+# : memo. Values of other types are keyed on the types of their members too.
+_RECORD_KEY_TYPES = MEMOIZABLE_TYPES.union((type(None), ))
+
+
+class PropertyValidator(object):
+    """The compiled validation rules for a single property.
+
+    :ivar name: The name of the property being validated.
+    :ivar property_schema: The property schema the validator was compiled
+        from.
+    :ivar validate: A function with the signature
+        ``validate(value, value_errors)`` that appends the
+        :class:`~ontic.validation_exception.ValidationError` records of
+        *value* to the *value_errors* list.
+    :ivar is_valid: A function with the signature ``is_valid(value)`` that
+        returns True if *value* is valid. It stops at the first failing rule
+        and reports no errors.
+    :ivar memo: The value memo of the validator, or None if the validation
+        results are not memoized, see :meth:`memoize`.
+    """
+
+    def __init__(self, name, property_schema):
+        """Compile a validator for a named property.
+
+        :param name: The name of the property to be validated.
+        :type name: str
+        :param property_schema: The property schema that contains the
+            validation rules.
+        :type property_schema: :class:`ontic.property_schema.PropertySchema`
+        """
+        self.name = name
+        self.property_schema = property_schema
+        # The functions compiled for an interned property schema are shared,
+        # see :func:`ontic.property_schema.intern_property_schema`.
+        compiled = getattr(property_schema, '_compiled', None)
+        functions = compiled.get(name) if compiled is not None else None
+        if functions is None:
+            rules = compile_rules(name, property_schema)
+            functions = (_build_validate(name, property_schema, rules),
+                         _build_check(property_schema, rules))
+            if compiled is not None:
+                compiled[name] = functions
+        self.validate = self._validate = functions[0]
+        self.is_valid = self._is_valid = functions[1]
+        self.memo = None
+
+    def memoize(self, capacity):
+        """Memoize the validation results of repeated scalar values.
+
+        The memo is keyed on the type and the value of the values of
+        :data:`MEMOIZABLE_TYPES`, other values are always validated. The
+        values of collection properties are never memoized.
+
+        :param capacity: The maximum number of memoized values. If None or
+            0, the memo is dropped.
+        :type capacity: int, None
+        :rtype: None
+        :raises ValueError: If *capacity* is not None or a non-negative int.
+        """
+        check_capacity(capacity)
+        if not capacity or self.property_schema.type in COLLECTION_TYPES:
+            self.validate = self._validate
+            self.is_valid = self._is_valid
+            self.memo = None
+            return
+        self.memo = LRUCache(capacity)
+        self.validate, self.is_valid = _build_memo_functions(
+            self.name, self.property_schema, self._validate, self._is_valid,
+            self.memo)
+
+
+class ValidationPlan(object):
+    """The compiled validation rules for a complete schema.
+
+    :ivar schema: The schema the plan was compiled from.
+    :ivar validators: The :class:`PropertyValidator` of each schema property,
+        in the iteration order of the schema.
+    :ivar validator_map: The :class:`PropertyValidator` instances keyed by
+        property name.
+    :ivar record_memo: The record memo of the plan, or None if the
+        validation results of records are not memoized, see
+        :meth:`configure_memo`.
+    """
+
+    def __init__(self, schema):
+        """Compile the validators for each property of a schema.
+
+        :param schema: The schema to be compiled.
+        :type schema: :class:`ontic.schema_type.SchemaType`
+        """
+        self.schema = schema
+        self.validators = tuple(
+            PropertyValidator(name, property_schema)
+            for name, property_schema in schema.iteritems())
+        self.validator_map = dict(
+            (validator.name, validator) for validator in self.validators)
+        self._names = tuple(validator.name for validator in self.validators)
+        self.record_memo = None
+        self._link_steps()
+
+    def _link_steps(self):
+        self._steps = tuple(
+            (validator.name, validator.validate)
+            for validator in self.validators)
+        self._checks = tuple(
+            (validator.name, validator.is_valid)
+            for validator in self.validators)
+
+    def configure_memo(self, value_capacity=None, record_capacity=None):
+        """Configure the memoization of validation results.
+
+        :param value_capacity: The capacity of the value memo of each
+            property validator, see :meth:`PropertyValidator.memoize`. If
+            None or 0, values are not memoized.
+        :type value_capacity: int, None
+        :param record_capacity: The capacity of the record memo. If None or
+            0, records are not memoized. The record memo is keyed on the
+            types and values of the schema properties of a record, and on
+            the types of the members of collection values. Records with
+            unhashable property values are not memoized.
+        :type record_capacity: int, None
+        :rtype: None
+        :raises ValueError: If a capacity is not None or a non-negative int.
+        """
+        check_capacity(value_capacity)
+        check_capacity(record_capacity)
+        for validator in self.validators:
+            validator.memoize(value_capacity)
+        self._link_steps()
+        self.record_memo = LRUCache(
+            record_capacity) if record_capacity else None
+
+    def memo_stats(self):
+        """The counters of the memos of the plan.
+
+        :return: The :meth:`ontic.memo.LRUCache.stats` of the record memo,
+            under the *records* key, and of the value memo of each property,
+            keyed by property name, under the *values* key. A memo that is
+            not configured is reported as None.
+        :rtype: dict
+        """
+        return {
+            'records': _memo_stats(self.record_memo),
+            'values': dict(
+                (validator.name, _memo_stats(validator.memo))
+                for validator in self.validators),
+        }
+
+    def validate(self, the_object):
+        """Validate an object against the compiled schema.
+
+        :param the_object: The object to be validated.
+        :type the_object: :class:`ontic.ontic_type.OnticType`, dict
+        :return: The list of the validation errors found. The list is empty
+            if *the_object* is valid.
+        :rtype: list<:class:`~ontic.validation_exception.ValidationError`>
+        """
+        if self.record_memo is not None:
+            return list(self._memo_validate(the_object))
+        return self._validate_steps(the_object)
+
+    def _validate_steps(self, the_object):
+        value_errors = []
+        get = the_object.get
+        for name, validate in self._steps:
+            validate(get(name), value_errors)
+        return value_errors
+
+    def _memo_validate(self, the_object):
+        get = the_object.get
+        values = tuple(get(name) for name in self._names)
+        value_types = tuple(imap(type, values))
+        try:
+            if _RECORD_KEY_TYPES.issuperset(value_types):
+                key = (value_types, values)
+            else:
+                # Hashable containers, such as frozen lists, are keyed on the
+                # types of their members as well.
+                hash(values)
+                key = tuple(imap(_value_key, values))
+            value_errors = self.record_memo.get(key)
+        except TypeError:
+            # A record with unhashable values is not memoized.
+            return self._validate_steps(the_object)
+        if value_errors is None:
+            value_errors = tuple(self._validate_steps(the_object))
+            self.record_memo.put(key, value_errors)
+        return value_errors
+
+    def is_valid(self, the_object):
+        """Fail-fast test of an object against the compiled schema.
+
+        The test stops at the first failing rule, and no error list or error
+        message is created.
+
+        :param the_object: The object to be tested.
+        :type the_object: :class:`ontic.ontic_type.OnticType`, dict
+        :return: True if *the_object* is valid, else False.
+        :rtype: bool
+        """
+        if self.record_memo is not None:
+            return not self._memo_validate(the_object)
+        get = the_object.get
+        for name, is_valid in self._checks:
+            if not is_valid(get(name)):
+                return False
+        return True
+
+    def validate_batch(self, rows):
+        """Validate a batch of objects column by column.
+
+        Each property validator is applied to the property value of every
+        row before the next property is validated. Values are first tested
+        with the fail-fast check, and only the failing values are validated
+        for the error records.
+
+        :param rows: The objects to be validated.
+        :type rows: list<:class:`ontic.ontic_type.OnticType`>, list<dict>
+        :return: The validation errors of each failing row, keyed by the row
+            index. Valid rows have no entry.
+        :rtype: dict<int, list<ValidationError>>
+        """
+        rows = _as_sequence(rows)
+        row_errors = {}
+        if self.record_memo is not None:
+            # Rows are validated whole, so that duplicate rows are memoized.
+            for index, row in enumerate(rows):
+                value_errors = self._memo_validate(row)
+                if value_errors:
+                    row_errors[index] = list(value_errors)
+            return row_errors
+        for validator in self.validators:
+            name = validator.name
+            is_valid = validator.is_valid
+            validate = validator.validate
+            column = [row.get(name) for row in rows]
+            for index, value in enumerate(column):
+                if not is_valid(value):
+                    if index in row_errors:
+                        validate(value, row_errors[index])
+                    else:
+                        value_errors = row_errors[index] = []
+                        validate(value, value_errors)
+        return row_errors
+
+    def check_batch(self, rows):
+        """Fail-fast test of a batch of objects column by column.
+
+        :param rows: The objects to be tested.
+        :type rows: list<:class:`ontic.ontic_type.OnticType`>, list<dict>
+        :return: A bitmap with a bit set for each failing row. The bit of
+            row *i* is ``bitmap[i >> 3] & (1 << (i & 7))``, see
+            :func:`bitmap_indexes`.
+        :rtype: bytearray
+        """
+        rows = _as_sequence(rows)
+        bitmap = bytearray((len(rows) + 7) >> 3)
+        if self.record_memo is not None:
+            for index, row in enumerate(rows):
+                if self._memo_validate(row):
+                    bitmap[index >> 3] |= 1 << (index & 7)
+            return bitmap
+        for name, is_valid in self._checks:
+            column = [row.get(name) for row in rows]
+            for index, value in enumerate(column):
+                if not is_valid(value):
+                    bitmap[index >> 3] |= 1 << (index & 7)
+        return bitmap
+
+
+def bitmap_indexes(bitmap):
+    """List the row indexes that are set in a failure bitmap.
+
+    :param bitmap: A failure bitmap as returned by
+        :meth:`ValidationPlan.check_batch`.
+    :type bitmap: bytearray
+    :return: The indexes of the failing rows, in ascending order.
+    :rtype: list<int>
+    """
+    indexes = []
+    for byte_index, byte in enumerate(bitmap):
+        if byte:
+            base = byte_index << 3
+            for bit in xrange(8):
+                if byte & (1 << bit):
+                    indexes.append(base + bit)
+    return indexes
+
+
+def _value_key(value):
+    """The hashable form of a property value, that tells apart equal values
+    of distinct types, such as 1 and 1.0, at any depth."""
+    if isinstance(value, dict):
+        return type(value), frozenset(
+            (_value_key(key), _value_key(member))
+            for key, member in value.iteritems())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(imap(_value_key, value))
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(imap(_value_key, value))
+    return type(value), value
+
+
+def _memo_stats(memo):
+    if memo is None:
+        return None
+    return memo.stats()
+
+
+def _as_sequence(rows):
+    if isinstance(rows, (list, tuple)):
+        return rows
+    return list(rows)
+
+
+def get_validation_plan(meta_class):
+    """Retrieve the compiled validation plan of a schema defined class.
+
+    The plan is compiled on the first request and cached on *meta_class*.
+    The cached plan is reused for as long as the *ONTIC_SCHEMA* of the class
+    is the schema the plan was compiled from. The memos of a compiled plan
+    are configured by the *VALUE_MEMO_CAPACITY* and *RECORD_MEMO_CAPACITY*
+    attributes of *meta_class*, if set, see
+    :meth:`ValidationPlan.configure_memo`.
+
+    :param meta_class: The class whose schema is to be compiled.
+    :type meta_class: :class:`ontic.meta_type.MetaType` derived class
+    :return: The validation plan for the schema of *meta_class*.
+    :rtype: :class:`ValidationPlan`
+    """
+    schema = meta_class.get_schema()
+    plan = meta_class.__dict__.get('_validation_plan')
+    if plan is None or plan.schema is not schema:
+        plan = ValidationPlan(schema)
+        value_capacity = getattr(meta_class, 'VALUE_MEMO_CAPACITY', None)
+        record_capacity = getattr(meta_class, 'RECORD_MEMO_CAPACITY', None)
+        if value_capacity or record_capacity:
+            plan.configure_memo(value_capacity, record_capacity)
+        meta_class._validation_plan = plan
+    return plan
+
+
+def check_validation_mode(mode):
+    """Ensure that a given validation mode is supported.
+
+    :param mode: The validation mode to be checked.
+    :type mode: str
+    :rtype: None
+    :raises ValueError: If *mode* is not one of :data:`VALIDATION_MODES`.
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError('"mode" must be one of %s.' % (VALIDATION_MODES,))
+
+
+def clear_validation_plan(meta_class):
+    """Drop the cached validation plan of a schema defined class.
+
+    Used when the schema of *meta_class* has been modified in place, so that
+    the next validation compiles a new plan.
+
+    :param meta_class: The class whose cached plan is to be dropped.
+    :type meta_class: :class:`ontic.meta_type.MetaType` derived class
+    :rtype: None
+    """
+    if '_validation_plan' in meta_class.__dict__:
+        del meta_class._validation_plan
+
+
+def compile_value_validator(key, property_schema):
+    """Compile the validation function for a given property schema.
+
+    The returned function applies the same rules as
+    :func:`ontic.meta_type.validate_value`, but only contains the checks that
+    are declared by *property_schema*. The errors are reported as
+    :class:`~ontic.validation_exception.ValidationError` records, that render
+    to the messages of :func:`ontic.meta_type.validate_value`.
+
+    :param key: The name of the property to be validated.
+    :type key: str
+    :param property_schema: The property schema that contains the validation
+        rules.
+    :type property_schema: :class:`ontic.property_schema.PropertySchema`
+    :return: A function with the signature ``validate(value, value_errors)``.
+    :rtype: function
+    """
+    return _build_validate(
+        key, property_schema, compile_rules(key, property_schema))
+
+
+def compile_value_check(property_schema):
+    """Compile the fail-fast check function for a given property schema.
+
+    The returned function evaluates the same rules as
+    :func:`compile_value_validator`, but stops at the first failing rule and
+    does not report any errors.
+
+    :param property_schema: The property schema that contains the validation
+        rules.
+    :type property_schema: :class:`ontic.property_schema.PropertySchema`
+    :return: A function with the signature ``is_valid(value)`` returning
+        True if the value is valid, else False.
+    :rtype: function
+    """
+    return _build_check(property_schema, compile_rules(None, property_schema))
+
+
+def compile_rules(key, property_schema):
+    """Compile the rules declared by a property schema for non-None values.
+
+    Each rule is a pair of functions. The first, ``passes(value)``, returns
+    a true value if the rule holds for the value. The second,
+    ``report(value, value_errors)``, appends the
+    :class:`~ontic.validation_exception.ValidationError` records of a value
+    for which the rule does not hold. The type and required rules are not
+    part of the compiled rules, as they gate the execution of all the other
+    rules.
+
+    :param key: The name of the property, utilized in the error messages.
+    :type key: str
+    :param property_schema: The property schema that contains the validation
+        rules.
+    :type property_schema: :class:`ontic.property_schema.PropertySchema`
+    :return: The compiled rules in order of execution.
+    :rtype: tuple<tuple<function, function>>
+    """
+    value_type = property_schema.type
+
+    if not value_type:
+        rules = _compile_untyped_rules(key, property_schema)
+    elif value_type in COLLECTION_TYPES:
+        rules = _compile_collection_rules(key, property_schema)
+    else:
+        rules = _compile_singular_rules(key, property_schema)
+
+    return tuple(rules)
+
+
+def _build_validate(key, property_schema, rules):
+    required = property_schema.required
+    value_type = property_schema.type
+
+    def validate(value, value_errors):
+        if value is None:
+            if required:
+                value_errors.append(
+                    ValidationError(key, 'required', None, property_schema))
+            return
+
+        if value_type and not isinstance(value, value_type):
+            value_errors.append(
+                ValidationError(key, 'type', value, property_schema))
+            return
+
+        for passes, report in rules:
+            if not passes(value):
+                report(value, value_errors)
+
+    return validate
+
+
+def _build_check(property_schema, rules):
+    required = property_schema.required
+    value_type = property_schema.type
+    predicates = tuple(passes for passes, report in rules)
+
+    def is_valid(value):
+        if value is None:
+            return not required
+
+        if value_type and not isinstance(value, value_type):
+            return False
+
+        for passes in predicates:
+            if not passes(value):
+                return False
+        return True
+
+    return is_valid
+
+
+def _build_memo_functions(key, property_schema, validate, is_valid, memo):
+    get = memo.get
+    put = memo.put
+
+    def failing_rules(value, value_type):
+        memo_key = (value_type, value)
+        rules = get(memo_key)
+        if rules is None:
+            value_errors = []
+            validate(value, value_errors)
+            rules = tuple(error.rule for error in value_errors)
+            put(memo_key, rules)
+        return rules
+
+    def memo_validate(value, value_errors):
+        value_type = type(value)
+        if value_type not in MEMOIZABLE_TYPES:
+            validate(value, value_errors)
+            return
+        for rule in failing_rules(value, value_type):
+            value_errors.append(
+                ValidationError(key, rule, value, property_schema))
+
+    def memo_is_valid(value):
+        value_type = type(value)
+        if value_type not in MEMOIZABLE_TYPES:
+            return is_valid(value)
+        return not failing_rules(value, value_type)
+
+    return memo_validate, memo_is_valid
+
+
+def _build_report(key, rule, property_schema):
+    def report(value, value_errors):
+        value_errors.append(ValidationError(key, rule, value, property_schema))
+
+    return report
+
+
+def _compile_untyped_rules(key, property_schema):
+    enum = property_schema.enum
+    if not enum:
+        return []
+
+    def enum_passes(value):
+        return value in enum
+
+    return [(enum_passes, _build_report(key, 'enum', property_schema))]
+
+
+def _compile_singular_rules(key, property_schema):
+    rules = _compile_untyped_rules(key, property_schema)
+    value_type = property_schema.type
+
+    rules.extend(_compile_bound_rules(key, property_schema))
+
+    if property_schema.regex and value_type in STRING_TYPES:
+        match = property_schema.regex_pattern.match
+
+        def regex_passes(value):
+            return value is '' or match(value)
+
+        rules.append(
+            (regex_passes, _build_report(key, 'regex', property_schema)))
+
+    return rules
+
+
+def _compile_collection_rules(key, property_schema):
+    rules = _compile_bound_rules(key, property_schema)
+
+    if property_schema.type in {list, set}:
+        member_rules = tuple(_compile_member_rules(key, property_schema))
+        if member_rules:
+            rules.append(_build_members_rule(member_rules))
+
+    return rules
+
+
+def _build_members_rule(member_rules):
+    """Build the rule of the member rules of a list or set property.
+
+    Each member rule is a tuple of the rule code, ``passes(member_value)``,
+    ``report(member_value, value_errors)`` and ``all_pass(value)``. The
+    *all_pass* function tests a rule for all members of a collection in a
+    single bulk operation. Only where a bulk test fails are the members
+    tested one by one, and only for the rules that failed. A bulk test that
+    raises a TypeError, such as for incomparable members, is resolved by
+    the member by member test.
+    """
+    predicates = tuple(rule[1] for rule in member_rules)
+    aggregates = tuple(
+        (rule_code, all_pass, (passes, report))
+        for rule_code, passes, report, all_pass in member_rules)
+    reports = tuple(rule[1:3] for rule in member_rules)
+
+    def each_member_passes(value):
+        for member_value in value:
+            for passes in predicates:
+                if not passes(member_value):
+                    return False
+        return True
+
+    def members_passes(value):
+        if not value:
+            return True
+        try:
+            for rule_code, all_pass, rule in aggregates:
+                if not all_pass(value):
+                    return False
+        except TypeError:
+            return each_member_passes(value)
+        return True
+
+    def failing_rules(value):
+        failing = []
+        for rule_code, all_pass, rule in aggregates:
+            try:
+                if all_pass(value):
+                    continue
+            except TypeError:
+                pass
+            if rule_code == 'member_type':
+                # Members of other types are tested against every rule.
+                return reports
+            failing.append(rule)
+        return failing
+
+    def members_report(value, value_errors):
+        rules = failing_rules(value)
+        for member_value in value:
+            for passes, report in rules:
+                if not passes(member_value):
+                    report(member_value, value_errors)
+
+    return members_passes, members_report
+
+
+def _compile_bound_rules(key, property_schema):
+    rules = []
+    value_type = property_schema.type
+    minimum = property_schema.min
+    maximum = property_schema.max
+
+    if minimum and (value_type in BOUNDABLE_TYPES or
+                    value_type in COMPARABLE_TYPES):
+        if value_type in BOUNDABLE_TYPES:
+            def min_passes(value):
+                return not len(value) < minimum
+        else:
+            def min_passes(value):
+                return not value < minimum
+
+        rules.append((min_passes, _build_report(key, 'min', property_schema)))
+
+    if maximum and (value_type in BOUNDABLE_TYPES or
+                    value_type in COMPARABLE_TYPES):
+        if value_type in BOUNDABLE_TYPES:
+            def max_passes(value):
+                return not len(value) > maximum
+        else:
+            def max_passes(value):
+                return not value > maximum
+
+        rules.append((max_passes, _build_report(key, 'max', property_schema)))
+
+    return rules
+
+
+def _compile_member_rules(key, property_schema):
+    rules = []
+    enum = property_schema.enum
+    member_type = property_schema.member_type
+    member_min = property_schema.member_min
+    member_max = property_schema.member_max
+
+    if enum:
+        def member_enum_passes(member_value):
+            return member_value in enum
+
+        rules.append(('member_enum', member_enum_passes,
+                      _build_report(key, 'member_enum', property_schema),
+                      enum.issuperset))
+
+    if member_type:
+        def member_type_passes(member_value):
+            return isinstance(member_value, member_type)
+
+        def all_type_pass(value):
+            for value_type in set(imap(type, value)):
+                if not issubclass(value_type, member_type):
+                    return False
+            return True
+
+        rules.append(('member_type', member_type_passes,
+                      _build_report(key, 'member_type', property_schema),
+                      all_type_pass))
+
+    if property_schema.regex and member_type == str:
+        match = property_schema.regex_pattern.match
+
+        def all_regex_pass(value):
+            return all(imap(match, value))
+
+        rules.append(('member_regex', match,
+                      _build_report(key, 'member_regex', property_schema),
+                      all_regex_pass))
+
+    if member_min and (member_type in STRING_TYPES or
+                       member_type in COMPARABLE_TYPES):
+        if member_type in STRING_TYPES:
+            def member_min_passes(member_value):
+                return not len(member_value) < member_min
+
+            def all_min_pass(value):
+                return not min(imap(len, value)) < member_min
+        else:
+            def member_min_passes(member_value):
+                return not member_value < member_min
+
+            all_min_pass = _build_all_bound_pass(
+                member_type, min, partial(gt, member_min))
+
+        rules.append(('member_min', member_min_passes,
+                      _build_report(key, 'member_min', property_schema),
+                      all_min_pass))
+
+    if member_max and (member_type in STRING_TYPES or
+                       member_type in COMPARABLE_TYPES):
+        if member_type in STRING_TYPES:
+            def member_max_passes(member_value):
+                return not len(member_value) > member_max
+
+            def all_max_pass(value):
+                return not max(imap(len, value)) > member_max
+        else:
+            def member_max_passes(member_value):
+                return not member_value > member_max
+
+            all_max_pass = _build_all_bound_pass(
+                member_type, max, partial(lt, member_max))
+
+        rules.append(('member_max', member_max_passes,
+                      _build_report(key, 'member_max', property_schema),
+                      all_max_pass))
+
+    return rules
+
+
+def _build_all_bound_pass(member_type, extreme, exceeds):
+    """Build the bulk test of a member bound of comparable members.
+
+    The extreme member of a collection is compared with the bound. As NaN
+    floats do not order, float members are compared with the bound one by
+    one, in a single pass.
+    """
+    if member_type is float:
+        def all_bound_pass(value):
+            return not any(imap(exceeds, value))
+    else:
+        def all_bound_pass(value):
+            return not exceeds(extreme(value))
+
+    return all_bound_pass
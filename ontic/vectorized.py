@@ -0,0 +1,254 @@
+"""Vectorized validation of property columns in batches of objects.
+
+.. contents::
+
+======
+Usage
+======
+
+The *vectorized* module validates a property across a batch of objects in a
+single operation. The property values of a batch are extracted as a column,
+and for numeric, date, and string properties the *required*, *enum*, *min*
+and *max* rules are tested with vectorized comparisons, when
+`NumPy <http://www.numpy.org>`_ is installed. NumPy is an optional
+dependency. Where NumPy is not installed, or a property declares rules that
+cannot be vectorized, the column is tested with the compiled checks of
+:mod:`ontic.validation_plan`, with identical results.
+
+    >>> from ontic.property_schema import PropertySchema
+    >>> mask, failed_rows = check_column(
+    ...     PropertySchema(type='int', min=3, max=10), [3, 1, None, 11, 5])
+    >>> failed_rows
+    [1, 3]
+
+The failure mask holds True for each failing row. It is a
+:class:`numpy.ndarray` of bool when NumPy is utilized, else a list of bool.
+
+The rows of a batch may be :class:`ontic.ontic_type.OnticType` instances or
+plain dicts. The complete schema of a type is tested with
+:func:`check_batch`.
+
+"""
+from datetime import date, datetime
+from itertools import imap
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ontic.meta_type import STRING_TYPES
+from ontic.validation_plan import compile_value_check
+
+# : True if NumPy is installed, and vectorized validation is available.
+NUMPY_AVAILABLE = numpy is not None
+
+# : The property types whose values are compared as NumPy numbers.
+NUMERIC_TYPES = {float, int, long}
+
+# : The property types whose values are compared as NumPy datetime64 values.
+DATE_TYPES = {date: 'datetime64[D]', datetime: 'datetime64[us]'}
+
+
+def extract_column(rows, name):
+    """Extract the values of a property from a batch of objects.
+
+    :param rows: The objects that hold the property.
+    :type rows: list<:class:`ontic.ontic_type.OnticType`>, list<dict>
+    :param name: The name of the property.
+    :type name: str
+    :return: The property value of each row, None for a missing property.
+    :rtype: list
+    """
+    return [row.get(name) for row in rows]
+
+
+def check_column(property_schema, column, use_numpy=None):
+    """Test a column of property values against a property schema.
+
+    :param property_schema: The property schema to test the values against.
+    :type property_schema: :class:`ontic.property_schema.PropertySchema`
+    :param column: The property values to be tested.
+    :type column: list
+    :param use_numpy: If None, NumPy is utilized when installed. If False,
+        the pure Python checks are utilized. If True, NumPy is required.
+    :type use_numpy: bool, None
+    :return: A failure mask with True for each failing value, and the list
+        of the indexes of the failing values.
+    :rtype: tuple<numpy.ndarray, list<int>>, tuple<list<bool>, list<int>>
+    :raises ValueError: If *use_numpy* is True and NumPy is not installed.
+    """
+    return _check_column(
+        property_schema, None, column, _resolve_use_numpy(use_numpy))
+
+
+def check_batch(ontic_type, rows, use_numpy=None):
+    """Test a batch of objects against the schema of an *OnticType*.
+
+    Each property of the schema is tested as a column with
+    :func:`check_column`, and the failures of all columns are combined.
+
+    :param ontic_type: The type whose schema is utilized for validation.
+    :type ontic_type: :class:`ontic.ontic_type.OnticType` derived class
+    :param rows: The objects to be tested.
+    :type rows: iterable<:class:`ontic.ontic_type.OnticType`>,
+        iterable<dict>
+    :param use_numpy: If None, NumPy is utilized when installed. If False,
+        the pure Python checks are utilized. If True, NumPy is required.
+    :type use_numpy: bool, None
+    :return: A failure mask with True for each failing row, and the list of
+        the indexes of the failing rows.
+    :rtype: tuple<numpy.ndarray, list<int>>, tuple<list<bool>, list<int>>
+    :raises ValueError: If *use_numpy* is True and NumPy is not installed.
+    """
+    use_numpy = _resolve_use_numpy(use_numpy)
+    if not isinstance(rows, (list, tuple)):
+        rows = list(rows)
+
+    if use_numpy:
+        mask = numpy.zeros(len(rows), dtype=bool)
+    else:
+        mask = [False] * len(rows)
+
+    for validator in ontic_type.get_validation_plan().validators:
+        column_mask, failed_rows = _check_column(
+            validator.property_schema,
+            validator.is_valid,
+            extract_column(rows, validator.name),
+            use_numpy)
+        if use_numpy:
+            mask |= column_mask
+        else:
+            for index in failed_rows:
+                mask[index] = True
+
+    return mask, _failed_rows(mask)
+
+
+def _resolve_use_numpy(use_numpy):
+    if use_numpy is None:
+        return NUMPY_AVAILABLE
+    if use_numpy and not NUMPY_AVAILABLE:
+        raise ValueError('NumPy is required for vectorized validation.')
+    return bool(use_numpy)
+
+
+def _failed_rows(mask):
+    if isinstance(mask, list):
+        return [index for index, failed in enumerate(mask) if failed]
+    return numpy.flatnonzero(mask).tolist()
+
+
+def _check_column(property_schema, is_valid, column, use_numpy):
+    if use_numpy:
+        mask = _vectorized_mask(property_schema, column)
+        if mask is not None:
+            return mask, _failed_rows(mask)
+
+    if is_valid is None:
+        is_valid = compile_value_check(property_schema)
+    mask = [not is_valid(value) for value in column]
+    if use_numpy:
+        mask = numpy.array(mask, dtype=bool)
+    return mask, _failed_rows(mask)
+
+
+def _vectorized_mask(property_schema, column):
+    """Vectorized failure mask of a column, or None if not vectorizable."""
+    value_type = property_schema.type
+    if value_type in STRING_TYPES:
+        if property_schema.regex:
+            return None
+    elif value_type not in NUMERIC_TYPES and value_type not in DATE_TYPES:
+        return None
+
+    values = [value for value in column if value is not None]
+    value_types = set(imap(type, values))
+    if value_type in DATE_TYPES:
+        # Mixed date and datetime values do not compare, and timezone aware
+        # values are not converted as naive values.
+        if value_types - {value_type}:
+            return None
+        if value_type is datetime and any(
+                value.tzinfo is not None for value in values):
+            return None
+    elif not all(issubclass(a_type, value_type) for a_type in value_types):
+        # Type failures are reported by the compiled checks.
+        return None
+
+    try:
+        value_mask = _value_mask(property_schema, values)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    if value_mask is None:
+        return None
+
+    if len(values) == len(column):
+        return value_mask
+
+    present = numpy.fromiter(
+        (value is not None for value in column), dtype=bool,
+        count=len(column))
+    mask = numpy.empty(len(column), dtype=bool)
+    mask[present] = value_mask
+    mask[~present] = bool(property_schema.required)
+    return mask
+
+
+def _value_mask(property_schema, values):
+    value_type = property_schema.type
+    enum = property_schema.enum
+    minimum = property_schema.min
+    maximum = property_schema.max
+    count = len(values)
+    mask = numpy.zeros(count, dtype=bool)
+    if not count:
+        return mask
+
+    if value_type in STRING_TYPES:
+        if enum:
+            mask |= numpy.fromiter(
+                (value not in enum for value in values), dtype=bool,
+                count=count)
+        if minimum or maximum:
+            lengths = numpy.fromiter(
+                imap(len, values), dtype=numpy.int64, count=count)
+            if minimum:
+                mask |= lengths < minimum
+            if maximum:
+                mask |= lengths > maximum
+        return mask
+
+    if value_type in DATE_TYPES:
+        if any(type(bound) is not value_type
+               for bound in (minimum, maximum) if bound):
+            # Mixed date and datetime bounds do not compare.
+            return None
+        unit = DATE_TYPES[value_type]
+        array = numpy.array(values, dtype=unit)
+        if enum:
+            mask |= numpy.fromiter(
+                (value not in enum for value in values), dtype=bool,
+                count=count)
+        if minimum:
+            mask |= array < numpy.datetime64(minimum, unit[11:-1])
+        if maximum:
+            mask |= array > numpy.datetime64(maximum, unit[11:-1])
+        return mask
+
+    array = numpy.array(values)
+    if array.dtype == object:
+        # Values beyond the range of the NumPy numeric types.
+        return None
+    if enum:
+        if all(type(choice) in NUMERIC_TYPES for choice in enum):
+            mask |= ~numpy.isin(array, list(enum))
+        else:
+            mask |= numpy.fromiter(
+                (value not in enum for value in values), dtype=bool,
+                count=count)
+    if minimum:
+        mask |= array < minimum
+    if maximum:
+        mask |= array > maximum
+    return mask
@@ -0,0 +1,229 @@
+"""Test the compilation of schema files into Python modules."""
+from datetime import date
+import json
+import math
+import os
+import shutil
+from StringIO import StringIO
+import subprocess
+import sys
+import tempfile
+
+from test.test_utils import base_test_case
+
+from ontic import compile as compile_module
+from ontic.ontic_type import OnticType, create_ontic_type, validate_many
+from ontic.schema_type import SchemaType
+from ontic.type_registry import schema_fingerprint
+from ontic.validation_exception import ValidationException
+
+SCHEMA_DEFINITIONS = {
+    'Person': {
+        'name': {'type': 'str', 'required': True, 'min': 1},
+        'age': {'type': 'int', 'min': 0},
+        'born': {'type': 'date'},
+        'tags': {'type': 'list', 'member_type': 'str', 'default': ['new']},
+        'kind': {'type': 'str', 'enum': ['staff', 'guest']},
+    },
+    'Place': {
+        'city': {'type': 'str', 'regex': '^[A-Z]'},
+        'rank': {'type': 'float', 'max': 10.0},
+    },
+}
+
+
+class CompileTest(base_test_case.BaseTestCase):
+    """Schema compilation test cases."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.directory, 'generated')
+        self.source_path = self.write_source('people', SCHEMA_DEFINITIONS)
+
+    def tearDown(self):
+        sys.modules.pop('people', None)
+        shutil.rmtree(self.directory)
+
+    def write_source(self, name, definitions):
+        source_path = os.path.join(self.directory, name + '.json')
+        with open(source_path, 'w') as source_file:
+            json.dump(definitions, source_file)
+        return source_path
+
+    def test_compiled_types(self):
+        """Compiled types have the schemas of their definitions."""
+        module = compile_module.load_compiled_module(
+            self.source_path, self.output_dir)
+        definitions = compile_module.load_schema_file(self.source_path)
+        self.assertSetEqual({'staff', 'guest'},
+                            definitions['Person']['kind']['enum'])
+
+        for name, definition in definitions.iteritems():
+            compiled_type = getattr(module, name)
+            self.assertTrue(issubclass(compiled_type, OnticType))
+            self.assertEqual(name, compiled_type.__name__)
+            self.assertEqual('people', compiled_type.__module__)
+            schema = SchemaType(definition)
+            self.assertDictEqual(schema, compiled_type.ONTIC_SCHEMA)
+            self.assertEqual(schema_fingerprint(schema),
+                             module.SCHEMA_FINGERPRINTS[name])
+
+        records = [
+            {'name': 'Ann', 'age': 3, 'born': date(2000, 1, 1),
+             'kind': 'staff'},
+            {'name': '', 'age': -1, 'born': '2000', 'tags': [1],
+             'kind': 'cat'},
+            {},
+        ]
+        reference_type = create_ontic_type(
+            'Person', definitions['Person'])
+        expected = validate_many(reference_type, records)
+        actual = validate_many(module.Person, records)
+        self.assertListEqual(sorted(expected), sorted(actual))
+        for index in expected:
+            self.assertListEqual(sorted(map(str, expected[index])),
+                                 sorted(map(str, actual[index])))
+        person = module.Person(name='Ann')
+        person.perfect()
+        self.assertListEqual(['new'], person.tags)
+        self.assertListEqual([], person.validate())
+
+    def test_runtime_imports(self):
+        """A compiled module does not import the compiler."""
+        compile_module.compile_schema_file(self.source_path, self.output_dir)
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(
+            __file__)))
+        output = subprocess.check_output([sys.executable, '-c', (
+            'import sys; sys.path.insert(0, %r); import people; '
+            'print(people.Person(name="Ann").validate()); '
+            'print(" ".join(sorted(name for name, module in '
+            'sys.modules.items() if module is not None)))') %
+            self.output_dir], cwd=root_dir)
+        errors, modules = output.splitlines()
+        self.assertEqual('[]', errors)
+        modules = modules.split()
+        self.assertIn('ontic.ontic_type', modules)
+        for name in ('ontic.compile', 'json', 'imp', 'py_compile', 'ast'):
+            self.assertNotIn(name, modules)
+
+    def test_stale_module(self):
+        """A stale module is compiled again."""
+        self.assertTrue(compile_module.is_stale(
+            self.source_path, self.output_dir))
+        module_path, compiled = compile_module.compile_schema_file(
+            self.source_path, self.output_dir)
+        self.assertTrue(compiled)
+        self.assertEqual(
+            os.path.join(self.output_dir, 'people.py'), module_path)
+        self.assertFalse(compile_module.is_stale(
+            self.source_path, self.output_dir))
+        self.assertEqual((module_path, False),
+                         compile_module.compile_schema_file(
+                             self.source_path, self.output_dir))
+        self.assertEqual((module_path, True),
+                         compile_module.compile_schema_file(
+                             self.source_path, self.output_dir, force=True))
+
+        module = compile_module.load_compiled_module(
+            self.source_path, self.output_dir)
+        self.assertIs(module, compile_module.load_compiled_module(
+            self.source_path, self.output_dir))
+
+        definitions = dict(SCHEMA_DEFINITIONS)
+        definitions['Thing'] = {'size': {'type': 'int'}}
+        self.write_source('people', definitions)
+        self.assertTrue(compile_module.is_stale(
+            self.source_path, self.output_dir))
+        module = compile_module.load_compiled_module(
+            self.source_path, self.output_dir)
+        self.assertTrue(hasattr(module, 'Thing'))
+        self.assertFalse(compile_module.is_stale(
+            self.source_path, self.output_dir))
+
+        # A module of another format version is stale.
+        with open(module_path) as module_file:
+            module_source = module_file.read()
+        with open(module_path, 'w') as module_file:
+            module_file.write(module_source.replace(
+                'FORMAT_VERSION = %d' % compile_module.FORMAT_VERSION,
+                'FORMAT_VERSION = 0'))
+        self.assertTrue(compile_module.is_stale(
+            self.source_path, self.output_dir))
+
+    def test_main(self):
+        """The command compiles the stale schema files of a directory."""
+        places_path = self.write_source(
+            'places', {'Place': SCHEMA_DEFINITIONS['Place']})
+        compile_module.compile_schema_file(places_path, self.output_dir)
+
+        stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            self.assertEqual(0, compile_module.main(
+                [self.directory, '-o', self.output_dir]))
+            self.assertEqual(0, compile_module.main(
+                [self.source_path, '-o', self.output_dir, '--force']))
+            output = sys.stdout.getvalue().splitlines()
+        finally:
+            sys.stdout = stdout
+        self.assertListEqual(
+            ['people.py', 'people.pyc', 'places.py', 'places.pyc'],
+            sorted(os.listdir(self.output_dir)))
+        self.assertListEqual(['compiled', 'up to date', 'compiled'],
+                             [line.split(' /')[0] for line in output])
+
+    def test_non_finite_floats(self):
+        """Non-finite float settings are compiled."""
+        source_path = self.write_source('bounds', {'Bounded': {
+            'low': {'type': 'float', 'min': float('-inf'),
+                    'default': float('nan')},
+            'high': {'type': 'float', 'max': float('inf')},
+        }})
+        try:
+            module = compile_module.load_compiled_module(
+                source_path, self.output_dir)
+        finally:
+            sys.modules.pop('bounds', None)
+        schema = module.Bounded.get_schema()
+        self.assertEqual(float('-inf'), schema['low'].min)
+        self.assertTrue(math.isnan(schema['low'].default))
+        self.assertEqual(float('inf'), schema['high'].max)
+        self.assertEqual(
+            schema_fingerprint(SchemaType(compile_module.load_schema_file(
+                source_path)['Bounded'])),
+            module.SCHEMA_FINGERPRINTS['Bounded'])
+        self.assertEqual('complex(1.0, float(\'inf\'))',
+                         compile_module._source(complex(1, float('inf'))))
+
+    def test_compile_errors(self):
+        """Illegal schema files are not compiled."""
+        self.assertRaisesRegexp(
+            ValueError,
+            'The schema file name "bad-name" is not a valid module name.',
+            compile_module.compiled_path, 'bad-name.json', self.output_dir)
+
+        source_path = self.write_source('bad', ['Person'])
+        self.assertRaisesRegexp(
+            ValueError, 'The schema file ".*" must hold a JSON object.',
+            compile_module.compile_schema_file, source_path, self.output_dir)
+
+        for name in ('class', 'define_type', '2nd'):
+            source_path = self.write_source('bad', {name: {}})
+            self.assertRaisesRegexp(
+                ValueError,
+                'The type name "%s" is not a valid identifier.' % name,
+                compile_module.compile_schema_file, source_path,
+                self.output_dir)
+
+        source_path = self.write_source('bad', {'Bad': []})
+        self.assertRaisesRegexp(
+            ValueError, 'The schema of "Bad" must be a JSON object.',
+            compile_module.compile_schema_file, source_path, self.output_dir)
+
+        source_path = self.write_source(
+            'bad', {'Bad': {'prop': {'type': 'int', 'min': 'one'}}})
+        self.assertRaises(
+            ValidationException,
+            compile_module.compile_schema_file, source_path, self.output_dir)
+        self.assertFalse(os.path.exists(
+            compile_module.compiled_path(source_path, self.output_dir)))
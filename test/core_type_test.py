@@ -1,9 +1,16 @@
 """Test the basic functionality of the core and meta data types."""
 
 from copy import copy, deepcopy
+import gc
+import pickle
+import sys
+import weakref
 
 from test_utils import base_test_case
 from ontic.core_type import CoreType
+from ontic.ontic_type import create_ontic_type
+from ontic.property_schema import PropertySchema
+from ontic.schema_type import SchemaType
 
 
 class CoreTypeTest(base_test_case.BaseTestCase):
@@ -96,4 +103,56 @@ class CoreTypeTest(base_test_case.BaseTestCase):
         self.assertIsNot(sub_copy.dict_prop['list_key'],
                          sub_object.dict_prop['list_key'])
 
+    def test_core_type_pickle(self):
+        """Pickle a CoreType without a duplicate of its content."""
+        core_object = CoreType(int_prop=1, list_prop=[2, 'cat'])
+
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            data = pickle.dumps(core_object, protocol)
+            self.assertEqual(1, data.count('cat'))
+            clone = pickle.loads(data)
+            self.assertIsInstance(clone, CoreType)
+            self.assertDictEqual(core_object, clone)
+            self.assertEqual(1, clone.int_prop)
+
+    def test_core_type_delete_attribute(self):
+        """Attribute deletion removes the dict key."""
+        core_object = CoreType(prop1='val1')
+        del core_object.prop1
+        self.assertNotIn('prop1', core_object)
+        self.assertRaises(AttributeError, delattr, core_object, 'prop1')
+        self.assertRaises(AttributeError, getattr, core_object, 'prop1')
+
+    def test_core_type_no_reference_cycle(self):
+        """Instances are freed by reference counting alone."""
+        my_type = create_ontic_type('NoCycleType', {'prop': {'type': 'int'}})
 
+        class SubType(CoreType):
+            pass
+
+        gc.collect()
+        gc.disable()
+        try:
+            garbage_count = len(gc.garbage)
+            for factory in (lambda: CoreType(prop=1),
+                            lambda: SchemaType(prop={'type': 'int'}),
+                            lambda: PropertySchema(type='int'),
+                            lambda: my_type(prop=1)):
+                the_object = factory()
+                # The object is referenced by the variable and the argument
+                # of getrefcount only.
+                self.assertEqual(2, sys.getrefcount(the_object))
+                self.assertFalse(hasattr(the_object, '__dict__'))
+                del the_object
+
+            # A derived type without slots frees its instances without any
+            # cyclic garbage collection pass.
+            sub_object = SubType(prop=1)
+            sub_object.attr = 2
+            self.assertEqual(2, sub_object['attr'])
+            reference = weakref.ref(sub_object)
+            del sub_object
+            self.assertIsNone(reference())
+            self.assertEqual(garbage_count, len(gc.garbage))
+        finally:
+            gc.enable()
@@ -0,0 +1,97 @@
+"""Test the read-only containers of shared default values."""
+from copy import copy, deepcopy
+import pickle
+
+from test.test_utils import base_test_case
+
+from ontic.frozen import FrozenDict, FrozenList, FrozenSet, freeze, thaw
+
+
+class FrozenTest(base_test_case.BaseTestCase):
+    """Frozen container test cases."""
+
+    def test_freeze(self):
+        """Containers are frozen at any depth."""
+        value = {'list': [1, {'set': {2}}], 'str': 'a'}
+        frozen = freeze(value)
+        self.assertEqual(value, frozen)
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen['list'], FrozenList)
+        self.assertIsInstance(frozen['list'][1]['set'], FrozenSet)
+        self.assertIs(frozen, freeze(frozen))
+        self.assertEqual(hash(frozen), hash(freeze(value)))
+        self.assertEqual(1, len({frozen['list'], freeze([1, {'set': {2}}])}))
+
+        thawed = thaw(frozen)
+        self.assertEqual(value, thawed)
+        self.assertIs(dict, type(thawed))
+        self.assertIs(list, type(thawed['list']))
+        self.assertIs(set, type(thawed['list'][1]['set']))
+        thawed['list'].append(3)
+        self.assertListEqual([1, {'set': {2}}], frozen['list'])
+
+        # The members of tuples are frozen and thawed as well.
+        frozen = freeze((['a'], ({'b': 1}, ), 2))
+        self.assertIs(tuple, type(frozen))
+        self.assertIsInstance(frozen[0], FrozenList)
+        self.assertIsInstance(frozen[1][0], FrozenDict)
+        self.assertEqual(hash(frozen), hash(freeze((['a'], ({'b': 1}, ), 2))))
+        thawed = thaw(frozen)
+        self.assertEqual((['a'], ({'b': 1}, ), 2), thawed)
+        self.assertIs(list, type(thawed[0]))
+        self.assertIs(dict, type(thawed[1][0]))
+
+    def test_read_only(self):
+        """Frozen containers cannot be modified in place."""
+        frozen_list = FrozenList([1, 2])
+        for method, args in (
+                ('__setitem__', (0, 1)), ('__delitem__', (0,)),
+                ('__setslice__', (0, 1, [])), ('__delslice__', (0, 1)),
+                ('__iadd__', ([1],)), ('__imul__', (2,)),
+                ('append', (1,)), ('extend', ([1],)), ('insert', (0, 1)),
+                ('pop', ()), ('remove', (1,)), ('reverse', ()),
+                ('sort', ())):
+            self.assertRaisesRegexp(
+                TypeError,
+                'A FrozenList is read-only, it must be replaced or thawed.',
+                getattr(frozen_list, method), *args)
+        self.assertListEqual([1, 2], frozen_list)
+
+        frozen_dict = FrozenDict(a=1)
+        for method, args in (
+                ('__setitem__', ('b', 1)), ('__delitem__', ('a',)),
+                ('clear', ()), ('pop', ('a',)), ('popitem', ()),
+                ('setdefault', ('b',)), ('update', ({'b': 1},))):
+            self.assertRaises(
+                TypeError, getattr(frozen_dict, method), *args)
+        self.assertDictEqual({'a': 1}, frozen_dict)
+
+        frozen_set = FrozenSet([1])
+        for method, args in (
+                ('add', (2,)), ('clear', ()), ('discard', (1,)),
+                ('pop', ()), ('remove', (1,)), ('update', ([2],)),
+                ('difference_update', ([1],)),
+                ('intersection_update', ([2],)),
+                ('symmetric_difference_update', ([2],)),
+                ('__ior__', ({2},)), ('__iand__', ({2},)),
+                ('__isub__', ({1},)), ('__ixor__', ({2},))):
+            self.assertRaises(
+                TypeError, getattr(frozen_set, method), *args)
+        self.assertSetEqual({1}, frozen_set)
+        self.assertSetEqual({1, 2}, frozen_set | {2})
+
+    def test_copy_and_pickle(self):
+        """Frozen containers are copied and pickled as frozen."""
+        frozen = freeze({'list': [1, [2]], 'set': {3}})
+        self.assertIs(frozen, copy(frozen))
+        the_copy = deepcopy(frozen)
+        self.assertEqual(frozen, the_copy)
+        self.assertIsNot(frozen, the_copy)
+        self.assertIsInstance(the_copy['list'], FrozenList)
+
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            clone = pickle.loads(pickle.dumps(frozen, protocol))
+            self.assertEqual(frozen, clone)
+            self.assertIsInstance(clone, FrozenDict)
+            self.assertIsInstance(clone['list'][1], FrozenList)
+            self.assertIsInstance(clone['set'], FrozenSet)
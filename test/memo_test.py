@@ -0,0 +1,82 @@
+"""Test the memo caches."""
+from test.test_utils import base_test_case
+
+from ontic import memo
+
+
+class LRUCacheTest(base_test_case.BaseTestCase):
+    """LRUCache test cases."""
+
+    def test_lru_eviction(self):
+        """The least recently used entries are evicted."""
+        cache = memo.LRUCache(3)
+        for key in 'abc':
+            cache.put(key, key.upper())
+        self.assertEqual('A', cache.get('a'))
+        cache.put('d', 'D')
+        cache.put('e', 'E')
+
+        self.assertEqual(3, len(cache))
+        self.assertNotIn('b', cache)
+        self.assertNotIn('c', cache)
+        self.assertListEqual(
+            ['A', 'D', 'E'], [cache.get(key) for key in 'ade'])
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual('none', cache.get('c', 'none'))
+        self.assertDictEqual(
+            {'capacity': 3, 'size': 3, 'hits': 4, 'misses': 2,
+             'evictions': 2},
+            cache.stats())
+
+        # Replacing an entry does not evict.
+        cache.put('a', 'AA')
+        self.assertEqual('AA', cache.get('a'))
+        self.assertEqual(2, cache.evictions)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertIsNone(cache.get('a'))
+        self.assertDictEqual(
+            {'capacity': 3, 'size': 0, 'hits': 0, 'misses': 1,
+             'evictions': 0},
+            cache.stats())
+        cache.put('a', 1)
+        self.assertEqual(1, cache.get('a'))
+
+    def test_single_entry(self):
+        """A cache of one entry."""
+        cache = memo.LRUCache(1)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertNotIn('a', cache)
+        self.assertEqual(2, cache.get('b'))
+        self.assertEqual(2, cache.get('b'))
+        self.assertRaises(TypeError, cache.get, [])
+        self.assertRaises(TypeError, cache.put, [], 1)
+
+    def test_pop(self):
+        """Removed entries are unlinked from the eviction order."""
+        cache = memo.LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(1, cache.pop('a'))
+        self.assertIsNone(cache.pop('a'))
+        self.assertEqual('none', cache.pop('a', 'none'))
+        cache.put('c', 3)
+        self.assertListEqual([2, 3], [cache.get(key) for key in 'bc'])
+        self.assertEqual(0, cache.evictions)
+        cache.put('d', 4)
+        self.assertNotIn('b', cache)
+
+    def test_bad_capacity(self):
+        """ValueError testing of the cache capacity."""
+        for capacity in (0, -1, 1.5, True, None, '2'):
+            self.assertRaisesRegexp(
+                ValueError, '"capacity" must be a positive int.',
+                memo.LRUCache, capacity)
+        for capacity in (None, 0, 1, 1000):
+            memo.check_capacity(capacity)
+        for capacity in (-1, 1.5, True, '2'):
+            self.assertRaisesRegexp(
+                ValueError, '"capacity" must be a non-negative int or None.',
+                memo.check_capacity, capacity)
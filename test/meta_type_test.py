@@ -1,5 +1,6 @@
 from test.test_utils import base_test_case
 
+from ontic import meta_type
 from ontic.meta_type import MetaType
 
 
@@ -30,3 +31,19 @@ class MetaTypeTest(base_test_case.BaseTestCase):
         """MetaType property access as a Dict and an Attribute."""
         meta_object = MetaType()
         self.assert_dynamic_accessing(meta_object)
+
+    def test_validate_plain_schema_regex(self):
+        """Values are validated against the regex of a plain schema."""
+        settings = dict.fromkeys(
+            ('required', 'enum', 'min', 'max', 'member_type', 'member_min',
+             'member_max'))
+        schema = MetaType(settings, type=str, regex='^a')
+        self.assertListEqual([], meta_type.validate_value('p', schema, 'ab'))
+        self.assertListEqual(
+            ['Value "b" for p does not meet regex: ^a'],
+            meta_type.validate_value('p', schema, 'b'))
+
+        schema = MetaType(settings, type=list, member_type=str, regex='^a')
+        self.assertListEqual(
+            ['Value "b" for "p" does not meet regex: ^a'],
+            meta_type.validate_value('p', schema, ['ab', 'b']))
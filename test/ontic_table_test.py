@@ -0,0 +1,173 @@
+"""Test the columnar storage of Ontic objects."""
+from array import array
+import sys
+import unittest
+
+from test.test_utils import base_test_case
+
+from ontic import ontic_table, ontic_type
+from ontic.ontic_table import OnticTable
+from ontic.validation_exception import ValidationException
+from ontic.validation_plan import bitmap_indexes
+
+TABLE_SCHEMA = {
+    'int_prop': {'type': 'int', 'min': 2},
+    'bool_prop': {'type': 'bool'},
+    'float_prop': {'type': 'float', 'default': 1.5, 'max': 10.0},
+    'enum_prop': {'type': 'str', 'enum': {'dog', 'cat'}, 'required': True},
+    'list_prop': {'type': 'list', 'default': ['fish']},
+}
+
+TABLE_RECORDS = [
+    {'int_prop': 3, 'bool_prop': True, 'enum_prop': 'dog'},
+    {'int_prop': 1, 'float_prop': 20.0, 'enum_prop': 'cat',
+     'list_prop': ['a']},
+    {'int_prop': 'three', 'enum_prop': 'cow', 'extra': 1},
+    {'bool_prop': 1, 'enum_prop': 'cow'},
+    {'enum_prop': ['dog']},
+    {},
+]
+
+
+class OnticTableTest(base_test_case.BaseTestCase):
+    """OnticTable test cases."""
+
+    def setUp(self):
+        self.table_type = ontic_type.create_ontic_type(
+            'TableType', TABLE_SCHEMA)
+
+    def assert_parity(self, use_numpy):
+        objects = [self.table_type(record) for record in TABLE_RECORDS]
+        table = OnticTable.from_records(
+            self.table_type, objects, use_numpy=use_numpy)
+        self.assertEqual(len(objects), len(table))
+
+        for name in TABLE_SCHEMA:
+            self.assertListEqual(
+                [an_object.get(name) for an_object in objects],
+                table.column(name))
+
+        for an_object in objects:
+            an_object.perfect()
+        table.perfect()
+        for an_object, row in zip(objects, table):
+            an_object.pop('extra', None)
+            self.assertDictEqual(
+                dict((key, value) for key, value in an_object.iteritems()
+                     if value is not None),
+                dict(row.iteritems()))
+        self.assertIsNot(table[0].list_prop, table[2].list_prop)
+
+        self.assertDictEqual(
+            ontic_type.validate_many(self.table_type, objects),
+            table.validate())
+        self.assertEqual(
+            ontic_type.validate_many(self.table_type, objects, 'fast'),
+            table.validate('fast'))
+
+    def test_table_parity(self):
+        """Table columns hold and validate the values of the records."""
+        self.assert_parity(False)
+
+    @unittest.skipUnless(ontic_table.NUMPY_AVAILABLE, 'NumPy not installed.')
+    def test_table_parity_numpy(self):
+        """NumPy columns hold and validate the values of the records."""
+        self.assert_parity(True)
+
+    def test_table_columns(self):
+        """Columns are numeric, dictionary encoded, or lists of values."""
+        table = OnticTable(self.table_type, TABLE_RECORDS[:2],
+                           use_numpy=False)
+        self.assertIsInstance(table.buffer('int_prop'), array)
+        self.assertEqual(array('l', [3, 1]), table.buffer('int_prop'))
+        self.assertEqual(array('l', [0, 1]), table.buffer('enum_prop'))
+        self.assertListEqual(['dog', 'cat'], table.dictionary('enum_prop'))
+        self.assertEqual(bytearray([1]), table.validity('bool_prop'))
+        self.assertEqual(bytearray([2]), table.validity('float_prop'))
+        self.assertRaisesRegexp(
+            ValueError,
+            'The "list_prop" column is not numeric or dictionary encoded.',
+            table.buffer, 'list_prop')
+        self.assertRaisesRegexp(
+            ValueError, 'The "int_prop" column is not dictionary encoded.',
+            table.dictionary, 'int_prop')
+
+        # A value of another type converts the column to a list.
+        table.extend(TABLE_RECORDS[2:])
+        self.assertRaises(ValueError, table.buffer, 'int_prop')
+        self.assertListEqual(
+            [3, 1, 'three', None, None, None], table.column('int_prop'))
+        self.assertListEqual(
+            [True, None, None, 1, None, None], table.column('bool_prop'))
+        self.assertIs(True, table[0].bool_prop)
+
+    def test_table_rows(self):
+        """Rows are views of the columns of the table."""
+        table = OnticTable(self.table_type, TABLE_RECORDS[:2])
+        row = table[-1]
+        self.assertEqual(1, row.int_prop)
+        self.assertEqual('cat', row['enum_prop'])
+        self.assertIsNone(row.get('bool_prop'))
+        self.assertNotIn('bool_prop', row)
+        self.assertRaises(KeyError, row.__getitem__, 'bool_prop')
+        self.assertRaises(AttributeError, getattr, row, 'bool_prop')
+        self.assertEqual(4, len(row))
+        self.assertRaises(IndexError, table.__getitem__, 2)
+
+        row.int_prop = 4
+        row['bool_prop'] = False
+        del row['list_prop']
+        self.assertEqual(4, table.get_value(1, 'int_prop'))
+        self.assertEqual(
+            {'int_prop': 4, 'bool_prop': False, 'float_prop': 20.0,
+             'enum_prop': 'cat'}, row)
+        self.assertRaisesRegexp(
+            ValueError, '"extra" is not a recognized property.',
+            row.__setitem__, 'extra', 1)
+
+        the_object = row.to_object()
+        self.assertIsInstance(the_object, self.table_type)
+        self.assertEqual(the_object, row)
+
+        self.assertFalse(row.is_valid())
+        self.assertRaises(ValidationException, row.validate)
+        errors = row.validate(False, records=True)
+        self.assertListEqual(['float_prop'], [error.path for error in errors])
+        self.assertListEqual(row.validate(False), map(str, errors))
+        row.float_prop = 2.0
+        self.assertListEqual([], row.validate())
+
+    def test_table_errors(self):
+        """Tables are made for Ontic types only."""
+        self.assertRaisesRegexp(
+            ValueError,
+            '"ontic_type" must be OnticType or child type of OnticType.',
+            OnticTable, dict)
+        table = OnticTable(self.table_type)
+        self.assertRaisesRegexp(
+            ValueError, '"mode" must be one of', table.validate, 'UNKNOWN')
+        self.assertDictEqual({}, table.validate())
+        self.assertListEqual([], bitmap_indexes(table.validate('fast')))
+
+    def test_table_compact(self):
+        """A table holds less than the objects it is made from."""
+        objects = [self.table_type(int_prop=index, float_prop=0.5,
+                                   enum_prop='dog')
+                   for index in xrange(1000)]
+        table = OnticTable(self.table_type, objects)
+        self.assertLess(
+            table.nbytes() * 5,
+            sum(sys.getsizeof(an_object) for an_object in objects))
+
+    def test_table_perfect_defaults(self):
+        """Factory defaults are made per row, shared defaults in bulk."""
+        my_type = ontic_type.create_ontic_type('TableDefaults', {
+            'made': {'type': 'list', 'default_factory': list},
+            'shared': {'type': 'list', 'default': [1],
+                       'shared_default': True},
+        })
+        table = OnticTable(my_type, [{}, {}])
+        table.perfect()
+        self.assertListEqual([[], []], table.column('made'))
+        self.assertIsNot(table[0].made, table[1].made)
+        self.assertIs(table[0].shared, table[1].shared)
@@ -1,11 +1,16 @@
 """Test the basic functionality of the base and core data types."""
+from copy import copy, deepcopy
 from datetime import date, time, datetime
+from multiprocessing import Pool
+import cPickle
+import pickle
 
 from test.test_utils import base_test_case
 
-from ontic import ontic_type
+from ontic import ontic_type, type_registry
+from ontic.frozen import FrozenDict, FrozenList, thaw
 from ontic.schema_type import SchemaType
-from ontic.validation_exception import ValidationException
+from ontic.validation_exception import ValidationError, ValidationException
 
 
 class OnticTypeTest(base_test_case.BaseTestCase):
@@ -89,6 +94,536 @@ class OnticTypeTest(base_test_case.BaseTestCase):
         self.assertEqual([], ontic_object.validate_value('prop1'))
 
 
+class DirtyTrackingTestCase(base_test_case.BaseTestCase):
+    """Test the incremental validation of OnticType instances."""
+
+    def setUp(self):
+        self.my_type = ontic_type.create_ontic_type('DirtyTracking', {
+            'prop_%s' % index: {'type': 'int', 'max': 10}
+            for index in xrange(20)})
+        self.my_type.get_schema().prop_0.required = True
+        self.validated = []
+        for validator in self.my_type.get_validation_plan().validators:
+            validator.validate = self.count_validation(
+                validator.name, validator.validate)
+
+    def count_validation(self, name, validate):
+        def counted_validate(value, value_errors):
+            self.validated.append(name)
+            validate(value, value_errors)
+        return counted_validate
+
+    def assert_validated(self, expected_names, ontic_object, errors=None):
+        del self.validated[:]
+        self.assertItemsEqual(
+            errors or [],
+            ontic_object.validate(raise_validation_exception=False))
+        self.assertItemsEqual(expected_names, self.validated)
+
+    def test_incremental_validation(self):
+        """Only the properties written since validation are validated."""
+        ontic_object = self.my_type(prop_0=1, prop_1=2)
+        self.assert_validated(
+            ['prop_%s' % index for index in xrange(20)], ontic_object)
+        self.assert_validated([], ontic_object)
+
+        ontic_object.prop_2 = 3
+        ontic_object['prop_3'] = 4
+        self.assert_validated(['prop_2', 'prop_3'], ontic_object)
+
+        ontic_object.prop_4 = 11
+        self.assert_validated(
+            ['prop_4'], ontic_object,
+            ['The value of "11" for "prop_4" fails max of 10.'])
+        del ontic_object.prop_0
+        self.assert_validated(
+            ['prop_0'], ontic_object,
+            ['The value for "prop_0" is required.',
+             'The value of "11" for "prop_4" fails max of 10.'])
+        self.assertRaises(ValidationException, ontic_object.validate)
+
+        ontic_object.update({'prop_0': 1}, prop_4=5)
+        self.assert_validated(['prop_0', 'prop_4'], ontic_object)
+        self.assertListEqual([], ontic_type.validate_object(ontic_object))
+
+    def test_tracked_dict_methods(self):
+        """The dict modification methods mark properties as dirty."""
+        ontic_object = self.my_type(prop_0=1, prop_1=2, prop_2=3)
+        ontic_object.validate()
+
+        self.assertEqual(2, ontic_object.pop('prop_1'))
+        self.assertIsNone(ontic_object.pop('prop_5', None))
+        self.assertEqual(3, ontic_object.setdefault('prop_2', 4))
+        self.assertEqual(4, ontic_object.setdefault('prop_6', 4))
+        del ontic_object['prop_2']
+        self.assert_validated(['prop_1', 'prop_2', 'prop_6'], ontic_object)
+
+        key, _ = ontic_object.popitem()
+        self.assertNotIn(key, ontic_object)
+        self.assert_validated(
+            [key], ontic_object,
+            ['The value for "prop_0" is required.'] if key == 'prop_0'
+            else [])
+
+        ontic_object.clear()
+        self.assert_validated(
+            list({'prop_0', 'prop_6'} - {key}),
+            ontic_object, ['The value for "prop_0" is required.'])
+        self.assertRaises(AttributeError, delattr, ontic_object, 'prop_6')
+
+    def test_invalidate(self):
+        """Invalidation forces the validation of every property."""
+        ontic_object = self.my_type(prop_0=1)
+        ontic_object.validate()
+
+        ontic_object.invalidate()
+        self.assert_validated(
+            ['prop_%s' % index for index in xrange(20)], ontic_object)
+
+        # Values modified in place are not tracked without invalidation.
+        dict.__setitem__(ontic_object, 'prop_1', 20)
+        self.assert_validated([], ontic_object)
+        ontic_object.invalidate()
+        self.assert_validated(
+            ['prop_%s' % index for index in xrange(20)], ontic_object,
+            ['The value of "20" for "prop_1" fails max of 10.'])
+
+    def test_mutable_values(self):
+        """Collection values are validated again on each validation."""
+        my_type = ontic_type.create_ontic_type('DirtyCollection', {
+            'prop_1': {'type': 'list', 'max': 2},
+            'prop_2': {'type': 'int'},
+        })
+        ontic_object = my_type(prop_1=[1, 2], prop_2=1)
+        ontic_object.validate()
+
+        ontic_object.prop_1.append(3)
+        self.assertListEqual(
+            ['The value of "[1, 2, 3]" for "prop_1" fails max of 2.'],
+            ontic_object.validate(raise_validation_exception=False))
+
+    def test_schema_change(self):
+        """A new schema of the type validates every property."""
+        my_type = ontic_type.create_ontic_type(
+            'DirtySchema', {'prop': {'type': 'int'}})
+        ontic_object = my_type(prop=1)
+        ontic_object.validate()
+
+        my_type.ONTIC_SCHEMA = SchemaType(prop={'type': 'str'})
+        self.assertListEqual(
+            ['The value for "prop" is not of type "<type \'str\'>": 1'],
+            ontic_object.validate(raise_validation_exception=False))
+
+        my_type.get_schema().prop.type = int
+        my_type.clear_validation_plan()
+        self.assertListEqual([], ontic_object.validate())
+
+    def test_copy_and_pickle(self):
+        """Copies and pickled objects are tracked independently."""
+        ontic_object = self.my_type(prop_0=1)
+        ontic_object.validate()
+
+        for clone in (copy(ontic_object), deepcopy(ontic_object),
+                      pickle.loads(pickle.dumps(ontic_object, 2))):
+            self.assertDictEqual(ontic_object, clone)
+            self.assertEqual(1, clone.prop_0)
+            clone.prop_1 = 1
+            self.assert_validated(
+                ['prop_%s' % index for index in xrange(20)], clone)
+        self.assert_validated([], ontic_object)
+
+
+class StrictType(ontic_type.OnticType):
+    """A type that validates property values on assignment."""
+    VALIDATE_ON_SET = True
+    ONTIC_SCHEMA = SchemaType({
+        'prop_1': {'type': 'int', 'required': True, 'max': 10},
+        'prop_2': {'type': 'str', 'default': 'a'},
+    })
+
+
+class ValidateOnSetTestCase(base_test_case.BaseTestCase):
+    """Test the validation of property values on assignment."""
+
+    def test_validate_on_set(self):
+        """Invalid assignments raise and are not assigned."""
+        strict_object = StrictType(prop_1=1)
+
+        strict_object.prop_1 = 2
+        strict_object['prop_2'] = 'b'
+        strict_object.extra = 'not in schema'
+        self.assertDictEqual(
+            {'prop_1': 2, 'prop_2': 'b', 'extra': 'not in schema'},
+            strict_object)
+
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value of "11" for "prop_1" fails max of 10.',
+            setattr, strict_object, 'prop_1', 11)
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value for "prop_2" is not of type',
+            strict_object.__setitem__, 'prop_2', 3)
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value for "prop_1" is required.',
+            delattr, strict_object, 'prop_1')
+        self.assertRaises(
+            ValidationException, strict_object.pop, 'prop_1')
+        self.assertRaises(ValidationException, strict_object.clear)
+        self.assertDictEqual(
+            {'prop_1': 2, 'prop_2': 'b', 'extra': 'not in schema'},
+            strict_object)
+
+        try:
+            strict_object.update(prop_1=3, prop_2=4)
+            self.fail('ValidationException expected.')
+        except ValidationException as exception:
+            self.assertListEqual(
+                [('prop_2', 'type')],
+                [(error.path, error.rule) for error in exception.errors])
+        self.assertEqual(2, strict_object.prop_1)
+
+        strict_object.update(prop_1=3, prop_2='c')
+        self.assertEqual('c', strict_object.pop('prop_2'))
+        self.assertEqual('d', strict_object.setdefault('prop_2', 'd'))
+        self.assertEqual(3, strict_object.setdefault('prop_3', 3))
+        del strict_object.prop_2
+        self.assertRaises(
+            ValidationException, strict_object.setdefault, 'prop_2', 4)
+        self.assertNotIn('prop_2', strict_object)
+
+    def test_validate_on_construction(self):
+        """Construction values are validated."""
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value of "20" for "prop_1" fails max of 10.',
+            StrictType, prop_1=20)
+        self.assertRaises(ValidationException, StrictType, prop_1=None)
+
+        # Absent properties are not validated until assigned, and the
+        # assignment of None to an absent property is allowed.
+        strict_object = StrictType()
+        strict_object.prop_1 = None
+        strict_object.perfect()
+        self.assertDictEqual({'prop_1': None, 'prop_2': 'a'}, strict_object)
+        self.assertRaises(ValidationException, strict_object.validate)
+
+    def test_create_validate_on_set(self):
+        """Create a type that validates on assignment."""
+        my_type = ontic_type.create_ontic_type(
+            'StrictCreated', {'prop': {'type': 'int'}}, validate_on_set=True)
+        self.assertTrue(my_type.VALIDATE_ON_SET)
+        self.assertFalse(ontic_type.OnticType.VALIDATE_ON_SET)
+        self.assertFalse(ontic_type.create_ontic_type(
+            'LaxCreated', {'prop': {'type': 'int'}}).VALIDATE_ON_SET)
+
+        strict_object = my_type(prop=1)
+        self.assertRaises(
+            ValidationException, setattr, strict_object, 'prop', 'one')
+
+        # The validation mode is kept by pickled objects.
+        data = pickle.dumps(strict_object, 2)
+        ontic_type._rebuilt_types.clear()
+        clone = pickle.loads(data)
+        self.assertIsNot(my_type, type(clone))
+        self.assertTrue(type(clone).VALIDATE_ON_SET)
+        self.assertRaises(ValidationException, setattr, clone, 'prop', 'one')
+        ontic_type._rebuilt_types.clear()
+        type_registry.clear_registry()
+
+
+class PickledType(ontic_type.OnticType):
+    """A type that can be found by module and name."""
+    ONTIC_SCHEMA = SchemaType({
+        'prop_1': {'type': 'int', 'required': True},
+        'prop_2': {'type': 'str'},
+    })
+
+
+def _echo(the_object):
+    """Return an object from a worker process."""
+    return the_object
+
+
+class PickleTestCase(base_test_case.BaseTestCase):
+    """Test the pickling of OnticType instances."""
+
+    def tearDown(self):
+        ontic_type._rebuilt_types.clear()
+        type_registry.clear_registry()
+
+    def assert_pickle_round_trip(self, the_object):
+        for pickler in (pickle, cPickle):
+            for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+                clone = pickler.loads(pickler.dumps(the_object, protocol))
+                self.assertIs(type(the_object), type(clone))
+                self.assertDictEqual(the_object, clone)
+                for key, value in clone.iteritems():
+                    self.assertEqual(value, getattr(clone, key))
+
+    def test_pickle_class_type(self):
+        """Pickle instances of a type found by module and name."""
+        self.assert_pickle_round_trip(PickledType(prop_1=1))
+        self.assert_pickle_round_trip(PickledType(prop_1=1, prop_2=None))
+        self.assert_pickle_round_trip(PickledType(prop_1=1, extra='yes'))
+        self.assert_pickle_round_trip(PickledType())
+
+    def test_pickle_created_type(self):
+        """Pickle instances of a type made by create_ontic_type."""
+        my_type = ontic_type.create_ontic_type('PickleCreated', {
+            'prop_1': {'type': 'int', 'enum': {1, 2}},
+            'prop_2': {'type': 'list', 'member_type': 'str'},
+        })
+        self.assert_pickle_round_trip(my_type(prop_1=1, prop_2=['a']))
+        self.assert_pickle_round_trip(my_type(prop_2=None, extra='yes'))
+
+    def test_pickle_rebuilt_type(self):
+        """Types are rebuilt from their schema once per process."""
+        my_type = ontic_type.create_ontic_type('PickleRebuilt', {
+            'prop_1': {'type': 'int', 'required': True},
+            'prop_2': {'type': 'str', 'regex': '^a'},
+        })
+        data = pickle.dumps([my_type(prop_1=1), my_type(prop_2='b')], 2)
+        ontic_type._rebuilt_types.clear()
+
+        first, second = pickle.loads(data)
+        rebuilt_type = type(first)
+        self.assertIsNot(my_type, rebuilt_type)
+        self.assertIs(rebuilt_type, type(second))
+        self.assertEqual('PickleRebuilt', rebuilt_type.__name__)
+        self.assertIs(
+            rebuilt_type,
+            type_registry.get_registered_type(
+                type_registry.type_key(my_type)))
+        self.assertListEqual(
+            ['The value for "prop_1" is required.',
+             'Value "b" for prop_2 does not meet regex: ^a'],
+            second.validate(raise_validation_exception=False))
+        self.assertIs(rebuilt_type, type(pickle.loads(data)[0]))
+
+    def test_pickle_default_factory(self):
+        """Pickle instances of a type with a lambda default factory."""
+        schema = {
+            'prop_1': {'type': 'int', 'required': True},
+            'prop_2': {'type': 'list', 'default_factory': lambda: ['a']},
+        }
+        my_type = ontic_type.create_ontic_type('PickleFactory', schema)
+        self.assertFalse(type_registry.is_portable(my_type.get_schema()))
+        the_object = my_type(prop_1=1)
+        the_object.perfect()
+        self.assert_pickle_round_trip(the_object)
+
+        # The type is not rebuilt from the token, but is found while it is
+        # registered.
+        data = pickle.dumps(the_object, 2)
+        ontic_type._rebuilt_types.clear()
+        self.assertRaisesRegexp(
+            ValueError,
+            'The type "PickleFactory" is not found, and cannot be rebuilt, '
+            'as its schema holds callables that are not found by module '
+            'and name.', pickle.loads, data)
+        type_registry.register_type(my_type)
+        self.assertIs(my_type, type(pickle.loads(data)))
+
+    def test_pickle_compact(self):
+        """The type of many pickled objects is written once."""
+        my_type = ontic_type.create_ontic_type('PickleCompact', {
+            'prop_%s' % index: {'type': 'int'} for index in xrange(10)})
+        one_size = len(pickle.dumps([my_type(prop_1=1)], 2))
+        many_size = len(pickle.dumps([my_type(prop_1=1)] * 2, 2))
+        self.assertLess(many_size - one_size, 10)
+
+        objects = [
+            my_type(('prop_%s' % index, index * count)
+                    for index in xrange(10))
+            for count in xrange(100)]
+        self.assertLess(
+            len(pickle.dumps(objects, 2)),
+            len(pickle.dumps([dict(an_object) for an_object in objects], 2)))
+
+    def test_pickle_to_worker(self):
+        """Created type instances travel to and from worker processes."""
+        my_type = ontic_type.create_ontic_type('PickleWorker', {
+            'prop': {'type': 'int', 'required': True}})
+        objects = [my_type(prop=1), my_type()]
+
+        pool = Pool(2)
+        try:
+            self.assertListEqual(
+                [True, False], pool.map(ontic_type.is_valid, objects))
+            echoed = pool.map(_echo, objects)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertListEqual(objects, echoed)
+        self.assertIs(my_type, type(echoed[0]))
+
+
+class CompactType(ontic_type.CompactOnticType):
+    """A compact type found by module and name, for pickle tests."""
+    ONTIC_SCHEMA = SchemaType({
+        'prop_1': {'type': 'int', 'required': True},
+        'prop_2': {'type': 'list', 'default': ['a'], 'member_type': 'str'},
+        'prop_3': {'type': 'str', 'enum': {'dog', 'cat'}},
+    })
+
+
+class CompactOnticTypeTestCase(base_test_case.BaseTestCase):
+    """Test the compact, slot based, Ontic types."""
+
+    def tearDown(self):
+        ontic_type._rebuilt_types.clear()
+        type_registry.clear_registry()
+
+    def test_compact_slots(self):
+        """Compact types declare a slot per property, and no dict."""
+        self.assertEqual(('prop_1', 'prop_2', 'prop_3'), CompactType.__slots__)
+        the_object = CompactType(prop_1=1)
+        self.assertFalse(hasattr(the_object, '__dict__'))
+        self.assertRaisesRegexp(
+            ValueError, '"extra" is not a recognized property.',
+            CompactType, extra=1)
+        self.assertRaisesRegexp(
+            ValueError, '"extra" is not a recognized property.',
+            the_object.__setitem__, 'extra', 1)
+        self.assertRaises(AttributeError, setattr, the_object, 'extra', 1)
+
+        my_type = ontic_type.create_ontic_type(
+            'CompactCreated', {'prop': {'type': 'int'}}, compact=True)
+        self.assertTrue(issubclass(my_type, ontic_type.CompactOnticType))
+        self.assertEqual(('prop',), my_type.__slots__)
+
+    def test_compact_name_errors(self):
+        """Property names must fit the slots of a compact type."""
+        self.assertRaisesRegexp(
+            ValueError,
+            'The property name "keys" conflicts with an attribute of '
+            'CompactOnticType.',
+            ontic_type.create_ontic_type, 'BadCompact', {'keys': {}},
+            compact=True)
+        self.assertRaisesRegexp(
+            ValueError,
+            'The property name "bad-name" is not a valid identifier for a '
+            'compact type.',
+            ontic_type.create_ontic_type, 'BadCompact', {'bad-name': {}},
+            compact=True)
+
+    def test_compact_dict_api(self):
+        """Compact instances have the dict style API."""
+        the_object = CompactType({'prop_1': 1}, prop_3='dog')
+        self.assertEqual(1, the_object.prop_1)
+        self.assertEqual(1, the_object['prop_1'])
+        self.assertEqual({'prop_1': 1, 'prop_3': 'dog'}, the_object)
+        self.assertListEqual(['prop_1', 'prop_3'], the_object.keys())
+        self.assertListEqual([1, 'dog'], the_object.values())
+        self.assertListEqual(
+            [('prop_1', 1), ('prop_3', 'dog')], list(the_object.iteritems()))
+        self.assertEqual(2, len(the_object))
+        self.assertIn('prop_1', the_object)
+        self.assertNotIn('prop_2', the_object)
+        self.assertNotIn('extra', the_object)
+        self.assertIsNone(the_object.get('prop_2'))
+        self.assertEqual('x', the_object.get('extra', 'x'))
+        self.assertRaises(KeyError, the_object.__getitem__, 'prop_2')
+        self.assertRaises(AttributeError, getattr, the_object, 'prop_2')
+        self.assertEqual("{'prop_1': 1, 'prop_3': 'dog'}", repr(the_object))
+
+        the_object['prop_2'] = ['b']
+        del the_object['prop_3']
+        self.assertRaises(KeyError, the_object.__delitem__, 'prop_3')
+        self.assertEqual({'prop_1': 1, 'prop_2': ['b']}, the_object)
+        self.assertEqual(['b'], the_object.pop('prop_2'))
+        self.assertIsNone(the_object.pop('prop_2', None))
+        self.assertEqual('cat', the_object.setdefault('prop_3', 'cat'))
+        the_object.update(prop_1=2)
+        self.assertEqual({'prop_1': 2, 'prop_3': 'cat'}, the_object)
+        self.assertEqual(the_object, CompactType(prop_1=2, prop_3='cat'))
+        self.assertNotEqual(the_object, CompactType(prop_1=2))
+        the_object.clear()
+        self.assertEqual({}, the_object)
+
+    def test_compact_perfect_and_validate(self):
+        """Compact instances are perfected and validated."""
+        the_object = CompactType(prop_3='fish')
+        the_object.perfect()
+        self.assertEqual(
+            {'prop_1': None, 'prop_2': ['a'], 'prop_3': 'fish'}, the_object)
+        self.assertIsNot(
+            CompactType.get_schema().prop_2.default, the_object.prop_2)
+
+        self.assertFalse(the_object.is_valid())
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value for "prop_1" is required.',
+            the_object.validate)
+        value_errors = the_object.validate(raise_validation_exception=False)
+        self.assertEqual(2, len(value_errors))
+        self.assertIn('The value for "prop_1" is required.', value_errors)
+        self.assertRaisesRegexp(
+            ValidationException,
+            'The value for "prop_1" is required.',
+            the_object.validate_value, 'prop_1')
+
+        the_object.prop_1 = 1
+        the_object.prop_3 = 'dog'
+        self.assertListEqual([], the_object.validate())
+        self.assertTrue(ontic_type.validate_object(the_object, mode='fast'))
+
+        row_errors = ontic_type.validate_many(
+            CompactType, [the_object, CompactType()])
+        self.assertItemsEqual([1], row_errors.keys())
+        self.assertEqual(
+            bytearray([2]),
+            CompactType.validate_batch([the_object, CompactType()], 'fast'))
+
+    def test_compact_validate_on_set(self):
+        """Compact types validate values on assignment when strict."""
+        my_type = ontic_type.create_ontic_type(
+            'StrictCompact', {'prop': {'type': 'int', 'required': True}},
+            validate_on_set=True, compact=True)
+        self.assertRaises(ValidationException, my_type, prop='one')
+        the_object = my_type(prop=1)
+        self.assertRaises(ValidationException, setattr, the_object, 'prop',
+                          'one')
+        self.assertRaises(ValidationException, the_object.__setitem__,
+                          'prop', 'one')
+        self.assertRaises(ValidationException, the_object.update,
+                          prop='one')
+        self.assertRaises(ValidationException, delattr, the_object, 'prop')
+        self.assertEqual({'prop': 1}, the_object)
+
+    def test_compact_copy_and_pickle(self):
+        """Compact instances are copied and pickled."""
+        the_object = CompactType(prop_1=1, prop_2=['a'])
+        shallow = copy(the_object)
+        deep = deepcopy(the_object)
+        self.assertIs(CompactType, type(shallow))
+        self.assertEqual(the_object, shallow)
+        self.assertIs(the_object.prop_2, shallow.prop_2)
+        self.assertEqual(the_object, deep)
+        self.assertIsNot(the_object.prop_2, deep.prop_2)
+
+        my_type = ontic_type.create_ontic_type(
+            'PickleCompactType', {'prop': {'type': 'int'}}, compact=True)
+        for an_object in (the_object, CompactType(), my_type(prop=1)):
+            for pickler in (pickle, cPickle):
+                for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+                    clone = pickler.loads(pickler.dumps(an_object, protocol))
+                    self.assertIs(type(an_object), type(clone))
+                    self.assertEqual(an_object, clone)
+
+        # A compact type and a dict based type of the same name and schema
+        # are rebuilt as distinct types.
+        dict_type = ontic_type.create_ontic_type(
+            'PickleCompactType', {'prop': {'type': 'int'}})
+        ontic_type._rebuilt_types.clear()
+        clone = pickle.loads(pickle.dumps(dict_type(prop=1), 2))
+        self.assertIsInstance(clone, ontic_type.OnticType)
+        clone = pickle.loads(pickle.dumps(my_type(prop=1), 2))
+        self.assertIsInstance(clone, ontic_type.CompactOnticType)
+
+
 class CreateOnticTypeTestCase(base_test_case.BaseTestCase):
     """Test the dynamic creation of Ontic types."""
 
@@ -126,6 +661,213 @@ class CreateOnticTypeTestCase(base_test_case.BaseTestCase):
         self.assertIsInstance(ontic_object, my_type)
 
 
+class CopyObjectTestCase(base_test_case.BaseTestCase):
+    """Test the schema driven copies of Ontic objects."""
+
+    def setUp(self):
+        self.copy_type = ontic_type.create_ontic_type('CopyType', {
+            'str_prop': {'type': 'str'},
+            'date_prop': {'type': 'date'},
+            'flat_prop': {'type': 'list', 'member_type': 'str'},
+            'nested_prop': {'type': 'list'},
+            'dict_prop': {'type': 'dict'},
+            'alias_prop': {'type': 'list'},
+            'untyped_prop': {},
+        })
+        flat = ['a', 'b']
+        self.the_object = self.copy_type(
+            str_prop='value', date_prop=date(2020, 1, 1), flat_prop=flat,
+            nested_prop=[['a']], dict_prop={'key': [1]}, alias_prop=flat,
+            untyped_prop=['c'])
+
+    def test_deepcopy(self):
+        """Immutable values are shared and other values are copied."""
+        the_object = self.the_object
+        the_object.extra = ['d']
+        the_copy = deepcopy(the_object)
+        self.assertIs(self.copy_type, type(the_copy))
+        self.assertDictEqual(the_object, the_copy)
+        self.assertIs(the_object.str_prop, the_copy.str_prop)
+        self.assertIs(the_object.date_prop, the_copy.date_prop)
+        for name in ('flat_prop', 'nested_prop', 'dict_prop',
+                     'untyped_prop', 'extra'):
+            self.assertIsNot(the_object[name], the_copy[name])
+        self.assertIsNot(the_object.nested_prop[0], the_copy.nested_prop[0])
+        self.assertIsNot(the_object.dict_prop['key'],
+                         the_copy.dict_prop['key'])
+        self.assertIs(the_copy.flat_prop, the_copy.alias_prop)
+
+        # A value that is not of the declared type is copied.
+        the_object.str_prop = ['e']
+        self.assertIsNot(the_object.str_prop, deepcopy(the_object).str_prop)
+
+    def test_clone(self):
+        """The properties whose values are copied can be chosen."""
+        the_object = self.the_object
+        clone = the_object.clone()
+        self.assertDictEqual(the_object, clone)
+        self.assertIsNot(the_object.nested_prop, clone.nested_prop)
+
+        clone = the_object.clone(shallow_fields=['nested_prop'])
+        self.assertIs(the_object.nested_prop, clone.nested_prop)
+        self.assertIsNot(the_object.dict_prop, clone.dict_prop)
+
+        clone = the_object.clone(deep_fields={'dict_prop'})
+        self.assertIs(the_object.nested_prop, clone.nested_prop)
+        self.assertIsNot(the_object.dict_prop, clone.dict_prop)
+
+        self.assertRaisesRegexp(
+            ValueError,
+            'The properties dict_prop are both shallow and deep fields.',
+            the_object.clone, ['dict_prop'], ['dict_prop'])
+        self.assertRaisesRegexp(
+            ValueError, '"shallow_fields" must be an iterable of property',
+            the_object.clone, 'dict_prop')
+        self.assertRaisesRegexp(
+            ValueError, '"the_object" must be OnticType type.',
+            ontic_type.clone_object, {})
+
+        compact_object = CompactType(prop_1=1, prop_2=['a'])
+        clone = compact_object.clone()
+        self.assertIs(CompactType, type(clone))
+        self.assertEqual(compact_object, clone)
+        self.assertIsNot(compact_object.prop_2, clone.prop_2)
+        clone = compact_object.clone(shallow_fields=['prop_2'])
+        self.assertIs(compact_object.prop_2, clone.prop_2)
+
+    def test_copy_plan(self):
+        """The copy plan follows the schema of the type."""
+        plan = ontic_type.get_copy_plan(self.copy_type)
+        self.assertIs(plan, ontic_type.get_copy_plan(self.copy_type))
+        self.assertIs(ontic_type._copy_collection, plan['dict_prop'])
+        self.assertIs(ontic_type._copy_value, plan['str_prop'])
+
+        self.copy_type.get_schema().str_prop.type = list
+        self.copy_type.clear_validation_plan()
+        plan = ontic_type.get_copy_plan(self.copy_type)
+        self.assertIs(ontic_type._copy_collection, plan['str_prop'])
+
+        # Copies are not validated on assignment.
+        strict_object = StrictType(prop_1=1)
+        dict.__setitem__(strict_object, 'prop_1', 20)
+        self.assertEqual(strict_object, copy(strict_object))
+        self.assertEqual(strict_object, deepcopy(strict_object))
+
+
+class FrozenOnticTypeTestCase(base_test_case.BaseTestCase):
+    """Test the frozen variants of Ontic types."""
+
+    def setUp(self):
+        self.frozen_type = ontic_type.create_ontic_type('FrozenType', {
+            'int_prop': {'type': 'int', 'max': 10},
+            'list_prop': {'type': 'list'},
+            'dict_prop': {'type': 'dict'},
+        }, frozen=True)
+
+    def test_frozen_modification(self):
+        """Frozen objects and their collections cannot be modified."""
+        values = {'int_prop': 1, 'list_prop': [[1]], 'dict_prop': {'a': 1}}
+        the_object = self.frozen_type(values)
+        self.assertDictEqual(values, the_object)
+        self.assertIsInstance(the_object.list_prop, FrozenList)
+        self.assertIsInstance(the_object.list_prop[0], FrozenList)
+        self.assertIsInstance(the_object.dict_prop, FrozenDict)
+        values['list_prop'][0].append(2)
+        self.assertListEqual([[1]], the_object.list_prop)
+        tuple_object = self.frozen_type(list_prop=[(['a'], )])
+        self.assertIsInstance(tuple_object.list_prop[0][0], FrozenList)
+        self.assertRaises(
+            TypeError, tuple_object.list_prop[0][0].append, 'b')
+        self.assertEqual(hash(tuple_object),
+                         hash(self.frozen_type(list_prop=[(['a'], )])))
+
+        for modify in (
+                lambda: setattr(the_object, 'int_prop', 2),
+                lambda: delattr(the_object, 'int_prop'),
+                lambda: the_object.__setitem__('int_prop', 2),
+                lambda: the_object.__delitem__('int_prop'),
+                lambda: the_object.update(int_prop=2),
+                lambda: the_object.setdefault('other', 2),
+                lambda: the_object.pop('int_prop'),
+                the_object.popitem, the_object.clear,
+                lambda: the_object.list_prop.append(2),
+                lambda: the_object.dict_prop.clear()):
+            self.assertRaisesRegexp(
+                TypeError, 'is read-only, it must be replaced or thawed.',
+                modify)
+        self.assertEqual(1, the_object.int_prop)
+        self.assertRaisesRegexp(
+            ValueError, 'A compact type cannot be frozen.',
+            ontic_type.create_ontic_type, 'FrozenCompact', {},
+            compact=True, frozen=True)
+
+    def test_frozen_hash(self):
+        """Frozen objects are hashable, and their hash is computed once."""
+        the_object = self.frozen_type(int_prop=1, list_prop=[1, [2]],
+                                      dict_prop={'a': {3}})
+        other = self.frozen_type(int_prop=1, list_prop=[1, [2]],
+                                 dict_prop={'a': {3}})
+        self.assertIsNone(the_object._hash)
+        self.assertEqual(hash(the_object), hash(other))
+        self.assertEqual(hash(the_object), the_object._hash)
+        self.assertEqual(1, len({the_object, other}))
+        self.assertEqual('value', {the_object: 'value'}[other])
+        self.assertNotEqual(hash(the_object),
+                            hash(self.frozen_type(int_prop=2)))
+
+        self.assertIs(the_object, copy(the_object))
+        self.assertIs(the_object, deepcopy(the_object))
+        self.assertIs(the_object, the_object.freeze())
+        for clone in (pickle.loads(pickle.dumps(the_object, 2)),
+                      cPickle.loads(cPickle.dumps(the_object, 2))):
+            self.assertIsInstance(clone, ontic_type.FrozenOnticType)
+            self.assertEqual(the_object, clone)
+            self.assertEqual(hash(the_object), hash(clone))
+
+    def test_frozen_validation(self):
+        """The validation results of a frozen object are kept."""
+        valid_object = self.frozen_type(int_prop=1)
+        invalid_object = self.frozen_type(int_prop=20)
+        self.assertListEqual([], valid_object.validate())
+        self.assertFalse(invalid_object.is_valid())
+
+        plan = self.frozen_type.get_validation_plan()
+        validator = plan.validator_map['int_prop']
+        validator.validate = validator.is_valid = None
+        self.assertTrue(valid_object.is_valid())
+        self.assertFalse(ontic_type.validate_object(
+            invalid_object, False, 'fast'))
+        self.assertRaises(ValidationException, invalid_object.validate)
+
+        # A new validation plan validates the objects again.
+        self.frozen_type.get_schema().int_prop.max = 30
+        self.frozen_type.clear_validation_plan()
+        self.assertTrue(invalid_object.is_valid())
+
+    def test_freeze_object(self):
+        """Objects are frozen as instances of the frozen variant."""
+        the_object = PickledType(prop_1=1, prop_2='a', extra=['b'])
+        frozen_object = the_object.freeze()
+        frozen_type = type(frozen_object)
+        self.assertEqual('FrozenPickledType', frozen_type.__name__)
+        self.assertIsInstance(frozen_object, PickledType)
+        self.assertIsInstance(frozen_object, ontic_type.FrozenOnticType)
+        self.assertIs(frozen_type, ontic_type.get_frozen_type(PickledType))
+        self.assertIs(frozen_type, ontic_type.get_frozen_type(frozen_type))
+        self.assertEqual(the_object, frozen_object)
+        self.assertIsInstance(frozen_object.extra, FrozenList)
+        self.assertEqual(the_object, thaw(frozen_object))
+        self.assertIs(frozen_type,
+                      type(pickle.loads(pickle.dumps(frozen_object, 2))))
+
+        self.assertRaisesRegexp(
+            ValueError, '"the_object" must be OnticType type.',
+            ontic_type.freeze_object, CompactType())
+        self.assertRaisesRegexp(
+            ValueError, '"ontic_type" must be OnticType or child type',
+            ontic_type.get_frozen_type, dict)
+
+
 class PerfectObjectTestCase(base_test_case.BaseTestCase):
     """Test ontic_type.perfect_object method."""
 
@@ -283,6 +1025,137 @@ class PerfectObjectTestCase(base_test_case.BaseTestCase):
         self.assertSetEqual(default_deep_set, my_object.set_deep_default)
         self.assertIsNot(default_deep_set, my_object.set_deep_default)
 
+    def test_perfect_default_factory(self):
+        """A default factory is called for each perfected object."""
+        my_type = ontic_type.create_ontic_type('PerfectFactory', {
+            'list_prop': {'type': 'list', 'default_factory': list},
+            'int_prop': {'type': 'int', 'default_factory': lambda: 7},
+        })
+        objects = [my_type(), my_type(int_prop=1)]
+        for an_object in objects:
+            an_object.perfect()
+        self.assertListEqual(
+            [{'list_prop': [], 'int_prop': 7},
+             {'list_prop': [], 'int_prop': 1}], objects)
+        self.assertIsNot(objects[0].list_prop, objects[1].list_prop)
+
+    def test_perfect_shared_default(self):
+        """A shared default is a single frozen copy of the default."""
+        default_dict = {'key': ['value']}
+        my_type = ontic_type.create_ontic_type('PerfectShared', {
+            'dict_prop': {'type': 'dict', 'default': default_dict,
+                          'shared_default': True, 'required': True},
+            'list_prop': {'type': 'list', 'default': [1],
+                          'shared_default': True, 'member_type': 'int'},
+        })
+        objects = [my_type(), my_type()]
+        for an_object in objects:
+            an_object.perfect()
+            self.assertListEqual([], an_object.validate())
+
+        first, second = objects
+        self.assertIs(first.dict_prop, second.dict_prop)
+        self.assertIsNot(default_dict, first.dict_prop)
+        self.assertDictEqual(default_dict, first.dict_prop)
+        self.assertIsInstance(first.dict_prop, FrozenDict)
+        self.assertRaises(TypeError, first.dict_prop['key'].append, 'x')
+        self.assertRaises(TypeError, first.list_prop.append, 2)
+
+        # A shared default is replaced on assignment, and is not revalidated
+        # as a mutable value.
+        first.list_prop = thaw(first.list_prop) + [2]
+        self.assertListEqual([1, 2], first.list_prop)
+        self.assertListEqual([1], second.list_prop)
+        second.validate()
+        self.assertSetEqual(set(), second._validation_cache[2])
+
+        clone = deepcopy(second)
+        self.assertEqual(second, clone)
+        self.assertIsInstance(clone.list_prop, FrozenList)
+        clone = pickle.loads(pickle.dumps(second, 2))
+        self.assertIsInstance(clone.dict_prop, FrozenDict)
+
+    def test_perfect_plan(self):
+        """The defaults are resolved once per type."""
+        my_type = ontic_type.create_ontic_type('PerfectPlan', {
+            'str_prop': {'type': 'str', 'default': 'cat'},
+            'list_prop': {'type': 'list', 'default': [1]},
+            'set_prop': {'type': 'set', 'default': {1},
+                         'shared_default': True},
+            'dict_prop': {'type': 'dict', 'default_factory': dict},
+            'int_prop': {'type': 'int'},
+        })
+        names, shared_defaults, made_defaults, no_defaults = \
+            ontic_type.get_perfect_plan(my_type)
+        self.assertSetEqual(
+            {'str_prop', 'list_prop', 'set_prop', 'dict_prop', 'int_prop'},
+            names)
+        self.assertDictEqual({'str_prop': 'cat', 'set_prop': {1}},
+                             dict(shared_defaults))
+        self.assertItemsEqual(['list_prop', 'dict_prop'],
+                              [name for name, _ in made_defaults])
+        self.assertListEqual(['int_prop'], no_defaults)
+        self.assertIs(shared_defaults,
+                      ontic_type.get_perfect_plan(my_type)[1])
+
+        # The plan is made again after a schema modification.
+        my_type.get_schema()['str_prop'].default = 'dog'
+        my_type.clear_validation_plan()
+        self.assertIsNot(shared_defaults,
+                         ontic_type.get_perfect_plan(my_type)[1])
+        the_object = my_type(extra=1)
+        the_object.perfect()
+        self.assertDictEqual(
+            {'str_prop': 'dog', 'list_prop': [1], 'set_prop': {1},
+             'dict_prop': {}, 'int_prop': None}, the_object)
+
+    def test_perfect_many(self):
+        """A batch is perfected as each object in turn."""
+        records = [
+            {'prop_int': 3},
+            {'prop_int': 1, 'prop_str': 'dog', 'extra': 1, 'other': 2},
+            {'prop_str': None, 'prop_list': ['a'], 'prop_any': [1]},
+            {'prop_made': {'a': 1}, 'prop_shared': None},
+            {},
+        ]
+        schema = {
+            'prop_int': {'type': 'int', 'required': True},
+            'prop_str': {'type': 'str', 'default': 'cat'},
+            'prop_list': {'type': 'list', 'default': [1, 2]},
+            'prop_made': {'type': 'dict', 'default_factory': dict},
+            'prop_shared': {'type': 'set', 'default': {1},
+                            'shared_default': True},
+            'prop_any': {},
+        }
+        # Compact types have no room for the extra properties.
+        compact_records = [
+            dict((key, value) for key, value in record.iteritems()
+                 if key in schema) for record in records]
+        for my_type, records in (
+                (ontic_type.create_ontic_type('PerfectMany', schema),
+                 records),
+                (ontic_type.create_ontic_type(
+                    'PerfectManyCompact', schema, compact=True),
+                 compact_records)):
+            expected = [my_type(deepcopy(record)) for record in records]
+            for the_object in expected:
+                the_object.perfect()
+            actual = [my_type(deepcopy(record)) for record in records]
+            my_type.perfect_many(iter(actual))
+            self.assertListEqual(expected, actual)
+            self.assertIsNot(actual[0].prop_list, actual[1].prop_list)
+            self.assertIs(actual[0].prop_shared, actual[1].prop_shared)
+            self.assertEqual(expected[0].validate(False),
+                             actual[0].validate(False))
+
+        self.assertRaisesRegexp(
+            ValueError,
+            '"ontic_type" must be OnticType or child type of OnticType.',
+            ontic_type.perfect_many, dict, [])
+        self.assertRaisesRegexp(
+            ValueError, 'The objects must be instances of "ontic_type".',
+            ontic_type.perfect_many, my_type, [{}])
+
 
 class ValidateObjectTestCase(base_test_case.BaseTestCase):
     """Test ontic_types.validate_object method basics."""
@@ -321,11 +1194,89 @@ class ValidateObjectTestCase(base_test_case.BaseTestCase):
             self.fail('ValidationException should have been thrown.')
         except ValidationException as ve:
             self.assertListEqual(expected_errors, ve.validation_errors)
+            self.assertEqual(1, len(ve.errors))
+            self.assertEqual('some_attr', ve.errors[0].path)
+            self.assertEqual('type', ve.errors[0].rule)
+            self.assertEqual('WRONG', ve.errors[0].value)
+            self.assertIs(my_type.get_schema().some_attr,
+                          ve.errors[0].property_schema)
 
         errors = ontic_type.validate_object(ontic_object,
                                             raise_validation_exception=False)
         self.assertListEqual(expected_errors, errors)
 
+    def test_validation_records(self):
+        """Ensure that the validation errors can be returned as records."""
+        for options in ({}, {'compact': True}, {'frozen': True},
+                        {'validate_on_set': True}):
+            my_type = ontic_type.create_ontic_type('RecordsCheck', {
+                'some_attr': {'type': 'int', 'required': True},
+                'other_attr': {'type': 'str', 'enum': {'dog', 'cat'}},
+            }, **options)
+            if options.get('validate_on_set'):
+                ontic_object = my_type()
+            else:
+                ontic_object = my_type(other_attr='fish')
+            expected = ontic_object.validate(False)
+
+            results = [
+                ontic_object.validate(False, records=True),
+                ontic_type.validate_object(ontic_object, False, records=True),
+            ]
+            if not options.get('frozen'):
+                # A frozen object cannot be perfected.
+                results.append(ontic_object.ensure(False, records=True))
+                results.append(ontic_type.perfect_and_validate(
+                    ontic_object, False, records=True))
+            for errors in results:
+                self.assertTrue(errors)
+                for error in errors:
+                    self.assertIsInstance(error, ValidationError)
+                self.assertListEqual(expected, map(str, errors))
+
+            errors = ontic_object.validate_value(
+                'some_attr', False, records=True)
+            self.assertEqual(1, len(errors))
+            self.assertEqual(('some_attr', 'required'),
+                             (errors[0].path, errors[0].rule))
+            self.assertListEqual(
+                ontic_type.validate_value('some_attr', ontic_object, False),
+                map(str, ontic_type.validate_value(
+                    'some_attr', ontic_object, False, True)))
+
+    def test_fast_mode(self):
+        """Ensure that validate_object supports fail-fast validation."""
+        my_type = ontic_type.create_ontic_type('FastCheck', {
+            'some_attr': {'type': 'int', 'required': True},
+            'other_attr': {'type': 'str', 'enum': {'dog', 'cat'}},
+        })
+        ontic_object = my_type(some_attr=1, other_attr='dog')
+
+        self.assertTrue(ontic_type.validate_object(ontic_object, mode='fast'))
+        self.assertTrue(ontic_type.is_valid(ontic_object))
+        self.assertTrue(ontic_object.is_valid())
+
+        ontic_object.other_attr = 'fish'
+        self.assertFalse(ontic_type.is_valid(ontic_object))
+        self.assertFalse(ontic_object.is_valid())
+        self.assertFalse(ontic_type.validate_object(
+            ontic_object, raise_validation_exception=False, mode='fast'))
+        try:
+            ontic_type.validate_object(ontic_object, mode='fast')
+            self.fail('ValidationException should have been thrown.')
+        except ValidationException as ve:
+            self.assertListEqual([], ve.validation_errors)
+
+        self.assertRaisesRegexp(
+            ValueError,
+            '"mode" must be one of',
+            ontic_type.validate_object, ontic_object, mode='UNKNOWN')
+        self.assertRaisesRegexp(
+            ValueError,
+            'Validation can only support validation of objects derived from '
+            'ontic.ontic_type.OnticType.',
+            ontic_type.is_valid, {})
+
     def test_type_setting(self):
         """Validate 'type' schema setting."""
         schema = {
@@ -902,6 +1853,184 @@ class ValidateObjectTestCase(base_test_case.BaseTestCase):
             ontic_type.validate_object, ontic_object)
 
 
+class ValidateManyTestCase(base_test_case.BaseTestCase):
+    """Test ontic_types.validate_many method."""
+
+    def test_bad_validate_many(self):
+        """ValueError testing of validate_many."""
+        self.assertRaisesRegexp(
+            ValueError,
+            '"ontic_type" must be OnticType or child type of OnticType.',
+            ontic_type.validate_many, None, [])
+        self.assertRaisesRegexp(
+            ValueError,
+            '"ontic_type" must be OnticType or child type of OnticType.',
+            ontic_type.validate_many, dict, [])
+
+        my_type = ontic_type.create_ontic_type('BadMany', {})
+        self.assertRaisesRegexp(
+            ValueError,
+            '"mode" must be one of',
+            ontic_type.validate_many, my_type, [], mode='UNKNOWN')
+        self.assertRaisesRegexp(
+            ValueError,
+            '"workers" must be a positive int.',
+            ontic_type.validate_many, my_type, [], workers=0)
+
+    def test_validate_many(self):
+        """Validate a batch of objects of an OnticType."""
+        my_type = ontic_type.create_ontic_type('ValidateMany', {
+            'prop_a': {'type': 'int', 'required': True},
+            'prop_b': {'type': 'str', 'enum': {'dog', 'cat'}},
+        })
+        objects = [
+            my_type(prop_a=1, prop_b='dog'),
+            my_type(prop_b='fish'),
+            my_type(prop_a=3),
+            {'prop_a': 'four'},
+        ]
+
+        row_errors = ontic_type.validate_many(my_type, objects)
+        self.assertItemsEqual([1, 3], row_errors.keys())
+        self.assertItemsEqual(
+            [('prop_a', 'required'), ('prop_b', 'enum')],
+            [(error.path, error.rule) for error in row_errors[1]])
+        self.assertListEqual(
+            ['The value for "prop_a" is not of type "<type \'int\'>": four'],
+            [str(error) for error in row_errors[3]])
+
+        self.assertDictEqual(row_errors, my_type.validate_batch(objects))
+
+        bitmap = ontic_type.validate_many(my_type, objects, mode='fast')
+        self.assertEqual(bytearray([10]), bitmap)
+        self.assertEqual(bitmap, my_type.validate_batch(objects, 'fast'))
+
+        # Objects of created types are validated in worker processes.
+        self.assertDictEqual(
+            row_errors,
+            ontic_type.validate_many(my_type, objects, workers=2,
+                                     chunk_size=1))
+        self.assertEqual(
+            bitmap, my_type.validate_batch(objects, 'fast', workers=2))
+
+
+ENSURE_SCHEMA = {
+    'prop_int': {'type': 'int', 'required': True, 'min': 2},
+    'prop_str': {'type': 'str', 'default': 'cat', 'enum': {'cat', 'dog'}},
+    'prop_list': {'type': 'list', 'default': [1, 2], 'member_type': 'int'},
+    'prop_made': {'type': 'dict', 'default_factory': dict},
+    'prop_shared': {'type': 'set', 'default': {1},
+                    'shared_default': True},
+    'prop_any': {},
+}
+
+ENSURE_RECORDS = [
+    {'prop_int': 3},
+    {'prop_int': 1, 'prop_str': 'cow', 'extra': 1, 'other': 2},
+    {'prop_str': None, 'prop_list': ['a'], 'prop_any': [1]},
+    {'prop_int': 'three', 'prop_made': {'a': 1}, 'prop_shared': None},
+    {},
+]
+
+
+class PerfectAndValidateTestCase(base_test_case.BaseTestCase):
+    """Test the fused perfect_and_validate functions."""
+
+    def assert_ensure_parity(self, my_type, records=ENSURE_RECORDS):
+        for record in records:
+            expected = my_type(deepcopy(record))
+            ontic_type.perfect_object(expected)
+            expected_errors = expected.validate(False)
+            actual = my_type(deepcopy(record))
+            self.assertListEqual(
+                expected_errors, ontic_type.perfect_and_validate(
+                    actual, raise_validation_exception=False))
+            self.assertEqual(expected, actual)
+            self.assertEqual(expected_errors, actual.validate(False))
+            self.assertEqual(expected.is_valid(), actual.is_valid())
+            if expected_errors:
+                self.assertRaises(ValidationException, actual.ensure)
+            else:
+                self.assertListEqual([], actual.ensure())
+
+            # Validation reuses the results of perfect_and_validate.
+            actual.prop_list.append('b')
+            actual.prop_int = 5
+            expected.prop_list.append('b')
+            expected.prop_int = 5
+            self.assertListEqual(
+                expected.validate(False), actual.validate(False))
+
+        expected = [my_type(deepcopy(record)) for record in records]
+        for the_object in expected:
+            ontic_type.perfect_object(the_object)
+        expected_errors = ontic_type.validate_many(my_type, expected)
+        actual = [my_type(deepcopy(record)) for record in records]
+        self.assertDictEqual(
+            expected_errors,
+            ontic_type.perfect_and_validate_many(my_type, actual))
+        self.assertListEqual(expected, actual)
+        self.assertDictEqual(expected_errors, my_type.ensure_batch(actual))
+
+    def test_perfect_and_validate(self):
+        """Fused perfection and validation equals the two in sequence."""
+        my_type = ontic_type.create_ontic_type('EnsureType', ENSURE_SCHEMA)
+        self.assert_ensure_parity(my_type)
+
+        the_object = my_type(prop_int=3)
+        the_object.ensure()
+        self.assertIsNot(the_object.prop_list,
+                         my_type.get_schema().prop_list.default)
+        other_object = my_type(prop_int=4)
+        other_object.ensure()
+        self.assertIs(the_object.prop_shared, other_object.prop_shared)
+        self.assertIsNot(the_object.prop_list, other_object.prop_list)
+
+        names, steps = ontic_type.get_ensure_plan(my_type)
+        self.assertEqual(frozenset(ENSURE_SCHEMA), names)
+        self.assertItemsEqual(
+            ['prop_str', 'prop_shared'],
+            [name for name, _, default, _ in steps if default is not None])
+        self.assertItemsEqual(
+            ['prop_list', 'prop_made'],
+            [name for name, _, _, make_default in steps
+             if make_default is not None])
+        self.assertIs(steps, ontic_type.get_ensure_plan(my_type)[1])
+        my_type.clear_validation_plan()
+        self.assertIsNot(steps, ontic_type.get_ensure_plan(my_type)[1])
+
+    def test_perfect_and_validate_in_sequence(self):
+        """Compact types and types validated on set are handled in
+        sequence."""
+        # Compact types have no room for the extra properties.
+        self.assert_ensure_parity(
+            ontic_type.create_ontic_type(
+                'EnsureCompact', ENSURE_SCHEMA, compact=True),
+            [dict((key, value) for key, value in record.iteritems()
+                  if key in ENSURE_SCHEMA) for record in ENSURE_RECORDS])
+
+        strict_type = ontic_type.create_ontic_type(
+            'EnsureStrict', ENSURE_SCHEMA, validate_on_set=True)
+        the_object = strict_type(prop_str='dog')
+        self.assertRaises(ValidationException, the_object.ensure)
+        self.assertEqual('dog', the_object.prop_str)
+        self.assertEqual([1, 2], the_object.prop_list)
+
+    def test_bad_perfect_and_validate(self):
+        """ValueError testing of perfect_and_validate."""
+        self.assertRaisesRegexp(
+            ValueError, '"the_object" must be OnticType type.',
+            ontic_type.perfect_and_validate, {})
+        self.assertRaisesRegexp(
+            ValueError,
+            '"ontic_type" must be OnticType or child type of OnticType.',
+            ontic_type.perfect_and_validate_many, dict, [])
+        my_type = ontic_type.create_ontic_type('BadEnsure', {})
+        self.assertRaisesRegexp(
+            ValueError, 'The objects must be instances of "ontic_type".',
+            ontic_type.perfect_and_validate_many, my_type, [{}])
+
+
 class ValidateValueTestCase(base_test_case.BaseTestCase):
     """Test ontic_types.validate_value method."""
 
@@ -0,0 +1,50 @@
+"""Test the lazy import of the submodules of the ontic package."""
+import os
+import subprocess
+import sys
+
+from test.test_utils import base_test_case
+
+import ontic
+
+# : The root directory of the ontic package under test.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PackageTest(base_test_case.BaseTestCase):
+    """Package test cases."""
+
+    def loaded_modules(self, statement):
+        """The ontic modules loaded by a statement in a new interpreter."""
+        output = subprocess.check_output([sys.executable, '-c', (
+            '%s; import sys; print(" ".join(sorted(name for name, module '
+            'in sys.modules.items() if module is not None and '
+            'name.startswith("ontic"))))') % statement], cwd=ROOT_DIR)
+        return output.split()
+
+    def test_lazy_import(self):
+        """Submodules are imported on first access."""
+        self.assertListEqual(['ontic'], self.loaded_modules('import ontic'))
+        loaded = self.loaded_modules('import ontic; ontic.schema_type')
+        self.assertIn('ontic.schema_type', loaded)
+        self.assertNotIn('ontic.ontic_type', loaded)
+        self.assertNotIn('ontic.compile', loaded)
+        self.assertNotIn('ontic.parallel', self.loaded_modules(
+            'from ontic.ontic_type import OnticType'))
+
+    def test_package_attributes(self):
+        """The submodules are attributes of the package."""
+        for name in ontic.__all__:
+            self.assertEqual('ontic.' + name, getattr(ontic, name).__name__)
+        self.assertTrue(set(ontic.__all__).issubset(dir(ontic)))
+        self.assertRaises(AttributeError, getattr, ontic, 'unknown')
+
+    def test_star_import(self):
+        """The star import does not shadow the builtin compile."""
+        self.assertNotIn('compile', ontic.__all__)
+        self.assertEqual('ontic.compile', ontic.compile.__name__)
+        self.assertIn('compile', dir(ontic))
+        names = {}
+        exec 'from ontic import *' in names
+        self.assertNotIn('compile', names)
+        self.assertIn('ontic_type', names)
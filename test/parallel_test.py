@@ -0,0 +1,78 @@
+"""Test the parallel validation of object batches."""
+import pickle
+from pickle import PicklingError
+
+from test.test_utils import base_test_case
+from test.validation_plan_test import PARITY_SCHEMA
+
+from ontic import parallel, validation_plan
+from ontic.schema_type import SchemaType
+
+
+class ParallelTest(base_test_case.BaseTestCase):
+    """Parallel validation test cases."""
+
+    def setUp(self):
+        self.schema = SchemaType(PARITY_SCHEMA)
+        self.plan = validation_plan.ValidationPlan(self.schema)
+        self.rows = [
+            {'required_prop': 1, 'int_prop': 5, 'str_prop': 'abc'},
+            {'int_prop': 1, 'list_prop': ['ab', 'c', 'ABC']},
+            {'required_prop': 1},
+            {'required_prop': 1, 'set_prop': {1, 30}, 'bool_prop': 'no'},
+            {'str_prop': 'ABCDEFG', 'float_prop': 0.1, 'enum_prop': 'fish'},
+        ] * 5
+
+    def test_validate_parallel(self):
+        """Parallel validation reports the same errors as a single process."""
+        expected_errors = self.plan.validate_batch(self.rows)
+
+        for workers, chunk_size in ((1, None), (3, None), (2, 1), (4, 100)):
+            row_errors = parallel.validate_parallel(
+                self.schema, iter(self.rows), workers, chunk_size)
+            self.assertDictEqual(expected_errors, row_errors)
+            for value_errors in row_errors.itervalues():
+                for error in value_errors:
+                    self.assertIs(
+                        self.schema[error.path], error.property_schema)
+
+    def test_parallel_default_factory(self):
+        """Schemas with a lambda default factory are sent to the workers."""
+        schema = SchemaType(PARITY_SCHEMA)
+        schema['list_prop'].default_factory = lambda: ['a']
+        self.assertRaises(PicklingError, pickle.dumps, schema['list_prop'])
+        settings = parallel._worker_settings(schema['list_prop'])
+        self.assertNotIn('default_factory', settings)
+        pickle.dumps(settings)
+        self.assertDictEqual(
+            validation_plan.ValidationPlan(schema).validate_batch(self.rows),
+            parallel.validate_parallel(schema, self.rows, 2))
+
+    def test_check_parallel(self):
+        """Parallel fail-fast checks match a single process."""
+        self.assertEqual(
+            self.plan.check_batch(self.rows),
+            parallel.validate_parallel(
+                self.schema, self.rows, 2, 4, mode='fast'))
+        self.assertEqual(
+            bytearray(),
+            parallel.validate_parallel(self.schema, [], 2, mode='fast'))
+        self.assertDictEqual(
+            {}, parallel.validate_parallel(self.schema, [], 2))
+
+    def test_bad_validate_parallel(self):
+        """ValueError testing of validate_parallel."""
+        for workers in (None, 0, -1, 1.5, True):
+            self.assertRaisesRegexp(
+                ValueError,
+                '"workers" must be a positive int.',
+                parallel.validate_parallel, self.schema, [], workers)
+        for chunk_size in (0, 'ten'):
+            self.assertRaisesRegexp(
+                ValueError,
+                '"chunk_size" must be a positive int.',
+                parallel.validate_parallel, self.schema, [], 2, chunk_size)
+        self.assertRaisesRegexp(
+            ValueError,
+            '"mode" must be one of',
+            parallel.validate_parallel, self.schema, [], 2, mode='UNKNOWN')
@@ -1,7 +1,16 @@
 from test.test_utils import base_test_case
 
-from ontic.property_schema import (PropertySchema, perfect_property_schema,
+import gc
+import pickle
+
+from ontic import meta_type, property_schema as property_schema_module
+from ontic.property_schema import (InternedPropertySchema, PropertySchema,
+                                   create_property_schema,
+                                   get_regex_compile_count,
+                                   intern_property_schema,
+                                   perfect_property_schema,
                                    validate_property_schema)
+from ontic.validation_plan import PropertyValidator
 from ontic.validation_exception import ValidationException
 
 
@@ -15,6 +24,7 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
 
         expected_schema = {
             'default': None,
+            'default_factory': None,
             'enum': None,
             'max': 7,
             'member_max': None,
@@ -23,6 +33,7 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
             'min': 3,
             'regex': None,
             'required': True,
+            'shared_default': False,
             'type': int,
         }
 
@@ -55,6 +66,40 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
             r"""Illegal type declaration: UNDEFINED""",
             PropertySchema, bad_schema_test_case)
 
+        self.assertRaisesRegexp(
+            ValueError,
+            r"""Illegal default_factory declaration: 3""",
+            PropertySchema, {'default_factory': 3})
+        self.assertRaisesRegexp(
+            ValueError,
+            r"""The "default" and "default_factory" settings are """
+            r"""exclusive.""",
+            PropertySchema, {'default': [], 'default_factory': list})
+
+    def test_property_schema_make_default(self):
+        """The default values of the default settings."""
+        self.assertIsNone(PropertySchema(type='list').make_default())
+        self.assertEqual(3, PropertySchema(default=3).make_default())
+        self.assertListEqual(
+            [], PropertySchema(default_factory=list).make_default())
+
+        default = [['a']]
+        property_schema = PropertySchema(type='list', default=default)
+        self.assertListEqual(default, property_schema.make_default())
+        self.assertIsNot(default, property_schema.make_default())
+        self.assertIsNot(property_schema.make_default(),
+                         property_schema.make_default())
+
+        property_schema.shared_default = True
+        shared = property_schema.make_default()
+        self.assertListEqual(default, shared)
+        self.assertIs(shared, property_schema.make_default())
+        self.assertRaises(TypeError, shared[0].append, 'b')
+
+        # A new default setting is frozen again.
+        property_schema.default = ['b']
+        self.assertListEqual(['b'], property_schema.make_default())
+
     def test_property_schema_validate(self):
         """Test PropertySchema.validate method."""
         property_schema = PropertySchema()
@@ -70,10 +115,11 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
     def test_property_schema_perfect(self):
         """Test PropertySchema.perfect method."""
         candidate_schema_property = PropertySchema()
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'default': None,
+                'default_factory': None,
                 'enum': None,
                 'member_max': None,
                 'member_min': None,
@@ -82,13 +128,14 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
                 'min': None,
                 'regex': None,
                 'required': False,
+                'shared_default': False,
                 'type': None
             },
             candidate_schema_property)
 
         candidate_schema_property.perfect()
 
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -96,8 +143,10 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': False,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': None
@@ -111,7 +160,7 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
                 'required': True,
                 'UNRECOGNIZED': 'irrelevant',
             })
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -119,8 +168,10 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': True,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': int
@@ -129,7 +180,7 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
 
         candidate_schema_property.perfect()
 
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -137,13 +188,157 @@ class PropertySchemaTest(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': True,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': int
             }, candidate_schema_property)
 
+    def test_property_schema_regex_pattern(self):
+        """Test the compiled regex pattern of a PropertySchema."""
+        compile_count = get_regex_compile_count()
+        property_schema = PropertySchema(type='str', regex='^a+$')
+        self.assertEqual(compile_count + 1, get_regex_compile_count())
+
+        pattern = property_schema.regex_pattern
+        self.assertEqual('^a+$', pattern.pattern)
+        self.assertIs(pattern, property_schema.regex_pattern)
+        self.assertNotIn('_regex_pattern', property_schema)
+        self.assertEqual(compile_count + 1, get_regex_compile_count())
+
+        # A changed regex is compiled again on access.
+        property_schema.regex = '^b+$'
+        self.assertEqual('^b+$', property_schema.regex_pattern.pattern)
+        self.assertEqual(compile_count + 2, get_regex_compile_count())
+
+        property_schema['regex'] = None
+        self.assertIsNone(property_schema.regex_pattern)
+        self.assertIsNone(PropertySchema(type='str').regex_pattern)
+        self.assertEqual(compile_count + 2, get_regex_compile_count())
+
+        self.assertRaisesRegexp(
+            ValueError,
+            r'Illegal regex declaration: \(',
+            PropertySchema, type='str', regex='(')
+
+    def test_property_schema_pickle(self):
+        """Ensure that PropertySchema supports pickling."""
+        property_schema = PropertySchema(type='str', regex='^a+$', min=1)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            the_copy = pickle.loads(pickle.dumps(property_schema, protocol))
+            self.assertIsInstance(the_copy, PropertySchema)
+            self.assertDictEqual(property_schema, the_copy)
+            self.assertEqual('^a+$', the_copy.regex_pattern.pattern)
+
+
+class InternPropertySchemaTestCase(base_test_case.BaseTestCase):
+    """Test the shared and trusted property schemas."""
+
+    def tearDown(self):
+        property_schema_module.clear_interned_property_schemas()
+
+    def test_intern_property_schema(self):
+        """Identical definitions share one read-only property schema."""
+        definition = {'type': 'list', 'default': [1], 'required': True}
+        interned = intern_property_schema(definition)
+        self.assertIsInstance(interned, InternedPropertySchema)
+        self.assertDictEqual(PropertySchema(definition), interned)
+        self.assertIs(interned, intern_property_schema(definition))
+        self.assertIs(interned, intern_property_schema(
+            {'type': list, 'default': [1], 'required': True}))
+        self.assertIs(interned, intern_property_schema(interned))
+        self.assertIsNot(interned, intern_property_schema(
+            {'type': 'list', 'default': [1.0], 'required': True}))
+        self.assertIsNot(interned, intern_property_schema(
+            {'type': 'list', 'default': [1]}))
+
+        # The settings are copied, and cannot be modified.
+        definition['default'].append(2)
+        self.assertListEqual([1], interned.default)
+        self.assertRaisesRegexp(
+            TypeError, 'is read-only', setattr, interned, 'required', False)
+        self.assertRaises(TypeError, interned.update, required=False)
+        perfect_property_schema(interned)
+        self.assertListEqual([], validate_property_schema(interned))
+        self.assertTrue(interned.is_valid())
+        self.assertIsNot(interned.default, interned.make_default())
+
+        # The nested settings are frozen, and the defaults are not.
+        self.assertRaises(TypeError, interned.default.append, 2)
+        enum_schema = intern_property_schema(
+            {'type': 'str', 'enum': {'a', 'b'}})
+        self.assertRaises(TypeError, enum_schema.enum.add, 'c')
+        self.assertTrue(enum_schema.is_valid())
+        default = interned.make_default()
+        default.append(2)
+        self.assertIs(list, type(default))
+        self.assertListEqual([1], interned.default)
+
+        self.assertIs(interned, pickle.loads(pickle.dumps(interned, 2)))
+        property_schema_module.clear_interned_property_schemas()
+        the_copy = pickle.loads(pickle.dumps(interned, 2))
+        self.assertIsNot(interned, the_copy)
+        self.assertDictEqual(interned, the_copy)
+
+        # A schema no longer in use is freed.
+        definition = {'type': 'int', 'min': 7}
+        key = property_schema_module._definition_key(definition)
+        interned = intern_property_schema(definition)
+        self.assertIs(interned, property_schema_module._interned[key])
+        del interned
+        gc.collect()
+        self.assertNotIn(key, property_schema_module._interned)
+
+        # Unhashable settings are not shared.
+        unhashable = {'default': bytearray('a')}
+        self.assertIsNot(intern_property_schema(unhashable),
+                         intern_property_schema(unhashable))
+
+    def test_intern_property_schema_errors(self):
+        """Definitions are validated when first interned."""
+        self.assertRaises(ValidationException, intern_property_schema,
+                          {'type': 'str', 'required': 'yes'})
+        self.assertRaisesRegexp(
+            ValueError, 'Illegal type declaration: bad',
+            intern_property_schema, {'type': 'bad'})
+        trusted = intern_property_schema(
+            {'type': 'str', 'required': 'yes'}, trusted=True)
+        self.assertEqual('yes', trusted.required)
+
+    def test_create_property_schema(self):
+        """Trusted definitions are perfected without validation."""
+        property_schema = create_property_schema(
+            {'type': 'int', 'min': 'low', 'extra': 1}, trusted=True)
+        self.assertIs(int, property_schema.type)
+        self.assertNotIn('extra', property_schema)
+        self.assertEqual('low', property_schema.min)
+        self.assertRaises(ValidationException, create_property_schema,
+                          {'type': 'int', 'min': 'low'})
+        self.assertDictEqual(PropertySchema(type='int', regex='^a'),
+                             create_property_schema(
+                                 {'type': 'int', 'regex': '^a'}, True))
+
+    def test_shared_validator_functions(self):
+        """Validators of an interned property schema share functions."""
+        interned = intern_property_schema({'type': 'int', 'max': 3})
+        validator = PropertyValidator('prop', interned)
+        other = PropertyValidator('prop', interned)
+        self.assertIs(validator.validate, other.validate)
+        self.assertIs(validator.is_valid, other.is_valid)
+        self.assertIsNot(validator.validate,
+                         PropertyValidator('other', interned).validate)
+        self.assertFalse(other.is_valid(4))
+
+        other.memoize(8)
+        self.assertIsNot(validator.validate, other.validate)
+        self.assertIsNot(
+            PropertyValidator('prop', PropertySchema(interned)).validate,
+            PropertyValidator('prop', PropertySchema(interned)).validate)
+
 
 class ValidateSchemaProperty(base_test_case.BaseTestCase):
     """Various tests of the 'validate_property_schema' method."""
@@ -178,6 +373,44 @@ class ValidateSchemaProperty(base_test_case.BaseTestCase):
         self.assertTrue(value_errors[0].startswith(
             'The value "UNKNOWN" for "type" not in enumeration'))
 
+    def test_validate_schema_property_fast_mode(self):
+        """Test validate_property_schema fail-fast validation."""
+        property_schema = PropertySchema(type='int', min=3)
+        self.assertTrue(validate_property_schema(property_schema, mode='fast'))
+        self.assertTrue(property_schema.is_valid())
+
+        property_schema.type = 'UNKNOWN'
+        self.assertFalse(property_schema.is_valid())
+        self.assertFalse(validate_property_schema(
+            property_schema, raise_validation_exception=False, mode='fast'))
+        try:
+            validate_property_schema(property_schema, mode='fast')
+            self.fail('A ValidationException should have been thrown.')
+        except ValidationException as ve:
+            self.assertListEqual([], ve.validation_errors)
+
+        self.assertRaisesRegexp(
+            ValueError,
+            '"mode" must be one of',
+            validate_property_schema, property_schema, mode='UNKNOWN')
+
+
+    def test_validate_schema_property_parity(self):
+        """The compiled meta-schema reports the errors of meta_type."""
+        property_schema = PropertySchema(type='int')
+        for setting, value in (
+                ('required', 'yes'), ('min', 'low'), ('regex', 7),
+                ('enum', ['a']), ('shared_default', 1), ('type', 'UNKNOWN')):
+            property_schema[setting] = value
+            expected_errors = []
+            for name, setting_schema in (
+                    property_schema.get_schema().iteritems()):
+                expected_errors.extend(meta_type.validate_value(
+                    name, setting_schema, property_schema.get(name)))
+            self.assertListEqual(expected_errors, validate_property_schema(
+                property_schema, raise_validation_exception=False))
+        self.assertEqual(6, len(expected_errors))
+
 
 class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
     """Test cases for the perfect_property_schema method."""
@@ -185,10 +418,11 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
     def test_perfect_empty_schema_property(self):
         """Validate the perfection of an empty schema property."""
         candidate_schema_property = PropertySchema()
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'default': None,
+                'default_factory': None,
                 'enum': None,
                 'member_max': None,
                 'member_min': None,
@@ -197,13 +431,14 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
                 'min': None,
                 'regex': None,
                 'required': False,
+                'shared_default': False,
                 'type': None
             },
             candidate_schema_property)
 
         perfect_property_schema(candidate_schema_property)
 
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -211,8 +446,10 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': False,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': None
@@ -226,7 +463,7 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
                 'required': True,
                 'UNRECOGNIZED': 'irrelevant',
             })
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -234,8 +471,10 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': True,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': int
@@ -244,7 +483,7 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
 
         perfect_property_schema(candidate_schema_property)
 
-        self.assertEqual(10, len(candidate_schema_property))
+        self.assertEqual(12, len(candidate_schema_property))
         self.assertDictEqual(
             {
                 'regex': None,
@@ -252,8 +491,10 @@ class PerfectSchemaPropertyTestCase(base_test_case.BaseTestCase):
                 'enum': None,
                 'min': None,
                 'default': None,
+                'default_factory': None,
                 'max': None,
                 'required': True,
+                'shared_default': False,
                 'member_min': None,
                 'member_type': None,
                 'type': int
@@ -1,10 +1,12 @@
 """Test the basic functionality of the schema data types."""
+import copy
+import pickle
 
 from test_utils import base_test_case
 
-from ontic.property_schema import PropertySchema
-from ontic import schema_type
-from ontic.schema_type import SchemaType
+from ontic.property_schema import InternedPropertySchema, PropertySchema
+from ontic import ontic_type, schema_type
+from ontic.schema_type import LazySchemaType, SchemaType
 from ontic.validation_exception import ValidationException
 
 
@@ -30,8 +32,8 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
             'prop2': PropertySchema({'type': 'str', 'min': 5})
         })
         self.assertEqual(2, len(candidate_schema))
-        self.assertEqual(10, len(candidate_schema.prop1))
-        self.assertEqual(10, len(candidate_schema.prop2))
+        self.assertEqual(12, len(candidate_schema.prop1))
+        self.assertEqual(12, len(candidate_schema.prop2))
         self.maxDiff = None
         self.assertDictEqual(
             {
@@ -41,8 +43,10 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
                     'enum': None,
                     'min': None,
                     'default': None,
+                    'default_factory': None,
                     'max': None,
                     'required': False,
+                    'shared_default': False,
                     'member_min': None,
                     'member_type': None,
                     'type': None
@@ -53,8 +57,10 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
                     'enum': None,
                     'min': 5.0,
                     'default': None,
+                    'default_factory': None,
                     'max': None,
                     'required': False,
+                    'shared_default': False,
                     'member_min': None,
                     'member_type': None,
                     'type': str
@@ -64,12 +70,13 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
         candidate_schema.perfect()
 
         self.assertEqual(2, len(candidate_schema))
-        self.assertEqual(10, len(candidate_schema.prop1))
-        self.assertEqual(10, len(candidate_schema.prop2))
+        self.assertEqual(12, len(candidate_schema.prop1))
+        self.assertEqual(12, len(candidate_schema.prop2))
         self.assertDictEqual(
             {
                 'prop1': {
                     'default': None,
+                    'default_factory': None,
                     'enum': None,
                     'member_max': None,
                     'member_min': None,
@@ -78,10 +85,12 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
                     'min': None,
                     'regex': None,
                     'required': False,
+                    'shared_default': False,
                     'type': None
                 },
                 'prop2': {
                     'default': None,
+                    'default_factory': None,
                     'enum': None,
                     'member_max': None,
                     'member_min': None,
@@ -90,6 +99,7 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
                     'min': 5.0,
                     'regex': None,
                     'required': False,
+                    'shared_default': False,
                     'type': str
                 }
             }, candidate_schema)
@@ -112,6 +122,120 @@ class SchemaTypeTest(base_test_case.BaseTestCase):
         schema_type.validate_schema(schema_type_schema)
 
 
+class CreateSchemaTestCase(base_test_case.BaseTestCase):
+    """Test the creation of schemas with shared property schemas."""
+
+    def test_create_schema(self):
+        """Schemas share the interned property schemas."""
+        definition = {'prop': {'type': 'str', 'required': True}}
+        schema = schema_type.create_schema(definition)
+        self.assertIsInstance(schema, SchemaType)
+        self.assertIs(PropertySchema, type(schema.prop))
+
+        schema = schema_type.create_schema(definition, interned=True)
+        other = schema_type.create_schema(definition, interned=True)
+        self.assertIsInstance(schema.prop, InternedPropertySchema)
+        self.assertIs(schema.prop, other.prop)
+        self.assertDictEqual(SchemaType(definition), schema)
+        self.assertListEqual([], schema.validate())
+
+        trusted = schema_type.create_schema(
+            {'prop': {'type': 'str', 'min': 'low'}}, trusted=True)
+        self.assertIs(PropertySchema, type(trusted.prop))
+        self.assertEqual('low', trusted.prop.min)
+        self.assertRaisesRegexp(
+            ValueError, '"definition" must be a dict.',
+            schema_type.create_schema, [('prop', {})])
+
+    def test_create_ontic_type_interned(self):
+        """Created types share the plans of the interned property schemas.
+        """
+        definition = {'prop': {'type': 'int', 'max': 3}}
+        type_1 = ontic_type.create_ontic_type(
+            'Interned1', definition, interned=True)
+        type_2 = ontic_type.create_ontic_type(
+            'Interned2', definition, interned=True, trusted=True)
+        self.assertIs(type_1.get_schema().prop, type_2.get_schema().prop)
+        self.assertIs(
+            type_1.get_validation_plan().validator_map['prop'].validate,
+            type_2.get_validation_plan().validator_map['prop'].validate)
+        self.assertFalse(type_2(prop=4).is_valid())
+
+
+class LazySchemaTestCase(base_test_case.BaseTestCase):
+    """Test the schemas whose property schemas are made on first use."""
+
+    def test_lazy_schema(self):
+        """Property schemas are made and validated when first read."""
+        schema = schema_type.create_schema({
+            'good': {'type': 'int', 'min': 1},
+            'bad': {'type': 'int', 'min': 'one'},
+        }, lazy=True)
+        self.assertIsInstance(schema, LazySchemaType)
+        self.assertIs(dict, type(dict.__getitem__(schema, 'good')))
+
+        good = schema.good
+        self.assertIs(PropertySchema, type(good))
+        self.assertIs(good, dict.__getitem__(schema, 'good'))
+        self.assertIs(good, schema.get('good'))
+        self.assertIsNone(schema.get('other'))
+        self.assertIs(dict, type(dict.__getitem__(schema, 'bad')))
+        self.assertRaises(ValidationException, schema.__getitem__, 'bad')
+        self.assertRaises(ValidationException, schema.materialize)
+        self.assertRaises(ValidationException, schema.values)
+
+        self.assertIs(good, schema.pop('good'))
+        self.assertEqual(1, schema.pop('other', 1))
+        self.assertRaises(KeyError, schema.pop, 'other')
+        schema['bad'] = {'type': 'int', 'min': 1}
+        self.assertEqual(good, schema.setdefault('bad'))
+        self.assertEqual(('bad', good), schema.popitem())
+        self.assertRaises(KeyError, schema.popitem)
+
+    def test_lazy_schema_parity(self):
+        """A materialized lazy schema equals the eager schema."""
+        definition = {
+            'prop_1': {'type': 'str', 'required': True},
+            'prop_2': {'type': 'list', 'member_type': 'int'},
+        }
+        eager = SchemaType(definition)
+        lazy = schema_type.create_schema(definition, lazy=True)
+        self.assertEqual(lazy, eager)
+        self.assertFalse(lazy != eager)
+        self.assertDictEqual(eager, dict(lazy))
+        self.assertIsNone(schema_type.materialize_schema(eager))
+        self.assertRaisesRegexp(
+            ValueError, '"candidate_schema" must be of SchemaType.',
+            schema_type.materialize_schema, {})
+
+        lazy = schema_type.create_schema(definition, lazy=True)
+        self.assertListEqual(sorted(eager.items()), sorted(lazy.items()))
+        self.assertListEqual([], lazy.validate())
+
+        lazy_type = ontic_type.create_ontic_type(
+            'LazyType', definition, lazy=True)
+        eager_type = ontic_type.create_ontic_type('EagerType', eager)
+        for value in ({}, {'prop_1': 'a', 'prop_2': [1, 'b']}):
+            self.assertListEqual(
+                eager_type(value).validate(raise_validation_exception=False),
+                lazy_type(value).validate(raise_validation_exception=False))
+
+    def test_lazy_schema_copy(self):
+        """Copies of a lazy schema keep its options and laziness."""
+        definition = {'prop_1': {'type': 'str'}, 'prop_2': {'type': 'int'}}
+        schema = schema_type.create_schema(
+            definition, interned=True, lazy=True)
+        prop_1 = schema.prop_1
+
+        for the_copy in (copy.copy(schema), copy.deepcopy(schema),
+                         pickle.loads(pickle.dumps(schema))):
+            self.assertIsInstance(the_copy, LazySchemaType)
+            self.assertIs(dict, type(dict.__getitem__(the_copy, 'prop_2')))
+            self.assertIs(prop_1, the_copy.prop_1)
+            self.assertIsInstance(the_copy.prop_2, InternedPropertySchema)
+            self.assertEqual(schema, the_copy)
+
+
 class ValidateSchemaTestCase(base_test_case.BaseTestCase):
     """Test schema_types.validate_schema method."""
 
@@ -169,6 +293,22 @@ class ValidateSchemaTestCase(base_test_case.BaseTestCase):
             raise_validation_exception=False)
         self.assertListEqual(expected_errors_list, errors)
 
+    def test_validate_schema_fast_mode(self):
+        """Ensure validate_schema supports fail-fast validation."""
+        schema_instance = SchemaType(
+            some_attr={'type': 'int'}, other_attr={'type': 'str'})
+        self.assertTrue(schema_type.validate_schema(
+            schema_instance, mode='fast'))
+        self.assertTrue(schema_instance.is_valid())
+
+        schema_instance.other_attr.required = 'UNDEFINED'
+        self.assertFalse(schema_instance.is_valid())
+        self.assertFalse(schema_type.validate_schema(
+            schema_instance, raise_validation_exception=False, mode='fast'))
+        self.assertRaises(
+            ValidationException,
+            schema_type.validate_schema, schema_instance, mode='fast')
+
 
 class PerfectSchemaTestCase(base_test_case.BaseTestCase):
     """Test cases for use of the perfect_schema method."""
@@ -180,8 +320,8 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
             'prop2': PropertySchema({'type': 'str', 'min': 5})
         })
         self.assertEqual(2, len(candidate_schema))
-        self.assertEqual(10, len(candidate_schema.prop1))
-        self.assertEqual(10, len(candidate_schema.prop2))
+        self.assertEqual(12, len(candidate_schema.prop1))
+        self.assertEqual(12, len(candidate_schema.prop2))
         self.maxDiff = None
         self.assertDictEqual(
             {
@@ -191,8 +331,10 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
                     'enum': None,
                     'min': None,
                     'default': None,
+                    'default_factory': None,
                     'max': None,
                     'required': False,
+                    'shared_default': False,
                     'member_min': None,
                     'member_type': None,
                     'type': None
@@ -203,8 +345,10 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
                     'enum': None,
                     'min': 5.0,
                     'default': None,
+                    'default_factory': None,
                     'max': None,
                     'required': False,
+                    'shared_default': False,
                     'member_min': None,
                     'member_type': None,
                     'type': str
@@ -214,12 +358,13 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
         schema_type.perfect_schema(candidate_schema)
 
         self.assertEqual(2, len(candidate_schema))
-        self.assertEqual(10, len(candidate_schema.prop1))
-        self.assertEqual(10, len(candidate_schema.prop2))
+        self.assertEqual(12, len(candidate_schema.prop1))
+        self.assertEqual(12, len(candidate_schema.prop2))
         self.assertDictEqual(
             {
                 'prop1': {
                     'default': None,
+                    'default_factory': None,
                     'enum': None,
                     'member_max': None,
                     'member_min': None,
@@ -228,10 +373,12 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
                     'min': None,
                     'regex': None,
                     'required': False,
+                    'shared_default': False,
                     'type': None
                 },
                 'prop2': {
                     'default': None,
+                    'default_factory': None,
                     'enum': None,
                     'member_max': None,
                     'member_min': None,
@@ -240,6 +387,7 @@ class PerfectSchemaTestCase(base_test_case.BaseTestCase):
                     'min': 5.0,
                     'regex': None,
                     'required': False,
+                    'shared_default': False,
                     'type': str
                 }
             }, candidate_schema)
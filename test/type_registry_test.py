@@ -0,0 +1,191 @@
+"""Test the registry of Ontic types."""
+from datetime import date
+import gc
+
+from test.test_utils import base_test_case
+
+from ontic import ontic_type, type_registry
+from ontic.schema_type import SchemaType, create_schema
+
+
+class TypeRegistryTest(base_test_case.BaseTestCase):
+    """Type registry test cases."""
+
+    def tearDown(self):
+        type_registry.set_registry_capacity(type_registry.DEFAULT_CAPACITY)
+        type_registry.clear_registry()
+
+    def test_schema_fingerprint(self):
+        """Fingerprints follow the schema settings, not the schema order."""
+        schema_def = {
+            'prop_1': {'type': 'int', 'enum': {3, 1, 2}},
+            'prop_2': {'type': 'date', 'default': date(2000, 1, 1)},
+            'prop_3': {'type': 'list', 'member_type': 'str',
+                       'default': ['a', 'b']},
+        }
+        fingerprint = type_registry.schema_fingerprint(SchemaType(schema_def))
+        self.assertEqual(40, len(fingerprint))
+        self.assertEqual(
+            fingerprint,
+            type_registry.schema_fingerprint(
+                SchemaType(reversed(schema_def.items()))))
+
+        schema_def['prop_1'] = {'type': 'int', 'enum': {3, 1}}
+        self.assertNotEqual(
+            fingerprint,
+            type_registry.schema_fingerprint(SchemaType(schema_def)))
+        self.assertNotEqual(
+            type_registry.schema_fingerprint(SchemaType(a={'type': 'int'})),
+            type_registry.schema_fingerprint(SchemaType(a={'type': 'long'})))
+
+    def test_register_type(self):
+        """Register, find and remove a type."""
+        my_type = ontic_type.create_ontic_type(
+            'Registered', {'prop': {'type': 'int'}})
+        key = type_registry.type_key(my_type)
+        self.assertEqual('Registered', key[0])
+        self.assertIsNone(type_registry.get_registered_type(key))
+
+        self.assertEqual(key, type_registry.register_type(my_type))
+        self.assertIs(my_type, type_registry.get_registered_type(key))
+
+        # A type of another name is registered under another key.
+        other_type = ontic_type.create_ontic_type(
+            'OtherRegistered', {'prop': {'type': 'int'}})
+        other_key = type_registry.register_type(other_type)
+        self.assertNotEqual(key, other_key)
+        self.assertEqual(key[1], other_key[1])
+
+        type_registry.unregister_type(my_type)
+        self.assertIsNone(type_registry.get_registered_type(key))
+        self.assertIs(other_type,
+                      type_registry.get_registered_type(other_key))
+        type_registry.unregister_type(my_type)
+
+        type_registry.clear_registry()
+        self.assertIsNone(type_registry.get_registered_type(other_key))
+
+    def test_registry_lookups(self):
+        """Registered types are found by key or fingerprint, and counted."""
+        schema = SchemaType({'prop': {'type': 'int'}})
+        type_1 = ontic_type.create_ontic_type('Found1', schema)
+        type_2 = ontic_type.create_ontic_type('Found2', schema)
+        fingerprint = type_registry.register_type(type_2)[1]
+        self.assertEqual(('Found1', fingerprint),
+                         type_registry.register_type(type_1, fingerprint))
+
+        self.assertListEqual(
+            [type_1, type_2],
+            type_registry.find_registered_types(fingerprint))
+        self.assertListEqual([], type_registry.find_registered_types('0'))
+        self.assertIsNone(
+            type_registry.get_registered_type(('Found3', fingerprint)))
+        self.assertDictEqual(
+            {'hits': 2, 'misses': 1, 'live': 2, 'retained': 2,
+             'capacity': type_registry.DEFAULT_CAPACITY, 'evictions': 0},
+            type_registry.registry_stats())
+
+        type_registry.unregister_type(type_1)
+        self.assertListEqual(
+            [type_2], type_registry.find_registered_types(fingerprint))
+        self.assertEqual(1, type_registry.registry_stats()['retained'])
+
+    def test_registry_eviction(self):
+        """Types that are neither recently used nor referenced are freed."""
+        type_registry.set_registry_capacity(2)
+        kept = ontic_type.create_ontic_type('Kept', {'prop': {'type': 'int'}})
+        keys = [type_registry.register_type(kept)]
+        keys.extend(type_registry.register_type(ontic_type.create_ontic_type(
+            'Evicted%d' % index, {'prop': {'type': 'int'}}))
+            for index in xrange(3))
+        gc.collect()
+
+        stats = type_registry.registry_stats()
+        self.assertEqual(2, stats['retained'])
+        self.assertEqual(3, stats['live'])
+        self.assertIs(kept, type_registry.get_registered_type(keys[0]))
+        self.assertIsNone(type_registry.get_registered_type(keys[1]))
+        self.assertIsNotNone(type_registry.get_registered_type(keys[3]))
+
+        # A registry of no capacity holds no type.
+        type_registry.set_registry_capacity(None)
+        del kept
+        gc.collect()
+        self.assertEqual(0, type_registry.registry_stats()['live'])
+        self.assertRaisesRegexp(
+            ValueError, '"capacity" must be a non-negative int or None.',
+            type_registry.set_registry_capacity, -1)
+
+    def test_create_registered_type(self):
+        """Types of the same name, schema and options are created once."""
+        definition = {'prop': {'type': 'int', 'min': 1}}
+        my_type = ontic_type.create_ontic_type(
+            'Deduplicated', definition, registered=True)
+        self.assertIs(my_type, ontic_type.create_ontic_type(
+            'Deduplicated', {'prop': {'type': int, 'min': 1}},
+            registered=True))
+        self.assertIs(my_type, ontic_type.create_ontic_type(
+            'Deduplicated', definition, interned=True, registered=True))
+        self.assertIs(my_type, type_registry.get_registered_type(
+            type_registry.type_key(my_type)))
+
+        self.assertIsNot(my_type, ontic_type.create_ontic_type(
+            'Deduplicated', definition))
+        self.assertIsNot(my_type, ontic_type.create_ontic_type(
+            'Other', definition, registered=True))
+        self.assertIsNot(my_type, ontic_type.create_ontic_type(
+            'Deduplicated', {'prop': {'type': 'int', 'min': 2}},
+            registered=True))
+        compact_type = ontic_type.create_ontic_type(
+            'Deduplicated', definition, compact=True, registered=True)
+        self.assertTrue(issubclass(compact_type, ontic_type.CompactOnticType))
+        self.assertIs(compact_type, ontic_type.create_ontic_type(
+            'Deduplicated', definition, compact=True, registered=True))
+
+    def test_interned_fingerprint(self):
+        """Interned schemas, with frozen settings, fingerprint as plain."""
+        definition = {
+            'tags': {'type': 'list', 'default': [1, [2]]},
+            'kind': {'type': 'str', 'enum': {'a', 'b'}},
+            'extra': {'type': 'dict', 'default': {'a': [1]}},
+        }
+        self.assertEqual(
+            type_registry.schema_fingerprint(create_schema(definition)),
+            type_registry.schema_fingerprint(
+                create_schema(definition, interned=True)))
+        my_type = ontic_type.create_ontic_type(
+            'Interned', definition, registered=True)
+        self.assertIs(my_type, ontic_type.create_ontic_type(
+            'Interned', definition, interned=True, registered=True))
+
+    def test_registered_default_factories(self):
+        """Types with different default factories are not shared."""
+        def make_closure(value):
+            return lambda: value
+
+        for first, second in ((lambda: [1], lambda: [2]),
+                              (make_closure(1), make_closure(2))):
+            first_type = ontic_type.create_ontic_type(
+                'Factory', {'x': {'default_factory': first}},
+                registered=True)
+            second_type = ontic_type.create_ontic_type(
+                'Factory', {'x': {'default_factory': second}},
+                registered=True)
+            self.assertIsNot(first_type, second_type)
+            self.assertIs(first_type, ontic_type.create_ontic_type(
+                'Factory', {'x': {'default_factory': first}},
+                registered=True))
+            the_object = second_type()
+            the_object.perfect()
+            self.assertEqual(second(), the_object.x)
+
+        # Factories found by module and name are shared.
+        self.assertTrue(type_registry.is_importable(date))
+        self.assertFalse(type_registry.is_importable(make_closure))
+        self.assertIs(
+            ontic_type.create_ontic_type(
+                'Factory', {'x': {'default_factory': dict}},
+                registered=True),
+            ontic_type.create_ontic_type(
+                'Factory', {'x': {'default_factory': dict}},
+                registered=True))
@@ -0,0 +1,79 @@
+"""Test the validation error records and the validation exception."""
+import pickle
+
+from test.test_utils import base_test_case
+
+from ontic.property_schema import PropertySchema
+from ontic.validation_exception import ValidationError, ValidationException
+
+
+class ValidationErrorTest(base_test_case.BaseTestCase):
+    """ValidationError test cases."""
+
+    def test_validation_error_record(self):
+        """A ValidationError records the details of the failure."""
+        property_schema = PropertySchema(type='list', enum={'dog', 'cat'})
+        error = ValidationError(
+            'some_prop', 'member_enum', 'fish', property_schema)
+
+        self.assertEqual('some_prop', error.path)
+        self.assertEqual('member_enum', error.rule)
+        self.assertEqual('fish', error.value)
+        self.assertIs(property_schema, error.property_schema)
+        self.assertEqual(
+            'The value "fish" for "some_prop" not in enumeration '
+            '[\'cat\', \'dog\'].',
+            error.message)
+        self.assertEqual(error.message, str(error))
+
+    def test_validation_error_pickle(self):
+        """Ensure that ValidationError supports pickling."""
+        error = ValidationError(
+            'some_prop', 'min', 1, PropertySchema(type='int', min=3))
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            the_copy = pickle.loads(pickle.dumps(error, protocol))
+            self.assertEqual('some_prop', the_copy.path)
+            self.assertEqual('min', the_copy.rule)
+            self.assertEqual(str(error), str(the_copy))
+
+
+class ValidationExceptionTest(base_test_case.BaseTestCase):
+    """ValidationException test cases."""
+
+    def test_lazy_messages(self):
+        """Error messages are only rendered on access."""
+        property_schema = PropertySchema(type='set', enum={1, 2})
+        errors = [ValidationError('prop', 'member_enum', 3, property_schema)]
+        exception = ValidationException(errors)
+
+        self.assertIs(errors, exception.errors)
+        # Messages are rendered from the schema when first read.
+        property_schema.enum = {1, 2, 5}
+        self.assertListEqual(
+            ['The value "3" for "prop" not in enumeration [1, 2, 5].'],
+            exception.validation_errors)
+        self.assertIs(exception.validation_errors,
+                      exception.validation_errors)
+        self.assertEqual(
+            'The value "3" for "prop" not in enumeration [1, 2, 5].',
+            str(exception))
+
+    def test_string_errors(self):
+        """Error message strings are supported."""
+        exception = ValidationException(['Error one.', 'Error two.'])
+        self.assertListEqual(
+            ['Error one.', 'Error two.'], exception.validation_errors)
+        self.assertEqual('Error one. \nError two.', exception.message)
+        self.assertEqual('Error one. \nError two.', str(exception))
+
+        exception = ValidationException()
+        self.assertListEqual([], exception.errors)
+        self.assertListEqual([], exception.validation_errors)
+        self.assertEqual('', str(exception))
+
+    def test_validation_exception_pickle(self):
+        """Ensure that ValidationException supports pickling."""
+        exception = ValidationException(['Error one.'])
+        the_copy = pickle.loads(pickle.dumps(exception))
+        self.assertListEqual(['Error one.'], the_copy.validation_errors)
@@ -0,0 +1,446 @@
+"""Test the compiled validation plans."""
+from datetime import date, datetime, time
+
+from test.test_utils import base_test_case
+
+from ontic import meta_type, ontic_type, validation_plan
+from ontic.frozen import freeze
+from ontic.property_schema import PropertySchema
+from ontic.schema_type import SchemaType
+
+PARITY_SCHEMA = {
+    'any_prop': {},
+    'required_prop': {'required': True},
+    'enum_prop': {'enum': {'dog', 'cat', 3}},
+    'bool_prop': {'type': 'bool'},
+    'str_prop': {'type': 'str', 'min': 2, 'max': 5, 'regex': '^[a-z]*$'},
+    'str_enum_prop': {'type': 'str', 'enum': {'red', 'blue'}},
+    'int_prop': {'type': 'int', 'min': 3, 'max': 10},
+    'float_prop': {'type': 'float', 'min': 0.5},
+    'date_prop': {'type': 'date', 'max': date(2000, 1, 1)},
+    'time_prop': {'type': 'time', 'min': time(12, 0, 0)},
+    'datetime_prop': {'type': 'datetime', 'min': datetime(2000, 1, 1)},
+    'dict_prop': {'type': 'dict', 'min': 1, 'max': 2},
+    'list_prop': {
+        'type': 'list', 'min': 1, 'max': 3, 'member_type': 'str',
+        'regex': '^[a-z]+$', 'member_min': 2, 'member_max': 4},
+    'set_prop': {
+        'type': 'set', 'enum': {1, 2, 30}, 'member_type': 'int',
+        'member_min': 2, 'member_max': 20},
+}
+
+PARITY_VALUES = [
+    None, '', 'a', 'abc', 'ABCDEFG', 'red', 'dog', 0, 1, 3, 7, 30, 0.1, 7.5,
+    True, date(1999, 1, 1), date(2001, 1, 1), time(11, 0, 0), time(13, 0, 0),
+    datetime(1999, 1, 1), datetime(2001, 1, 1), {}, {'a': 1}, {'a', 'b'},
+    {'a': 1, 'b': 2, 'c': 3}, [], ['ab'], ['ab', 'c', 'ABC', 'abcdefg'],
+    set(), {1, 2, 30}, {1, 'x'}, {2, 3, 4, 5},
+]
+
+MEMBER_SCHEMA = {
+    'enum_set': {'type': 'set', 'enum': {1, 2, 3, 'a'}},
+    'enum_list': {'type': 'list', 'enum': {1, 2, 3}, 'member_type': 'int'},
+    'int_list': {'type': 'list', 'member_type': 'int', 'member_min': 2,
+                 'member_max': 9},
+    'float_set': {'type': 'set', 'member_type': 'float', 'member_min': 0.5,
+                  'member_max': 2.5},
+    'date_list': {'type': 'list', 'member_type': 'date',
+                  'member_min': date(2000, 1, 1)},
+    'str_set': {'type': 'set', 'member_type': 'str', 'member_min': 2,
+                'member_max': 3, 'regex': '^[a-z]+$'},
+    'typed_list': {'type': 'list', 'member_type': 'str'},
+}
+
+MEMBER_VALUES = [
+    [], set(), [1, 2, 3], {1, 2, 'a'}, {1, 4, 'b', 'a'}, [1, 4, 1, 5, 'x'],
+    [2, 5, 9], [1, 10, 5, 0], [3, 4.5, 12], [2, True, False], [2, 1L],
+    {1.0, 2.0}, {0.1, float('nan'), 1.0}, {float('nan')}, {3.0, 0.4},
+    [date(2001, 1, 1), date(1999, 1, 1)], [date(2001, 1, 1)],
+    [datetime(2001, 1, 1), date(2001, 1, 1)],
+    {'ab', 'abc'}, {'a', 'abcd', 'AB', 'ab'}, {'ab', u'ab', 'c'}, {'ab', 3},
+    ['ab', ['c']], [['a'], 'b'], set(range(1000)), set(range(2, 10)) | {'z'},
+]
+
+
+class ValidationPlanTest(base_test_case.BaseTestCase):
+    """ValidationPlan test cases."""
+
+    def test_plan_parity(self):
+        """Compiled validators report the same errors as meta_type."""
+        schema = SchemaType(PARITY_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+
+        for name, property_schema in schema.iteritems():
+            validator = plan.validator_map[name]
+            for value in PARITY_VALUES:
+                try:
+                    expected_errors = meta_type.validate_value(
+                        name, property_schema, value)
+                except TypeError:
+                    # Such as an unhashable value tested against an enum.
+                    self.assertRaises(
+                        TypeError, validator.validate, value, [])
+                    continue
+                value_errors = []
+                validator.validate(value, value_errors)
+                self.assertListEqual(
+                    expected_errors, [str(error) for error in value_errors])
+                self.assertEqual(
+                    not expected_errors, validator.is_valid(value))
+
+    def test_member_parity(self):
+        """Bulk member validation reports the same errors as meta_type."""
+        schema = SchemaType(MEMBER_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+
+        for name, property_schema in schema.iteritems():
+            validator = plan.validator_map[name]
+            for value in MEMBER_VALUES:
+                try:
+                    expected_errors = meta_type.validate_value(
+                        name, property_schema, value)
+                except TypeError:
+                    self.assertRaises(
+                        TypeError, validator.validate, value, [])
+                    continue
+                value_errors = []
+                validator.validate(value, value_errors)
+                self.assertListEqual(
+                    expected_errors, [str(error) for error in value_errors],
+                    (name, value))
+                self.assertEqual(
+                    not expected_errors, validator.is_valid(value),
+                    (name, value))
+
+    def test_memo_parity(self):
+        """Memoized validators report the same errors as meta_type."""
+        schema = SchemaType(PARITY_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+        plan.configure_memo(value_capacity=8)
+
+        for name, property_schema in schema.iteritems():
+            validator = plan.validator_map[name]
+            for value in PARITY_VALUES * 2:
+                try:
+                    expected_errors = meta_type.validate_value(
+                        name, property_schema, value)
+                except TypeError:
+                    continue
+                value_errors = []
+                validator.validate(value, value_errors)
+                self.assertListEqual(
+                    expected_errors, [str(error) for error in value_errors])
+                for error in value_errors:
+                    if error.rule in ('type', 'enum', 'min', 'max', 'regex'):
+                        self.assertIs(value, error.value)
+                self.assertEqual(
+                    not expected_errors, validator.is_valid(value))
+
+    def test_value_memo(self):
+        """Repeated scalar values are memoized per property."""
+        plan = validation_plan.ValidationPlan(SchemaType(
+            prop_1={'type': 'str', 'enum': {'a', 'b'}},
+            prop_2={'type': 'list', 'max': 2},
+            prop_3={}))
+        plan.configure_memo(value_capacity=2)
+        validator = plan.validator_map['prop_1']
+
+        for value in ['a', 'c', 'a', 'c', 'a', u'a', 'd', 'c', 1]:
+            validator.is_valid(value)
+        self.assertDictEqual(
+            {'capacity': 2, 'size': 2, 'hits': 3, 'misses': 6,
+             'evictions': 4},
+            validator.memo.stats())
+        self.assertFalse(plan.is_valid({'prop_1': 'c'}))
+        self.assertEqual(4, validator.memo.hits)
+
+        # Collection values are not memoized.
+        self.assertIsNone(plan.validator_map['prop_2'].memo)
+        stats = plan.memo_stats()
+        self.assertIsNone(stats['records'])
+        self.assertIsNone(stats['values']['prop_2'])
+        self.assertEqual(2, stats['values']['prop_3']['capacity'])
+
+        plan.configure_memo()
+        self.assertIsNone(validator.memo)
+        self.assertDictEqual(
+            {'records': None,
+             'values': {'prop_1': None, 'prop_2': None, 'prop_3': None}},
+            plan.memo_stats())
+        self.assertFalse(plan.is_valid({'prop_1': 'c'}))
+        self.assertRaisesRegexp(
+            ValueError, '"capacity" must be a non-negative int or None.',
+            plan.configure_memo, -1)
+
+    def test_record_memo(self):
+        """Duplicate records are validated once."""
+        schema = SchemaType(PARITY_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+        expected_plan = validation_plan.ValidationPlan(schema)
+        plan.configure_memo(record_capacity=10)
+        rows = [
+            {'required_prop': 1, 'int_prop': 5, 'str_prop': 'abc'},
+            {'int_prop': 1, 'set_prop': frozenset([1, 3])},
+            {'required_prop': 1, 'int_prop': 5, 'str_prop': 'abc'},
+            {'int_prop': 1, 'set_prop': frozenset([1, 3])},
+            {'int_prop': 1L, 'set_prop': frozenset([1, 3])},
+            {'int_prop': 1, 'list_prop': ['ab', 'c', 'ABC']},
+        ]
+
+        for row in rows:
+            self.assertListEqual(
+                expected_plan.validate(row), plan.validate(row))
+            self.assertEqual(expected_plan.is_valid(row), plan.is_valid(row))
+        self.assertDictEqual(
+            {'capacity': 10, 'size': 3, 'hits': 7, 'misses': 3,
+             'evictions': 0},
+            plan.memo_stats()['records'])
+
+        self.assertDictEqual(
+            expected_plan.validate_batch(rows), plan.validate_batch(rows))
+        self.assertEqual(
+            expected_plan.check_batch(rows), plan.check_batch(rows))
+
+        # The memoized errors are not modified through the returned lists.
+        plan.validate(rows[1]).append('not an error')
+        self.assertEqual(
+            len(expected_plan.validate(rows[1])),
+            len(plan.validate(rows[1])))
+
+    def test_plan_order(self):
+        """Plan validators follow the schema iteration order."""
+        schema = SchemaType(PARITY_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+
+        self.assertListEqual(
+            schema.keys(), [validator.name for validator in plan.validators])
+        for validator in plan.validators:
+            self.assertIs(schema[validator.name], validator.property_schema)
+
+    def test_plan_validate(self):
+        """Validate mappings with a compiled plan."""
+        plan = validation_plan.ValidationPlan(SchemaType(
+            prop_1={'type': 'int', 'required': True},
+            prop_2={'type': 'str', 'enum': {'a', 'b'}}))
+
+        self.assertListEqual([], plan.validate({'prop_1': 1}))
+        value_errors = plan.validate({'prop_2': 'a'})
+        self.assertEqual(1, len(value_errors))
+        self.assertEqual('prop_1', value_errors[0].path)
+        self.assertEqual('required', value_errors[0].rule)
+        self.assertEqual(
+            'The value for "prop_1" is required.', str(value_errors[0]))
+
+        self.assertTrue(plan.is_valid({'prop_1': 1, 'prop_2': 'b'}))
+        self.assertFalse(plan.is_valid({'prop_2': 'a'}))
+        self.assertFalse(plan.is_valid({'prop_1': 1, 'prop_2': 'c'}))
+
+    def test_plan_batch(self):
+        """Validate a batch of mappings column by column."""
+        schema = SchemaType(PARITY_SCHEMA)
+        plan = validation_plan.ValidationPlan(schema)
+        rows = [
+            {'required_prop': 1, 'int_prop': 5, 'str_prop': 'abc'},
+            {'int_prop': 1, 'list_prop': ['ab', 'c', 'ABC']},
+            {'required_prop': 1},
+            {'required_prop': 1, 'set_prop': {1, 30}, 'bool_prop': 'no'},
+        ] * 3
+
+        row_errors = plan.validate_batch(iter(rows))
+        self.assertItemsEqual([1, 3, 5, 7, 9, 11], row_errors.keys())
+        for index, row in enumerate(rows):
+            self.assertListEqual(
+                [str(error) for error in plan.validate(row)],
+                [str(error) for error in row_errors.get(index, [])])
+
+        bitmap = plan.check_batch(rows)
+        self.assertEqual(2, len(bitmap))
+        self.assertListEqual(
+            sorted(row_errors.keys()), validation_plan.bitmap_indexes(bitmap))
+
+        self.assertDictEqual({}, plan.validate_batch([]))
+        self.assertEqual(bytearray(), plan.check_batch([]))
+
+    def test_compile_value_validator(self):
+        """Compile a validator for a single property schema."""
+        validate = validation_plan.compile_value_validator(
+            'some_prop', PropertySchema(type='int', required=True))
+
+        value_errors = []
+        validate(5, value_errors)
+        self.assertListEqual([], value_errors)
+        validate(None, value_errors)
+        validate('5', value_errors)
+        self.assertListEqual(
+            ['The value for "some_prop" is required.',
+             'The value for "some_prop" is not of type "<type \'int\'>": 5'],
+            [str(error) for error in value_errors])
+
+    def test_compile_value_check(self):
+        """Compile a fail-fast check for a single property schema."""
+        is_valid = validation_plan.compile_value_check(
+            PropertySchema(type='list', member_type='int', member_max=3))
+
+        self.assertTrue(is_valid(None))
+        self.assertTrue(is_valid([1, 2, 3]))
+        self.assertFalse(is_valid([1, 2, 4]))
+        self.assertFalse(is_valid([1, 'two']))
+        self.assertFalse(is_valid((1, 2)))
+
+    def test_meta_schema_plan(self):
+        """The meta-schema of PropertySchema compiles to a plan."""
+        plan = validation_plan.get_validation_plan(PropertySchema)
+        property_schema = PropertySchema(type='str', min=1)
+
+        self.assertListEqual([], plan.validate(property_schema))
+        self.assertTrue(plan.is_valid(property_schema))
+        property_schema.required = 'yes'
+        self.assertEqual(1, len(plan.validate(property_schema)))
+        self.assertFalse(plan.is_valid(property_schema))
+
+    def test_plan_caching(self):
+        """Plans are cached on the OnticType class."""
+        my_type = ontic_type.create_ontic_type(
+            'PlanCache', {'prop': {'type': 'int'}})
+
+        plan = my_type.get_validation_plan()
+        self.assertIs(my_type.get_schema(), plan.schema)
+        self.assertIs(plan, my_type.get_validation_plan())
+        self.assertIs(plan, my_type(prop=1).get_validation_plan())
+
+        # A sub class compiles its own plan.
+        class SubType(my_type):
+            pass
+
+        self.assertIsNot(plan, SubType.get_validation_plan())
+
+        # A new schema is compiled into a new plan.
+        my_type.ONTIC_SCHEMA = SchemaType(prop={'type': 'str'})
+        new_plan = my_type.get_validation_plan()
+        self.assertIsNot(plan, new_plan)
+        self.assertIs(my_type.get_schema(), new_plan.schema)
+
+    def test_memo_class_capacity(self):
+        """Plans are compiled with the memo capacities of the class."""
+        my_type = ontic_type.create_ontic_type(
+            'PlanMemo', {'prop': {'type': 'int', 'max': 3}})
+        self.assertIsNone(my_type.get_validation_plan().record_memo)
+
+        my_type.VALUE_MEMO_CAPACITY = 100
+        my_type.RECORD_MEMO_CAPACITY = 10
+        my_type.clear_validation_plan()
+        plan = my_type.get_validation_plan()
+        self.assertEqual(10, plan.record_memo.capacity)
+        self.assertEqual(100, plan.validator_map['prop'].memo.capacity)
+
+        objects = [my_type(prop=index % 5) for index in xrange(20)]
+        self.assertItemsEqual(
+            [4, 9, 14, 19],
+            [index for index, an_object in enumerate(objects)
+             if an_object.validate(raise_validation_exception=False)])
+        self.assertEqual(15, plan.record_memo.hits)
+        self.assertEqual(5, plan.record_memo.misses)
+        self.assertItemsEqual(
+            [4, 9, 14, 19], my_type.validate_batch(objects).keys())
+        self.assertEqual(35, plan.record_memo.hits)
+
+        # Without the record memo, the values are memoized.
+        my_type.RECORD_MEMO_CAPACITY = None
+        my_type.clear_validation_plan()
+        plan = my_type.get_validation_plan()
+        objects = [my_type(prop=index % 5) for index in xrange(20)]
+        for an_object in objects:
+            an_object.validate(raise_validation_exception=False)
+        self.assertEqual(15, plan.validator_map['prop'].memo.hits)
+
+    def test_record_memo_member_types(self):
+        """Records of equal collections of distinct member types are not
+        memoized as one."""
+        my_type = ontic_type.create_ontic_type('PlanMemberMemo', {
+            'tags': {'type': 'list', 'member_type': 'int'},
+            'n': {'type': 'int'},
+        })
+        my_type.RECORD_MEMO_CAPACITY = 10
+        self.assertListEqual(
+            [], my_type(tags=freeze([1]), n=1).validate(False))
+        self.assertListEqual(
+            ['The value "1.0" for "tags" is not of type "<type \'int\'>".'],
+            my_type(tags=freeze([1.0]), n=1).validate(False))
+        self.assertListEqual(
+            [], my_type(tags=freeze([1]), n=1).validate(False))
+        plan = my_type.get_validation_plan()
+        self.assertEqual(1, plan.record_memo.hits)
+        self.assertEqual(2, plan.record_memo.misses)
+        row_errors = plan.validate_batch([{'tags': freeze([1]), 'n': 1},
+                                          {'tags': freeze([1.0]), 'n': 1}])
+        self.assertListEqual([1], row_errors.keys())
+        self.assertListEqual([('tags', 'member_type', 1.0)], [
+            (error.path, error.rule, error.value) for error in row_errors[1]])
+
+    def test_record_memo_validate_object(self):
+        """Full validation of objects is memoized by record."""
+        my_type = ontic_type.create_ontic_type('PlanRecordMemo', {
+            'prop': {'type': 'int', 'max': 3},
+            'tags': {'type': 'list', 'default': ['a']},
+            'name': {'type': 'str', 'required': True},
+        })
+        my_type.RECORD_MEMO_CAPACITY = 10
+        records = [{'prop': index % 5, 'name': 'a'} for index in xrange(20)]
+        expected = [ontic_type.create_ontic_type(
+            'PlanNoRecordMemo', my_type.get_schema())(record).validate(False)
+            for record in records]
+        plan = my_type.get_validation_plan()
+
+        objects = [my_type(record) for record in records]
+        self.assertListEqual(expected, [
+            ontic_type.validate_object(an_object, False)
+            for an_object in objects])
+        self.assertEqual(15, plan.record_memo.hits)
+
+        # An unchanged object is not validated again, and a modified object
+        # validates its modified properties.
+        self.assertListEqual([], objects[0].validate())
+        objects[0].name = None
+        self.assertListEqual(
+            ['The value for "name" is required.'], objects[0].validate(False))
+        self.assertEqual(15, plan.record_memo.hits)
+
+        # The tags are mutable, and the record is not memoized.
+        objects = [my_type(record) for record in records]
+        self.assertListEqual(expected, [
+            ontic_type.perfect_and_validate(an_object, False)
+            for an_object in objects])
+        self.assertEqual(15, plan.record_memo.hits)
+        objects[0].tags.append(1)
+        self.assertListEqual([], objects[0].validate())
+
+        flat_type = ontic_type.create_ontic_type('PlanFlatRecordMemo', {
+            'prop': {'type': 'int', 'max': 3},
+            'tag': {'type': 'str', 'default': 'a'},
+            'name': {'type': 'str', 'required': True},
+        })
+        flat_type.RECORD_MEMO_CAPACITY = 10
+        plan = flat_type.get_validation_plan()
+        objects = [flat_type(record) for record in records]
+        self.assertListEqual(expected, [
+            ontic_type.perfect_and_validate(an_object, False)
+            for an_object in objects])
+        self.assertEqual(15, plan.record_memo.hits)
+        self.assertEqual('a', objects[0].tag)
+
+    def test_clear_validation_plan(self):
+        """Plans are recompiled after an in place schema modification."""
+        my_type = ontic_type.create_ontic_type(
+            'PlanClear', {'prop': {'type': 'int'}})
+        ontic_object = my_type(prop=1)
+        ontic_object.validate()
+
+        my_type.get_schema().prop = PropertySchema(type='str')
+        my_type.clear_validation_plan()
+        self.assertListEqual(
+            ['The value for "prop" is not of type "<type \'str\'>": 1'],
+            ontic_object.validate(raise_validation_exception=False))
+
+        # Clearing a class without a plan is a no-op.
+        my_type.clear_validation_plan()
+        my_type.clear_validation_plan()
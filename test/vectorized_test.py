@@ -0,0 +1,109 @@
+"""Test the vectorized validation of property columns."""
+from datetime import date, datetime, time
+import unittest
+
+from test.test_utils import base_test_case
+
+from ontic import ontic_type, validation_plan, vectorized
+from ontic.property_schema import PropertySchema
+
+COLUMN_CASES = [
+    ({'type': 'int', 'min': 3, 'max': 10},
+     [3, 1, None, 11, 5, True, 10 ** 30]),
+    ({'type': 'int', 'required': True, 'enum': {1, 2, 3}},
+     [1, None, 4, 2, 3]),
+    ({'type': 'int', 'min': 3}, [4, 'five', 2]),
+    ({'type': 'float', 'min': 0.5, 'max': 2.5, 'enum': {1.0, 2.0, 'a'}},
+     [1.0, 0.1, 2.0, None, 3.0, 1.5]),
+    ({'type': 'float', 'min': 0.5}, [1.0, 1]),
+    ({'type': 'long', 'max': 10 ** 20}, [long(5), 10 ** 30, None]),
+    ({'type': 'str', 'min': 2, 'max': 4, 'enum': {'ab', 'abc', 'abcdef'}},
+     ['ab', 'a', None, 'abcdef', 'abc', 'xyz']),
+    ({'type': 'str', 'regex': '^a'}, ['ab', 'ba']),
+    ({'type': 'str', 'required': True}, []),
+    ({'type': 'date', 'min': date(2000, 1, 1), 'max': date(2010, 1, 1)},
+     [date(1999, 1, 1), date(2005, 1, 1), None, date(2011, 1, 1)]),
+    ({'type': 'datetime', 'min': datetime(2000, 1, 1, 12)},
+     [datetime(2000, 1, 1, 11), datetime(2000, 1, 1, 13)]),
+    ({'type': 'time', 'min': time(12)}, [time(11), time(13)]),
+    ({'type': 'list', 'max': 1}, [[1], [1, 2]]),
+    ({'enum': {1, 'a'}}, [1, 'a', 'b']),
+]
+
+
+class VectorizedTest(base_test_case.BaseTestCase):
+    """Vectorized column validation test cases."""
+
+    def assert_column_parity(self, use_numpy):
+        for schema_def, column in COLUMN_CASES:
+            property_schema = PropertySchema(schema_def)
+            is_valid = validation_plan.compile_value_check(property_schema)
+            mask, failed_rows = vectorized.check_column(
+                property_schema, column, use_numpy=use_numpy)
+
+            expected_rows = [
+                index for index, value in enumerate(column)
+                if not is_valid(value)]
+            self.assertListEqual(expected_rows, failed_rows, schema_def)
+            self.assertListEqual(
+                [index in expected_rows for index in range(len(column))],
+                [bool(failed) for failed in mask])
+
+    def test_python_column_check(self):
+        """The pure Python column checks match the compiled checks."""
+        self.assert_column_parity(False)
+
+    @unittest.skipUnless(vectorized.NUMPY_AVAILABLE, 'NumPy not installed.')
+    def test_numpy_column_check(self):
+        """The NumPy column checks match the compiled checks."""
+        self.assert_column_parity(True)
+
+    def test_default_column_check(self):
+        """NumPy is utilized where available."""
+        mask, failed_rows = vectorized.check_column(
+            PropertySchema(type='int', max=3), [1, 5])
+        self.assertListEqual([1], failed_rows)
+        if vectorized.NUMPY_AVAILABLE:
+            self.assertIsInstance(mask, vectorized.numpy.ndarray)
+        else:
+            self.assertListEqual([False, True], mask)
+            self.assertRaisesRegexp(
+                ValueError,
+                'NumPy is required for vectorized validation.',
+                vectorized.check_column,
+                PropertySchema(type='int'), [1], use_numpy=True)
+
+    def test_check_batch(self):
+        """Test a batch of objects and dicts against a schema."""
+        my_type = ontic_type.create_ontic_type('VectorBatch', {
+            'prop_a': {'type': 'int', 'required': True, 'min': 1},
+            'prop_b': {'type': 'str', 'max': 3},
+            'prop_c': {'type': 'set', 'member_type': 'int'},
+        })
+        rows = [
+            my_type(prop_a=1, prop_b='abc'),
+            my_type(prop_a=0),
+            {'prop_a': 2, 'prop_b': 'abcd'},
+            {'prop_a': 2, 'prop_c': {1, 'two'}},
+            {'prop_b': 'a'},
+            {'prop_a': 5, 'prop_c': {1, 2}},
+        ]
+        expected_rows = validation_plan.bitmap_indexes(
+            my_type.validate_batch(rows, mode='fast'))
+
+        for use_numpy in {False, vectorized.NUMPY_AVAILABLE}:
+            mask, failed_rows = vectorized.check_batch(
+                my_type, iter(rows), use_numpy=use_numpy)
+            self.assertListEqual([1, 2, 3, 4], failed_rows)
+            self.assertListEqual(expected_rows, failed_rows)
+            self.assertListEqual(
+                [False, True, True, True, True, False],
+                [bool(failed) for failed in mask])
+
+    def test_extract_column(self):
+        """Extract a property column from objects and dicts."""
+        my_type = ontic_type.create_ontic_type('VectorColumn', {'prop': {}})
+        self.assertListEqual(
+            [1, None, 3],
+            vectorized.extract_column(
+                [my_type(prop=1), my_type(), {'prop': 3}], 'prop'))